@@ -24,17 +24,33 @@ For each file captures:
 - repo name
 - repo category (Monorepo, Rust Component, TypeScript Component, Other)
 - primary language(s)
-- last-modified timestamp (git log -1 --format=%ct FILE)
+- last-modified timestamp (last commit touching the file, from one
+  git log --name-only pass per repository; mtime for untracked files)
 
-Outputs to: .scripts/cache/docs_index.json
+Outputs to:
+- .scripts/cache/docs_index.jsonl      one file per line, written during the crawl
+- .scripts/cache/docs_index.idx.json   repo name -> byte ranges in the .jsonl
+- .scripts/cache/docs_index.json       merged, sorted inventory (original shape)
+
+Look up one repository without parsing the whole inventory:
+  python3 .scripts/inventory_docs.py --lookup REPO_NAME
+
+Runs are incremental: the index also keeps each repository's HEAD commit and
+working-tree fingerprint, and repositories where neither moved are not
+crawled again; their previous entries are carried over (--full rescans all).
 """
 
 import os
 import json
+import stat
+import queue
+import hashlib
+import argparse
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
 # Base path to scan
@@ -55,22 +71,91 @@ DOCS_PATTERNS = {
     "docs/*.md"
 }
 
-def get_git_last_modified(file_path: str) -> Optional[int]:
+# Dependency, build and vendored trees that are never descended into
+PRUNED_DIRS = {
+    ".git",
+    "node_modules",
+    "target",
+    "vendor",
+    "third_party",
+    ".venv",
+    "venv",
+    "__pycache__",
+    "dist",
+    "build",
+    ".next",
+    ".cargo"
+}
+
+# Threads crawling repositories (I/O and git bound)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Output files
+OUTPUT_DIR = ".scripts/cache"
+JSONL_NAME = "docs_index.jsonl"
+INDEX_NAME = "docs_index.idx.json"
+MERGED_NAME = "docs_index.json"
+INDEX_VERSION = 2
+
+def collect_git_timestamps(repo_root: str) -> Optional[Dict[str, int]]:
     """
-    Get the last modified timestamp using git log -1 --format=%ct FILE
-    Returns Unix timestamp or None if git command fails
+    Map every Markdown path in a repository's history (relative to the repo
+    root) to the time of the last commit that touched it, using one git log
+    pass limited to *.md and read as it streams
+    Returns None if repo_root is not a git repository or git fails
     """
     try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct", file_path],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(file_path)
+        process = subprocess.Popen(
+            ["git", "log", "-z", "--name-only", "--format=%x01%ct", "--", "*.md"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=repo_root
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return int(result.stdout.strip())
-    except (subprocess.SubprocessError, ValueError):
-        pass
+    except (subprocess.SubprocessError, OSError):
+        return None
+    
+    # Output: "\x01<time>\0" per commit, then "\n" and its NUL-terminated paths
+    timestamps = {}
+    commit_time = None
+    
+    def consume(token: bytes) -> None:
+        nonlocal commit_time
+        token = token.lstrip(b"\n")
+        if token.startswith(b"\x01"):
+            try:
+                commit_time = int(token[1:])
+            except ValueError:
+                commit_time = None
+        elif token and commit_time is not None:
+            # Newest commits come first, so the first time seen is the last change
+            timestamps.setdefault(os.fsdecode(token), commit_time)
+    
+    with process:
+        pending = b""
+        for chunk in iter(lambda: process.stdout.read(1 << 16), b""):
+            tokens = (pending + chunk).split(b"\0")
+            pending = tokens.pop()
+            for token in tokens:
+                consume(token)
+        consume(pending)
+    if process.returncode != 0:
+        return None
+    return timestamps
+
+def get_git_last_modified(file_path: str, repo_root: str,
+                          git_timestamps: Dict[str, Optional[Dict[str, int]]]) -> Optional[int]:
+    """
+    Get the last commit time of a file from its repository's timestamp map,
+    collected once per repository into git_timestamps
+    Untracked files (and files outside git) fall back to the modification time
+    """
+    if repo_root not in git_timestamps:
+        git_timestamps[repo_root] = collect_git_timestamps(repo_root)
+    timestamps = git_timestamps[repo_root]
+    if timestamps:
+        relative_path = os.path.relpath(file_path, repo_root).replace(os.sep, "/")
+        if relative_path in timestamps:
+            return timestamps[relative_path]
     
     # Fallback to file system modification time
     try:
@@ -98,6 +183,8 @@ def determine_repo_category(repo_path: str) -> str:
 def detect_primary_languages(repo_path: str) -> List[str]:
     """
     Detect primary programming languages in a repository
+    The repo root is listed once with os.scandir and every indicator is
+    matched against that listing
     """
     languages = []
     
@@ -113,44 +200,73 @@ def detect_primary_languages(repo_path: str) -> List[str]:
         "C": ["Makefile", "*.c", "*.h"]
     }
     
+    names = set()  # every entry of the repo root
+    file_names = []  # regular files (following symlinks, like os.path.isfile)
+    with os.scandir(repo_path) as entries:
+        for entry in entries:
+            names.add(entry.name)
+            try:
+                if entry.is_file():
+                    file_names.append(entry.name)
+            except OSError:
+                continue
+    
     for lang, indicators in language_indicators.items():
         for indicator in indicators:
             if "*" in indicator:
                 # Handle glob patterns
                 pattern = indicator.replace("*", "")
-                if any(f.endswith(pattern) for f in os.listdir(repo_path) if os.path.isfile(os.path.join(repo_path, f))):
+                if any(f.endswith(pattern) for f in file_names):
+                    languages.append(lang)
+                    break
+            elif "/" in indicator:
+                # Nested paths are only checked when their top directory exists
+                if indicator.split("/", 1)[0] in names and os.path.exists(os.path.join(repo_path, indicator)):
                     languages.append(lang)
                     break
             else:
                 # Handle exact file matches
-                if os.path.exists(os.path.join(repo_path, indicator)):
+                if indicator in names:
                     languages.append(lang)
                     break
     
     # If no languages detected, try to infer from directory structure
     if not languages:
-        try:
-            files = os.listdir(repo_path)
-            if any(f.endswith('.md') for f in files):
-                languages.append("Markdown")
-        except OSError:
-            pass
+        if any(f.endswith('.md') for f in names):
+            languages.append("Markdown")
     
     return languages if languages else ["Unknown"]
 
-def find_repository_root(file_path: str) -> str:
+def find_repository_root(file_path: str, root_cache: Optional[Dict[str, str]] = None) -> str:
     """
     Find the repository root by looking for .git directory
+    root_cache maps directories already visited to their repository root, so
+    files in the same tree stop at the first known directory
     """
+    if root_cache is None:
+        root_cache = {}
     current_path = os.path.dirname(file_path)
+    visited = []
+    repo_root = None
     
     while current_path != "/":
+        if current_path in root_cache:
+            repo_root = root_cache[current_path]
+            break
+        visited.append(current_path)
         if os.path.exists(os.path.join(current_path, ".git")):
-            return current_path
+            repo_root = current_path
+            break
         current_path = os.path.dirname(current_path)
     
     # If no .git found, assume the immediate parent of the file is repo root
-    return os.path.dirname(file_path)
+    if repo_root is None:
+        # Not cached: the fallback depends on the file's own directory
+        return os.path.dirname(file_path)
+    
+    for directory in visited:
+        root_cache[directory] = repo_root
+    return repo_root
 
 def get_repo_name(repo_root: str) -> str:
     """
@@ -158,86 +274,377 @@ def get_repo_name(repo_root: str) -> str:
     """
     return os.path.basename(repo_root)
 
-def scan_for_docs(base_path: str) -> List[Dict]:
+def get_repo_facts(repo_root: str, repo_cache: Dict[str, Dict]) -> Dict:
+    """
+    Repository-level metadata, computed once per repository root and shared by
+    every file under it
+    """
+    if repo_root not in repo_cache:
+        repo_cache[repo_root] = {
+            "repo_name": get_repo_name(repo_root),
+            "repo_category": determine_repo_category(repo_root),
+            "primary_languages": detect_primary_languages(repo_root)
+        }
+    return repo_cache[repo_root]
+
+def run_git(repo_path: str, *args: str) -> Optional[bytes]:
+    """
+    Output of a git command in repo_path, or None if it fails
+    """
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, cwd=repo_path)
+    except (subprocess.SubprocessError, OSError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+def hash_untracked_tree(directory: str, pruned: Set[str], digest) -> None:
+    """
+    Feed the mtime of every directory and the size and mtime of every
+    Markdown file below an untracked or ignored directory into digest
+    git status reports such a directory as one entry, and its own mtime
+    does not move when files change further down. Pruned directories and
+    nested repositories (fingerprinted on their own) are not entered.
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+            digest.update(f"{current}\0{os.stat(current).st_mtime_ns}\0".encode("utf-8", "surrogateescape"))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in pruned and not os.path.exists(os.path.join(entry.path, ".git")):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    stat_info = entry.stat(follow_symlinks=False)
+                    digest.update(f"{entry.path}\0{stat_info.st_mtime_ns}:{stat_info.st_size}\0"
+                                  .encode("utf-8", "surrogateescape"))
+            except OSError:
+                continue
+
+def repository_state(repo_path: str, pruned: Set[str] = PRUNED_DIRS) -> Optional[str]:
+    """
+    Fingerprint of a repository's HEAD commit and working-tree state: the
+    status of tracked files, size and mtime of untracked and ignored ones
+    (the crawl does not honour .gitignore), every Markdown file below
+    untracked and ignored directories that are not pruned, and the root
+    listing that language detection reads
+    Returns None when git cannot describe the repository.
+    """
+    status = run_git(repo_path, "status", "--porcelain", "-z", "--untracked-files=all", "--ignored=matching")
+    if status is None:
+        return None
+    digest = hashlib.sha1()
+    digest.update(run_git(repo_path, "rev-parse", "HEAD") or b"(no commits)")
+    digest.update(status)
+    
+    tokens = status.split(b"\0")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token[:2] in (b"??", b"!!"):
+            path = os.path.join(repo_path, os.fsdecode(token[3:]))
+            try:
+                stat_info = os.lstat(path)
+                digest.update(f"{stat_info.st_mtime_ns}:{stat_info.st_size}".encode())
+            except OSError:
+                stat_info = None
+            if (stat_info is not None and stat.S_ISDIR(stat_info.st_mode)
+                    and os.path.basename(path.rstrip(os.sep)) not in pruned
+                    and not os.path.exists(os.path.join(path, ".git"))):
+                hash_untracked_tree(path, pruned, digest)
+        elif token[:1] in (b"R", b"C"):
+            i += 1  # renames and copies are followed by their source path
+        i += 1
+    
+    try:
+        with os.scandir(repo_path) as entries:
+            digest.update("\0".join(sorted(entry.name for entry in entries)).encode("utf-8", "surrogateescape"))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def repository_unchanged(repo_path: str, previous_unit: Optional[Dict],
+                         pruned: Set[str] = PRUNED_DIRS) -> Tuple[bool, Optional[str]]:
+    """
+    Whether a repository and the nested repositories its previous crawl found
+    (their commits do not show in the outer status) are in the recorded state
+    Returns the result and the repository's current state.
+    """
+    state = repository_state(repo_path, pruned)
+    if state is None or not previous_unit or previous_unit.get("state") != state:
+        return False, state
+    for root, nested_state in previous_unit.get("nested", {}).items():
+        if nested_state is None or repository_state(root, pruned) != nested_state:
+            return False, state
+    return True, state
+
+def describe_doc(file_path: str, file_name: str, caches: Dict[str, Dict]) -> Dict:
+    """
+    Metadata for one documentation file; caches holds the per-repository
+    memos shared by the whole scan
+    """
+    repo_root = find_repository_root(file_path, caches["roots"])
+    repo_facts = get_repo_facts(repo_root, caches["repos"])
+    last_modified = get_git_last_modified(file_path, repo_root, caches["git"])
+    
+    return {
+        "absolute_path": file_path,
+        "repository_root": repo_root,
+        "repo_name": repo_facts["repo_name"],
+        "repo_category": repo_facts["repo_category"],
+        "primary_languages": list(repo_facts["primary_languages"]),
+        "last_modified_timestamp": last_modified,
+        "last_modified_date": datetime.fromtimestamp(last_modified).isoformat() if last_modified else None,
+        "filename": file_name,
+        "relative_path": os.path.relpath(file_path, repo_root)
+    }
+
+def crawl(directory: str, in_docs: bool, pruned: Set[str], caches: Dict[str, Dict],
+          handoff: Optional[Callable[[str, bool], None]] = None,
+          nested: Optional[Callable[[str], None]] = None) -> Iterator[Dict]:
+    """
+    Depth-first os.scandir crawl yielding documentation files as they are found
+    Directories named in pruned are never entered. With handoff, each
+    repository below directory (a directory holding .git) is passed to it
+    instead of being crawled here; otherwise nested is called with each such
+    repository before it is crawled. Symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(directory) as iterator:
+            entries = list(iterator)
+    except OSError as e:
+        print(f"Error scanning {directory}: {e}", file=sys.stderr)
+        return
+    
+    subdirectories = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            if entry.name not in pruned and not entry.is_symlink():
+                subdirectories.append(entry)
+            continue
+        
+        # Check exact filename matches, then docs directory patterns
+        if entry.name in TARGET_FILES or (in_docs and entry.name.endswith(".md")):
+            try:
+                yield describe_doc(entry.path, entry.name, caches)
+            except Exception as e:
+                print(f"Error processing {entry.path}: {e}", file=sys.stderr)
+    
+    for entry in subdirectories:
+        child_in_docs = in_docs or entry.name == "docs"
+        if (handoff is not None or nested is not None) and os.path.exists(os.path.join(entry.path, ".git")):
+            if handoff is not None:
+                handoff(entry.path, child_in_docs)
+                continue
+            nested(entry.path)
+        yield from crawl(entry.path, child_in_docs, pruned, caches, handoff, nested)
+
+def scan_for_docs(base_path: str, jobs: int = DEFAULT_JOBS, pruned: Set[str] = PRUNED_DIRS,
+                  verbose: bool = True, repo_filter: Optional[Callable[[str], bool]] = None,
+                  on_nested: Optional[Callable[[str, str], None]] = None) -> Iterator[Dict]:
     """
     Recursively scan for documentation files and collect metadata
+    Repositories are crawled on a pool of jobs threads while the directories
+    above them are walked here; results are yielded as soon as they are found,
+    in no particular order. repo_filter, called on the worker thread, can skip
+    a repository by returning False; on_nested is called there with the
+    repository and each repository nested in it, docs or not.
     """
-    docs_inventory = []
+    caches = {
+        "git": {},  # repo root -> path -> last commit time (None outside git)
+        "roots": {},  # directory -> repository root
+        "repos": {}  # repository root -> name, category and languages
+    }
+    pruned = set(pruned) | {".git"}
+    found = queue.Queue()
+    done = object()
+    
+    def crawl_repository(repo_path: str, in_docs: bool) -> None:
+        try:
+            if repo_filter is not None and not repo_filter(repo_path):
+                return
+            nested = (lambda root: on_nested(repo_path, root)) if on_nested is not None else None
+            for doc_info in crawl(repo_path, in_docs, pruned, caches, nested=nested):
+                found.put(doc_info)
+        except BaseException as error:
+            # Re-raised by the consumer: a failed repository must not silently drop out
+            found.put(error)
+        finally:
+            found.put(done)
+    
+    def emit(doc_info: Dict) -> Dict:
+        if verbose:
+            print(f"Found: {doc_info['absolute_path']}")
+        return doc_info
     
-    for root, dirs, files in os.walk(base_path):
-        # Skip .git directories
-        dirs[:] = [d for d in dirs if d != '.git']
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        pending = 0
         
-        for file in files:
-            file_path = os.path.join(root, file)
-            
-            # Check if file matches our target patterns
-            should_include = False
-            
-            # Check exact filename matches
-            if file in TARGET_FILES:
-                should_include = True
-            
-            # Check docs directory patterns
-            if "docs" in root.split(os.sep):
-                if file == "README.md" or file.endswith(".md"):
-                    should_include = True
+        def handoff(repo_path: str, in_docs: bool) -> None:
+            nonlocal pending
+            pending += 1
+            pool.submit(crawl_repository, repo_path, in_docs)
+        
+        def receive(item) -> Iterator[Dict]:
+            nonlocal pending
+            if item is done:
+                pending -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield emit(item)
+        
+        try:
+            base_in_docs = "docs" in base_path.split(os.sep)
+            if os.path.exists(os.path.join(base_path, ".git")):
+                handoff(base_path, base_in_docs)
+            else:
+                for doc_info in crawl(base_path, base_in_docs, pruned, caches, handoff):
+                    yield emit(doc_info)
+                    # Pass on what the repository crawls found meanwhile
+                    while not found.empty():
+                        yield from receive(found.get())
             
-            if should_include:
-                try:
-                    repo_root = find_repository_root(file_path)
-                    repo_name = get_repo_name(repo_root)
-                    repo_category = determine_repo_category(repo_root)
-                    primary_languages = detect_primary_languages(repo_root)
-                    last_modified = get_git_last_modified(file_path)
-                    
-                    doc_info = {
-                        "absolute_path": file_path,
-                        "repository_root": repo_root,
-                        "repo_name": repo_name,
-                        "repo_category": repo_category,
-                        "primary_languages": primary_languages,
-                        "last_modified_timestamp": last_modified,
-                        "last_modified_date": datetime.fromtimestamp(last_modified).isoformat() if last_modified else None,
-                        "filename": file,
-                        "relative_path": os.path.relpath(file_path, repo_root)
-                    }
-                    
-                    docs_inventory.append(doc_info)
-                    print(f"Found: {file_path}")
-                    
-                except Exception as e:
-                    print(f"Error processing {file_path}: {e}", file=sys.stderr)
-                    continue
-    
-    return docs_inventory
+            while pending:
+                yield from receive(found.get())
+        except BaseException:
+            # Do not start crawls that are still queued
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
-def main():
+class InventoryWriter:
     """
-    Main function to run the documentation inventory
+    Streams documentation entries to a JSON Lines file as they are found and
+    records the byte ranges of their lines per repository name and per crawled
+    repository (unit)
+    Both files are written under temporary names and renamed on close.
     """
-    print(f"Starting documentation inventory scan of: {BASE_PATH}")
-    print(f"Target files: {', '.join(TARGET_FILES)}")
-    print(f"Target docs patterns: docs/README.md, docs/*.md")
-    print("-" * 60)
     
-    if not os.path.exists(BASE_PATH):
-        print(f"ERROR: Base path does not exist: {BASE_PATH}")
-        sys.exit(1)
+    def __init__(self, output_dir: str = OUTPUT_DIR):
+        os.makedirs(output_dir, exist_ok=True)
+        self.jsonl_path = os.path.join(output_dir, JSONL_NAME)
+        self.index_path = os.path.join(output_dir, INDEX_NAME)
+        self.file = open(self.jsonl_path + ".tmp", "wb")
+        self.offset = 0
+        self.repos = {}  # repo name -> [[offset, length], ...], adjacent lines coalesced
+        self.unit_spans = {}  # crawled repository path -> [[offset, length], ...]
+        self.count = 0
+    
+    def _extend(self, spans: List[List[int]], length: int) -> None:
+        if spans and spans[-1][0] + spans[-1][1] == self.offset:
+            spans[-1][1] += length
+        else:
+            spans.append([self.offset, length])
+    
+    def add(self, doc_info: Dict, unit: Optional[str] = None) -> None:
+        line = (json.dumps(doc_info, ensure_ascii=False) + "\n").encode("utf-8")
+        self.file.write(line)
+        self._extend(self.repos.setdefault(doc_info["repo_name"], []), len(line))
+        if unit is not None:
+            self._extend(self.unit_spans.setdefault(unit, []), len(line))
+        self.offset += len(line)
+        self.count += 1
     
-    # Scan for documentation files
-    docs_inventory = scan_for_docs(BASE_PATH)
+    def abort(self) -> None:
+        """Drop the partial output, leaving the previous inventory in place"""
+        self.file.close()
+        os.unlink(self.jsonl_path + ".tmp")
     
-    # Sort by repository name and then by filename for consistent output
-    docs_inventory.sort(key=lambda x: (x["repo_name"], x["filename"]))
+    def close(self, base_path: str, pruned: Set[str] = PRUNED_DIRS, units: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Finish both files; units maps each crawled repository to its state
+        and the states of the nested repositories found in it
+        """
+        self.file.close()
+        os.replace(self.jsonl_path + ".tmp", self.jsonl_path)
+        index = {
+            "version": INDEX_VERSION,
+            "jsonl": JSONL_NAME,
+            "base_path": base_path,
+            "scan_timestamp": datetime.now().isoformat(),
+            "total_files": self.count,
+            "pruned": sorted(pruned),
+            "repos": self.repos,
+            "units": {unit: dict(state, spans=self.unit_spans.get(unit, []))
+                      for unit, state in (units or {}).items()}
+        }
+        with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(self.index_path + ".tmp", self.index_path)
+
+def load_index(output_dir: str = OUTPUT_DIR) -> Dict:
+    """
+    Load the sidecar index of a JSON Lines inventory
+    """
+    with open(os.path.join(output_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported inventory index version: {index.get('version')}")
+    return index
+
+def read_spans(spans: List[List[int]], index: Dict, output_dir: str = OUTPUT_DIR) -> List[Dict]:
+    """
+    Entries stored in the given byte ranges of the JSON Lines inventory
+    """
+    docs = []
+    with open(os.path.join(output_dir, index["jsonl"]), "rb") as f:
+        for offset, length in spans:
+            f.seek(offset)
+            docs.extend(json.loads(line) for line in f.read(length).splitlines() if line.strip())
+    return docs
+
+def read_repo_docs(repo_name: str, index: Dict, output_dir: str = OUTPUT_DIR) -> List[Dict]:
+    """
+    Entries of one repository, read by seeking to its byte ranges
+    """
+    return read_spans(index["repos"].get(repo_name, []), index, output_dir)
+
+def load_previous_index(output_dir: str, base_path: str, pruned: Set[str]) -> Optional[Dict]:
+    """
+    The last run's index if its entries can be reused for this run
+    """
+    try:
+        index = load_index(output_dir)
+    except (OSError, ValueError):
+        return None
+    if (index.get("base_path") != base_path or index.get("pruned") != sorted(pruned)
+            or not os.path.exists(os.path.join(output_dir, index["jsonl"]))):
+        return None
+    return index
+
+def iter_sorted_docs(index: Dict, output_dir: str = OUTPUT_DIR) -> Iterator[Dict]:
+    """
+    All entries sorted by repository name, filename and path, holding one
+    repository in memory at a time
+    """
+    for repo_name in sorted(index["repos"]):
+        docs = read_repo_docs(repo_name, index, output_dir)
+        docs.sort(key=lambda x: (x["filename"], x["absolute_path"]))
+        yield from docs
+
+def merge_inventory(output_dir: str = OUTPUT_DIR) -> Dict:
+    """
+    Write docs_index.json in its original shape from the JSON Lines inventory
+    Entries are streamed into the file; returns the metadata block.
+    """
+    index = load_index(output_dir)
     
     # Generate summary statistics
-    total_files = len(docs_inventory)
-    repos_found = len(set(doc["repo_name"] for doc in docs_inventory))
+    total_files = 0
     categories = {}
     languages = {}
-    
-    for doc in docs_inventory:
+    for doc in iter_sorted_docs(index, output_dir):
+        total_files += 1
+        
         # Count by category
         category = doc["repo_category"]
         categories[category] = categories.get(category, 0) + 1
@@ -246,37 +653,139 @@ def main():
         for lang in doc["primary_languages"]:
             languages[lang] = languages.get(lang, 0) + 1
     
-    # Create output structure
-    output = {
-        "metadata": {
-            "scan_timestamp": datetime.now().isoformat(),
-            "base_path": BASE_PATH,
-            "total_files": total_files,
-            "repositories_found": repos_found,
-            "categories": categories,
-            "languages": languages,
-            "target_files": list(TARGET_FILES),
-            "docs_patterns": list(DOCS_PATTERNS)
-        },
-        "documentation_files": docs_inventory
+    metadata = {
+        "scan_timestamp": index["scan_timestamp"],
+        "base_path": index["base_path"],
+        "total_files": total_files,
+        "repositories_found": len(index["repos"]),
+        "categories": categories,
+        "languages": languages,
+        "target_files": list(TARGET_FILES),
+        "docs_patterns": list(DOCS_PATTERNS)
     }
     
-    # Ensure output directory exists
-    output_dir = ".scripts/cache"
-    os.makedirs(output_dir, exist_ok=True)
+    # Same bytes as json.dump(output, f, indent=2, ensure_ascii=False), one entry at a time
+    output_file = os.path.join(output_dir, MERGED_NAME)
+    with open(output_file + ".tmp", "w", encoding="utf-8") as f:
+        f.write('{\n  "metadata": ')
+        f.write(json.dumps(metadata, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+        f.write(',\n  "documentation_files": [')
+        separator = "\n    "
+        for doc in iter_sorted_docs(index, output_dir):
+            f.write(separator + json.dumps(doc, indent=2, ensure_ascii=False).replace("\n", "\n    "))
+            separator = ",\n    "
+        f.write("\n  ]\n}" if total_files else "]\n}")
+    os.replace(output_file + ".tmp", output_file)
+    return metadata
+
+def main():
+    """
+    Main function to run the documentation inventory
+    """
+    parser = argparse.ArgumentParser(description="Inventory documentation files across Surrentumlabs")
+    parser.add_argument("--base-path", default=BASE_PATH, help=f"Directory to scan (default: {BASE_PATH})")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Threads crawling repositories (default: {DEFAULT_JOBS})")
+    parser.add_argument("--prune", action="append", default=[], metavar="NAME",
+                        help="Also skip directories with this name (repeatable)")
+    parser.add_argument("--no-default-prune", action="store_true",
+                        help=f"Descend into {', '.join(sorted(PRUNED_DIRS - {'.git'}))}")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not print every file found")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help=f"Where the inventory goes (default: {OUTPUT_DIR})")
+    parser.add_argument("--no-merge", action="store_true",
+                        help=f"Only write the JSON Lines inventory and its index, not {MERGED_NAME}")
+    parser.add_argument("--merge", action="store_true",
+                        help=f"Rebuild {MERGED_NAME} from the existing JSON Lines inventory and exit")
+    parser.add_argument("--full", action="store_true",
+                        help="Crawl every repository, even those unchanged since the last run")
+    parser.add_argument("--lookup", metavar="REPO_NAME",
+                        help="Print one repository's entries from the existing inventory and exit")
+    args = parser.parse_args()
+    
+    if args.lookup:
+        docs = read_repo_docs(args.lookup, load_index(args.output_dir), args.output_dir)
+        print(json.dumps(docs, indent=2, ensure_ascii=False))
+        sys.exit(0 if docs else 1)
+    if args.merge:
+        metadata = merge_inventory(args.output_dir)
+        print(f"Merged {metadata['total_files']} files into {os.path.join(args.output_dir, MERGED_NAME)}")
+        return
     
-    # Write JSON output
-    output_file = os.path.join(output_dir, "docs_index.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    base_path = args.base_path
+    pruned = set(args.prune) | (set() if args.no_default_prune else PRUNED_DIRS)
+    
+    print(f"Starting documentation inventory scan of: {base_path}")
+    print(f"Target files: {', '.join(TARGET_FILES)}")
+    print(f"Target docs patterns: docs/README.md, docs/*.md")
+    print(f"Skipped directories: {', '.join(sorted(pruned | {'.git'}))}")
+    print("-" * 60)
+    
+    if not os.path.exists(base_path):
+        print(f"ERROR: Base path does not exist: {base_path}")
+        sys.exit(1)
+    
+    # Repositories whose HEAD and working tree did not move keep their entries
+    previous = None if args.full else load_previous_index(args.output_dir, base_path, pruned)
+    units = {}  # crawled repository -> {"state": ..., "nested": {nested root: state}}
+    skipped = []
+    
+    def repo_filter(repo_path: str) -> bool:
+        previous_unit = previous["units"].get(repo_path) if previous else None
+        unchanged, state = repository_unchanged(repo_path, previous_unit, pruned)
+        if unchanged:
+            units[repo_path] = {"state": state, "nested": previous_unit["nested"]}
+            skipped.append(repo_path)
+            return False
+        units[repo_path] = {"state": state, "nested": {}}
+        return True
+    
+    def record_nested(repo_path: str, nested_root: str) -> None:
+        # Commits and new files in a nested repository do not show in the outer status
+        units[repo_path]["nested"][nested_root] = repository_state(nested_root, pruned)
+    
+    def unit_of(doc_info: Dict) -> Optional[str]:
+        directory = os.path.dirname(doc_info["absolute_path"])
+        while directory not in units:
+            parent = os.path.dirname(directory)
+            if parent == directory or len(directory) < len(base_path):
+                return None
+            directory = parent
+        return directory
+    
+    # Scan for documentation files, streaming them to the JSON Lines inventory
+    writer = InventoryWriter(args.output_dir)
+    try:
+        for doc_info in scan_for_docs(base_path, args.jobs, pruned, verbose=not args.quiet,
+                                      repo_filter=repo_filter, on_nested=record_nested):
+            writer.add(doc_info, unit_of(doc_info))
+        
+        # Carry over the previous entries of unchanged repositories
+        for unit in sorted(skipped):
+            for doc_info in read_spans(previous["units"][unit]["spans"], previous, args.output_dir):
+                writer.add(doc_info, unit)
+    except BaseException:
+        # Keep the previous inventory: a partial one would be trusted next run
+        writer.abort()
+        raise
+    writer.close(base_path, pruned, units)
     
     print("-" * 60)
     print(f"Scan complete!")
-    print(f"Total files found: {total_files}")
-    print(f"Repositories scanned: {repos_found}")
-    print(f"Categories: {', '.join(f'{k}({v})' for k, v in categories.items())}")
-    print(f"Primary languages: {', '.join(f'{k}({v})' for k, v in languages.items())}")
-    print(f"Results written to: {output_file}")
+    print(f"Inventory streamed to: {writer.jsonl_path} (index: {writer.index_path})")
+    print(f"Repositories crawled: {len(units) - len(skipped)}, unchanged and skipped: {len(skipped)}")
+    
+    if args.no_merge:
+        print(f"Total files found: {writer.count}")
+        print(f"Repositories scanned: {len(writer.repos)}")
+        return
+    
+    # Merge into the original docs_index.json shape
+    metadata = merge_inventory(args.output_dir)
+    print(f"Total files found: {metadata['total_files']}")
+    print(f"Repositories scanned: {metadata['repositories_found']}")
+    print(f"Categories: {', '.join(f'{k}({v})' for k, v in metadata['categories'].items())}")
+    print(f"Primary languages: {', '.join(f'{k}({v})' for k, v in metadata['languages'].items())}")
+    print(f"Results written to: {os.path.join(args.output_dir, MERGED_NAME)}")
 
 if __name__ == "__main__":
     main()
@@ -10,14 +10,15 @@ This script validates:
 4. Updates status from todo → done where appropriate
 """
 
-import os
 import re
 import glob
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+from vault_parser import DEFAULT_CACHE_PATH, DocumentStore, VaultDocument
+
 @dataclass
 class LinkIssue:
     """Represents a link issue found during audit"""
@@ -37,8 +38,10 @@ class AuditResults:
     missing_backlinks: List[str]
 
 class BacklinkAuditor:
-    def __init__(self, base_path: str = "/home/cinder/Documents"):
+    def __init__(self, base_path: str = "/home/cinder/Documents",
+                 documents: Optional[DocumentStore] = None):
         self.base_path = Path(base_path)
+        self.documents = documents or DocumentStore()
         self.results = AuditResults([], [], [], [], [], [])
         
     def find_documentation_files(self) -> None:
@@ -65,6 +68,19 @@ class BacklinkAuditor:
         matches = re.findall(pattern, content)
         return set(matches)
     
+    def read_document(self, file_path: str) -> Optional[VaultDocument]:
+        """Read and parse a file once via the shared document store"""
+        try:
+            return self.documents.get(file_path)
+        except Exception as e:
+            print(f"❌ Error reading {file_path}: {e}")
+            return None
+    
+    def document_links(self, file_path: str) -> Set[str]:
+        """Obsidian link targets of a file, empty if it cannot be read"""
+        document = self.read_document(file_path)
+        return set(document.link_targets) if document else set()
+    
     def read_file_content(self, file_path: str) -> str:
         """Read file content with error handling"""
         try:
@@ -81,8 +97,7 @@ class BacklinkAuditor:
         # Collect all links from all Index.md files
         index_links = set()
         for index_file in self.results.index_files:
-            content = self.read_file_content(index_file)
-            links = self.extract_obsidian_links(content)
+            links = self.document_links(index_file)
             index_links.update(links)
             print(f"   📄 {index_file}: {len(links)} links found")
         
@@ -120,8 +135,7 @@ class BacklinkAuditor:
         
         for card_file in self.results.component_cards:
             card_path = Path(card_file)
-            content = self.read_file_content(card_file)
-            links = self.extract_obsidian_links(content)
+            links = self.document_links(card_file)
             
             # Find the expected Coverage.md path for this component
             # Component cards should be in: .../repo-name/Components/card.md
@@ -173,15 +187,18 @@ class BacklinkAuditor:
         print("\n📊 Checking for status updates (todo → done)...")
         
         for coverage_file in self.results.coverage_files:
-            content = self.read_file_content(coverage_file)
+            document = self.read_document(coverage_file)
+            tasks = document.tasks if document else []
             
             # Look for todo items that might be done
             # This is a heuristic check - look for patterns that suggest completion
-            todo_pattern = r'- \[ \].*?status.*?todo'
-            done_pattern = r'- \[x\].*?status.*?done'
+            todo_pattern = r'status.*?todo'
+            done_pattern = r'status.*?done'
             
-            todo_matches = re.findall(todo_pattern, content, re.IGNORECASE)
-            done_matches = re.findall(done_pattern, content, re.IGNORECASE)
+            todo_matches = [text for checked, text in tasks
+                            if not checked and re.search(todo_pattern, text, re.IGNORECASE)]
+            done_matches = [text for checked, text in tasks
+                            if checked and re.search(done_pattern, text, re.IGNORECASE)]
             
             # Check if component cards exist for todo items
             coverage_path = Path(coverage_file)
@@ -275,8 +292,10 @@ class BacklinkAuditor:
 
 def main():
     """Main execution function"""
-    auditor = BacklinkAuditor()
+    documents = DocumentStore(cache_path=DEFAULT_CACHE_PATH)
+    auditor = BacklinkAuditor(documents=documents)
     results = auditor.run_audit()
+    documents.save()
     
     # Generate and save report
     report = auditor.generate_report()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Backup Store for Warp Documentation Protocol
+
+Scripts that rewrite vault notes back up the originals here instead of
+leaving a full .backup copy next to every note:
+
+• objects/ab/<sha1>.zst|.z - each distinct file content once, compressed with
+                             zstd when the zstandard module is installed,
+                             zlib otherwise; unchanged content costs nothing
+• runs/<run id>.jsonl      - per-run manifest, appended as the run goes:
+                             which file had which content before (and after)
+
+Usage:
+  python backup_store.py list
+  python backup_store.py rollback [RUN_ID|latest] [--force]
+  python backup_store.py gc [--keep N] [--max-age DAYS]
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # zlib is always available
+    zstandard = None
+
+DEFAULT_BACKUP_DIR = Path(__file__).resolve().parent / ".scripts" / "cache" / "backups"
+DEFAULT_KEEP_RUNS = 20
+MANIFEST_VERSION = 1
+CODECS = ('.zst', '.z')
+
+
+def _compress(data: bytes) -> tuple:
+    """(suffix, compressed bytes) with the best codec available"""
+    if zstandard is not None:
+        return '.zst', zstandard.ZstdCompressor(level=10).compress(data)
+    return '.z', zlib.compress(data, 9)
+
+
+def _decompress(suffix: str, data: bytes) -> bytes:
+    if suffix == '.zst':
+        if zstandard is None:
+            raise RuntimeError("backup object is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _atomic_write(path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """Write bytes to a temp file in the same directory and rename it over path"""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass
+class BackupRun:
+    """One run's manifest: path -> {'before': sha1, 'after': sha1, 'mode': int}"""
+    store: "BackupStore"
+    run_id: str
+    tool: str = ""
+    created: float = field(default_factory=time.time)
+    files: Dict[str, Dict] = field(default_factory=dict)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.store.runs_dir / f"{self.run_id}.jsonl"
+
+    def backup(self, path: Union[str, Path]) -> str:
+        """Store path's current content (once per run) and return its hash"""
+        key = str(Path(path).resolve())
+        if key in self.files:
+            return self.files[key]['before']
+        with open(key, 'rb') as f:
+            data = f.read()
+        digest = self.store.put(data)
+        self.files[key] = {'before': digest, 'after': None, 'mode': os.stat(key).st_mode & 0o777}
+        self._append({'path': key, 'before': digest, 'mode': self.files[key]['mode']})
+        return digest
+
+    def written(self, path: Union[str, Path], data: bytes) -> None:
+        """Record the content the run wrote, so rollback can tell later edits apart"""
+        key = str(Path(path).resolve())
+        if key in self.files:
+            self.files[key]['after'] = hashlib.sha1(data).hexdigest()
+            self._append({'path': key, 'after': self.files[key]['after']})
+
+    def _append(self, record: Dict) -> None:
+        """Append to the manifest as the run goes, so an interrupted run can still be rolled back"""
+        manifest_path = self.manifest_path
+        lines = []
+        if not manifest_path.exists():
+            self.store.runs_dir.mkdir(parents=True, exist_ok=True)
+            lines.append({'version': MANIFEST_VERSION, 'run': self.run_id, 'tool': self.tool,
+                          'created': self.created})
+        lines.append(record)
+        with open(manifest_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(line, sort_keys=True) + "\n" for line in lines))
+
+    @classmethod
+    def load(cls, store: "BackupStore", manifest_path: Path) -> Optional["BackupRun"]:
+        """Replay a manifest; None if it is unreadable or from another version"""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            return None
+        if not records or records[0].get('version') != MANIFEST_VERSION:
+            return None
+        header = records[0]
+        run = cls(store=store, run_id=header['run'], tool=header.get('tool', ''),
+                  created=header.get('created', 0.0))
+        for record in records[1:]:
+            if 'before' in record:
+                run.files[record['path']] = {'before': record['before'], 'after': None,
+                                             'mode': record.get('mode')}
+            elif record.get('path') in run.files:
+                run.files[record['path']]['after'] = record.get('after')
+        return run
+
+
+class BackupStore:
+    """Deduplicated, compressed file backups with per-run manifests"""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_BACKUP_DIR):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+
+    def _object_path(self, digest: str) -> Optional[Path]:
+        for suffix in CODECS:
+            path = self.objects_dir / digest[:2] / f"{digest}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def put(self, data: bytes) -> str:
+        """Store data unless an object with the same hash exists; returns the hash"""
+        digest = hashlib.sha1(data).hexdigest()
+        if self._object_path(digest) is None:
+            suffix, compressed = _compress(data)
+            directory = self.objects_dir / digest[:2]
+            directory.mkdir(parents=True, exist_ok=True)
+            _atomic_write(directory / f"{digest}{suffix}", compressed)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        path = self._object_path(digest)
+        if path is None:
+            raise FileNotFoundError(f"backup object {digest} is missing")
+        data = _decompress(path.suffix, path.read_bytes())
+        if hashlib.sha1(data).hexdigest() != digest:
+            raise ValueError(f"backup object {digest} is corrupt")
+        return data
+
+    def start_run(self, tool: str) -> BackupRun:
+        """A new run; its manifest is only written once something is backed up"""
+        run_id = time.strftime('%Y%m%dT%H%M%S') + f"-{os.getpid()}"
+        return BackupRun(store=self, run_id=run_id, tool=tool)
+
+    def runs(self) -> List[BackupRun]:
+        """All readable runs, oldest first"""
+        runs = []
+        if not self.runs_dir.exists():
+            return runs
+        for manifest_path in self.runs_dir.glob("*.jsonl"):
+            run = BackupRun.load(self, manifest_path)
+            if run is not None:
+                runs.append(run)
+        return sorted(runs, key=lambda run: (run.created, run.run_id))
+
+    def find_run(self, run_id: str = 'latest') -> Optional[BackupRun]:
+        runs = self.runs()
+        if not runs:
+            return None
+        if run_id == 'latest':
+            return runs[-1]
+        return next((run for run in runs if run.run_id == run_id), None)
+
+    def rollback(self, run: BackupRun, force: bool = False) -> Dict[str, List[str]]:
+        """Restore every file of a run to its content before the run
+
+        Files edited since the run wrote them, and files the run never
+        recorded a write for (so later edits cannot be told apart), are left
+        alone unless force.
+        """
+        result = {'restored': [], 'unchanged': [], 'skipped': []}
+        for path, entry in sorted(run.files.items()):
+            file_path = Path(path)
+            current = file_path.read_bytes() if file_path.exists() else None
+            current_digest = hashlib.sha1(current).hexdigest() if current is not None else None
+            if current_digest == entry['before']:
+                result['unchanged'].append(path)
+                continue
+            after = entry.get('after')
+            if not force and (after is None or current_digest != after):
+                result['skipped'].append(path)
+                continue
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            mode = entry.get('mode') or (file_path.stat().st_mode & 0o777 if current is not None else 0o644)
+            _atomic_write(file_path, self.get(entry['before']), mode)
+            result['restored'].append(path)
+        return result
+
+    def gc(self, keep: Optional[int] = DEFAULT_KEEP_RUNS, max_age_days: Optional[float] = None) -> Dict[str, int]:
+        """Drop runs beyond the newest keep or older than max_age_days, then unreferenced objects"""
+        runs = self.runs()
+        expired = runs[:len(runs) - keep] if keep is not None and len(runs) > keep else []
+        if max_age_days is not None:
+            cutoff = time.time() - max_age_days * 86400
+            expired_ids = {run.run_id for run in expired}
+            expired += [run for run in runs if run.created < cutoff and run.run_id not in expired_ids]
+        for run in expired:
+            try:
+                run.manifest_path.unlink()
+            except OSError:
+                pass
+
+        referenced = set()
+        for run in self.runs():
+            referenced.update(entry['before'] for entry in run.files.values())
+
+        removed_objects = 0
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob("*/*"):
+                digest = object_path.name.split('.', 1)[0]
+                if digest not in referenced:
+                    object_path.unlink()
+                    removed_objects += 1
+        return {'runs': len(expired), 'objects': removed_objects}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List, roll back and prune vault backup runs')
+    parser.add_argument('--dir', default=str(DEFAULT_BACKUP_DIR), help=f'Backup store (default: {DEFAULT_BACKUP_DIR})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='List backup runs, oldest first')
+    rollback_parser = subparsers.add_parser('rollback', help='Restore the files of one run')
+    rollback_parser.add_argument('run', nargs='?', default='latest', help='Run ID (default: latest)')
+    rollback_parser.add_argument('--force', action='store_true', help='Also restore files edited since the run')
+    gc_parser = subparsers.add_parser('gc', help='Drop old runs and unreferenced objects')
+    gc_parser.add_argument('--keep', type=int, default=DEFAULT_KEEP_RUNS,
+                           help=f'Runs to keep (default: {DEFAULT_KEEP_RUNS})')
+    gc_parser.add_argument('--max-age', type=float, help='Also drop runs older than this many days')
+    args = parser.parse_args()
+
+    store = BackupStore(args.dir)
+    if args.command == 'list':
+        for run in store.runs():
+            created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run.created))
+            print(f"{run.run_id}  {created}  {run.tool or '-'}  {len(run.files)} files")
+        return 0
+
+    if args.command == 'rollback':
+        run = store.find_run(args.run)
+        if run is None:
+            print(f"❌ No backup run '{args.run}' in {store.root}")
+            return 1
+        result = store.rollback(run, force=args.force)
+        for path in result['restored']:
+            print(f"↩️  RESTORED: {path}")
+        for path in result['skipped']:
+            print(f"⚠️  SKIPPED (edited since run {run.run_id} or not written by it; use --force): {path}")
+        print(f"✅ Rolled back {run.run_id}: {len(result['restored'])} restored, "
+              f"{len(result['unchanged'])} already original, {len(result['skipped'])} skipped")
+        return 1 if result['skipped'] else 0
+
+    removed = store.gc(keep=args.keep, max_age_days=args.max_age)
+    print(f"🧹 Removed {removed['runs']} runs and {removed['objects']} unreferenced objects")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Parallel Check Executor for Warp Documentation Protocol
+
+Fans per-file work out over a worker pool while keeping results in input
+order, so reports stay byte-identical to a serial run:
+
+• map_io  - latency-bound work (stat, reads on the NFS mount) on threads
+• map_cpu - regex-heavy work (Markdown parsing) on processes
+
+Backends: "auto" (threads for I/O, processes for CPU), "thread" or
+"process" for every stage. jobs=1 runs everything inline.
+"""
+
+import os
+import argparse
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+BACKENDS = ('auto', 'thread', 'process')
+
+
+class CheckExecutor:
+    """Ordered map over a thread or process pool, created lazily and reused"""
+
+    def __init__(self, jobs: int = 1, backend: str = 'auto'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.backend = backend
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down any pools that were started"""
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown()
+        self._threads = None
+        self._processes = None
+
+    def _thread_pool(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.jobs)
+        return self._threads
+
+    def _process_pool(self) -> Executor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.jobs)
+        return self._processes
+
+    def _map(self, pool: Executor, func: Callable, items: List) -> List:
+        # Large chunks keep process-pool pickling overhead low
+        chunksize = max(1, len(items) // (self.jobs * 4))
+        return list(pool.map(func, items, chunksize=chunksize))
+
+    def map_io(self, func: Callable, items: Iterable) -> List:
+        """Apply func to every item for I/O-bound work; results keep input order"""
+        items = list(items)
+        if self.jobs == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        pool = self._process_pool() if self.backend == 'process' else self._thread_pool()
+        return self._map(pool, func, items)
+
+    def map_cpu(self, func: Callable, items: Iterable) -> List:
+        """Apply a picklable top-level func to every item for CPU-bound work"""
+        items = list(items)
+        if self.jobs == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        pool = self._thread_pool() if self.backend == 'thread' else self._process_pool()
+        return self._map(pool, func, items)
+
+
+def add_executor_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --jobs/--backend options to a checker's CLI"""
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Worker count for file processing (0 = one per CPU, default: 1)')
+    parser.add_argument('--backend', choices=BACKENDS, default='auto',
+                        help='Pool type: auto = threads for I/O, processes for parsing (default: auto)')
+
+
+def executor_from_args(args: argparse.Namespace) -> CheckExecutor:
+    """Build a CheckExecutor from parsed --jobs/--backend options"""
+    return CheckExecutor(jobs=args.jobs, backend=args.backend)
@@ -5,6 +5,12 @@ Script to complete the categorization of all Twitch components in Coverage.md
 Based on traffic volume, production usage, infrastructure tags, and dependency matrix analysis.
 """
 
+from coverage_table import iter_coverage_rows
+from markdown_writeback import set_table_cell, write_if_changed
+
+# Row types that get a category
+CATEGORIZED_TYPES = ('service', 'infra', 'team', 'folder', 'domain', 'component')
+
 # Complete categorization mapping based on analysis
 categorization = {
     # Essential: Core domains, high-connectivity services, revenue-critical, user-facing
@@ -61,68 +67,32 @@ def main():
     
     coverage_path = '/home/cinder/Documents/repos/Twitch Docs/Coverage.md'
     
-    with open(coverage_path, 'r') as f:
-        content = f.read()
-    
-    lines = content.split('\n')
-    updated_lines = []
+    with open(coverage_path, 'r', encoding='utf-8', newline='') as f:
+        lines = f.read().splitlines(keepends=True)
     
-    for line in lines:
-        # Check if this is a component line in the table that needs a category
-        if (line.startswith('|') and '|service|' in line or 
-            line.startswith('|') and '|infra|' in line or
-            line.startswith('|') and '|team|' in line or
-            line.startswith('|') and '|folder|' in line or
-            line.startswith('| ') and ' | domain |' in line or
-            line.startswith('| ') and ' | component |' in line):
-            
-            # Skip lines that already have categories (end with a category)
-            if (line.endswith('|Essential|') or 
-                line.endswith('|Semi-Essential|') or 
-                line.endswith('|Non-Essential|') or
-                line.endswith('| Essential |') or
-                line.endswith('| Semi-Essential |') or
-                line.endswith('| Non-Essential |')):
-                updated_lines.append(line)
-                continue
-                
-            # Skip lines that end with empty category column
-            if line.endswith('|||') or line.endswith('||'):
-                # Extract component name
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    component_name = parts[1].strip() if not line.startswith('| ') else parts[1].strip()
-                    category = get_category(component_name)
-                    
-                    # Replace the empty category with the determined category
-                    if line.endswith('|||'):
-                        updated_line = line[:-2] + f'{category}|'
-                    elif line.endswith('||'):
-                        updated_line = line[:-1] + f'{category}|'
-                    else:
-                        updated_line = line + f'|{category}|'
-                    
-                    updated_lines.append(updated_line)
-                    continue
-            
-            # Handle lines without category column at all
-            parts = line.split('|')
-            if len(parts) >= 2:
-                component_name = parts[1].strip() if not line.startswith('| ') else parts[1].strip()
-                category = get_category(component_name)
-                
-                # Add category column
-                updated_line = line.rstrip('|') + f'|{category}|'
-                updated_lines.append(updated_line)
-                continue
+    for row in iter_coverage_rows(lines):
+        # Only component rows of the kinds we categorize
+        if row.type.lower() not in CATEGORIZED_TYPES:
+            continue
         
-        updated_lines.append(line)
+        # Skip rows that already have a category
+        if row.category in categorization:
+            continue
+        
+        category = get_category(row.component)
+        index = row.line - 1
+        line = lines[index]
+        category_column = row.column('category')
+        if category_column is not None and category_column < len(row.cells):
+            # Fill the (empty or unknown) Category cell
+            lines[index] = set_table_cell(line, category_column, category)
+        else:
+            # Handle rows without a category column at all
+            body = line.rstrip('\r\n')
+            lines[index] = body.rstrip('|') + f'|{category}|' + line[len(body):]
     
     # Write back the updated content
-    updated_content = '\n'.join(updated_lines)
-    
-    with open(coverage_path, 'w') as f:
-        f.write(updated_content)
+    write_if_changed(coverage_path, ''.join(lines))
     
     print("✅ Successfully updated Coverage.md with component categories")
     
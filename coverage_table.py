@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Coverage Table Parser for Warp Documentation Protocol
+
+One parser for the component tables in Coverage.md files:
+
+| Component | Type | Source Path | Status | Last Scanned | Doc File | Backlinks | Category |
+
+Tables are streamed one at a time with vault_parser.iter_tables (the same
+fence and table rules as parse_markdown), the header row is detected and
+its column names mapped, and each body row is yielded as a typed
+CoverageRow. Tables without any header row (no separator under the first
+row) are read positionally in the column order above; tables with some
+other header, such as a summary table, are skipped. table_rows holds these
+rules for both the streaming and the parsed-document entry points.
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from vault_parser import (WIKILINK_PATTERN, MarkdownTable, VaultDocument, is_separator_row, iter_tables,
+                          parse_markdown)
+
+# Header name (lower case) -> CoverageRow field
+COVERAGE_COLUMNS = {
+    'component': 'component',
+    'type': 'type',
+    'source path': 'source_path',
+    'status': 'status',
+    'last scanned': 'last_scanned',
+    'doc file': 'doc_file',
+    'backlinks': 'backlinks',
+    'category': 'category',
+}
+POSITIONAL_COLUMNS = {name: index for index, name in enumerate(
+    ['component', 'type', 'source_path', 'status', 'last_scanned', 'doc_file', 'backlinks', 'category'])}
+# Headerless rows need the cells up to Backlinks; Category was added later
+POSITIONAL_MIN_CELLS = POSITIONAL_COLUMNS['backlinks'] + 1
+
+
+@dataclass
+class CoverageRow:
+    """One component row of a Coverage table"""
+    component: str
+    type: str = ''
+    source_path: str = ''
+    status: str = ''
+    last_scanned: str = ''
+    doc_file: str = ''
+    backlinks: List[str] = field(default_factory=list)  # wikilink targets in the Backlinks cell
+    category: str = ''
+    line: int = 0  # 1-based line number in the file
+    cells: List[str] = field(default_factory=list)
+    columns: Dict[str, int] = field(default_factory=dict)  # field -> cell index in this table
+
+    @property
+    def status_key(self) -> str:
+        """Status normalised for comparisons ('Partial ' -> 'partial')"""
+        return self.status.strip().lower()
+
+    def column(self, name: str) -> Optional[int]:
+        """Cell index of a field (e.g. 'status') in this row's table, if present"""
+        return self.columns.get(name)
+
+
+def column_map(header: List[str]) -> Optional[Dict[str, int]]:
+    """Map CoverageRow fields to cell indexes, or None if header is not a Coverage header"""
+    columns = {}
+    for index, cell in enumerate(header):
+        name = COVERAGE_COLUMNS.get(cell.strip().lower())
+        if name and name not in columns:
+            columns[name] = index
+    if 'component' not in columns or len(columns) < 2:
+        return None
+    return columns
+
+
+def make_row(cells: List[str], columns: Dict[str, int], line: int) -> Optional[CoverageRow]:
+    """Build a CoverageRow from split cells; None for separator, empty and short positional rows"""
+    if is_separator_row(cells):
+        return None
+    if columns is POSITIONAL_COLUMNS and len(cells) < POSITIONAL_MIN_CELLS:
+        return None
+
+    def cell(name):
+        index = columns.get(name)
+        return cells[index] if index is not None and index < len(cells) else ''
+
+    component = cell('component')
+    if not component:
+        return None
+    backlinks_cell = cell('backlinks')
+    return CoverageRow(component=component, type=cell('type'), source_path=cell('source_path'),
+                       status=cell('status'), last_scanned=cell('last_scanned'), doc_file=cell('doc_file'),
+                       backlinks=WIKILINK_PATTERN.findall(backlinks_cell),
+                       category=cell('category'), line=line, cells=cells, columns=columns)
+
+
+def table_rows(table: MarkdownTable) -> Iterator[CoverageRow]:
+    """CoverageRows of one table: by header, positionally when there is no header row"""
+    columns = column_map(table.header)
+    body_line = table.line + (2 if table.has_separator else 1)
+    numbered = list(enumerate(table.rows, body_line))
+    if columns is None:
+        if table.has_separator:
+            return  # some other table, e.g. a summary
+        columns = POSITIONAL_COLUMNS  # headerless table: first row is data
+        numbered.insert(0, (table.line, table.header))
+    for line, cells in numbered:
+        row = make_row(cells, columns, line)
+        if row is not None:
+            yield row
+
+
+def iter_coverage_rows(lines: Iterable[str]) -> Iterator[CoverageRow]:
+    """Stream CoverageRows from lines of Markdown, holding one table at a time"""
+    for table in iter_tables(lines):
+        yield from table_rows(table)
+
+
+def read_coverage_rows(path: Union[str, Path]) -> Iterator[CoverageRow]:
+    """Stream CoverageRows from a Coverage.md file without reading it whole"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        yield from iter_coverage_rows(f)
+
+
+def coverage_rows(document: VaultDocument) -> List[CoverageRow]:
+    """CoverageRows of an already parsed document (same rules as iter_coverage_rows)"""
+    return [row for table in document.tables for row in table_rows(table)]
+
+
+def status_counts(rows: Iterable[CoverageRow]) -> Dict[str, int]:
+    """Exact number of rows per Status value (lower case; '' for an empty cell)"""
+    counts: Dict[str, int] = {}
+    for row in rows:
+        key = row.status_key
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+@dataclass
+class TableSummary:
+    """Structure and per-status counts of the Coverage tables in one document"""
+    tables: int = 0  # tables whose header has Component and Status columns
+    separators: int = 0  # of those, tables with a | --- | separator under the header
+    rows: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    malformed_rows: List[int] = field(default_factory=list)  # lines whose cell count differs from the header
+    headers: List[str] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return self.status_counts.get(status.lower(), 0)
+
+    @property
+    def valid(self) -> bool:
+        """Renderable in Obsidian: at least one Component/Status table, each with a separator"""
+        return self.tables > 0 and self.separators == self.tables
+
+
+def summarize_tables(document: VaultDocument) -> TableSummary:
+    """Validate a document's Coverage tables and count statuses, one pass over the cells"""
+    summary = TableSummary()
+    for table in document.tables:
+        columns = column_map(table.header)
+        if columns is None or 'status' not in columns:
+            continue
+        summary.tables += 1
+        summary.separators += table.has_separator
+        summary.headers.append(table.header_line)
+        width = len(table.header)
+        status_column = columns['status']
+        component_column = columns['component']
+        body_line = table.line + (2 if table.has_separator else 1)
+        for offset, cells in enumerate(table.rows):
+            if len(cells) != width:
+                summary.malformed_rows.append(body_line + offset)
+            if component_column >= len(cells) or not cells[component_column] or is_separator_row(cells):
+                continue
+            summary.rows += 1
+            status = cells[status_column].lower() if status_column < len(cells) else ''
+            summary.status_counts[status] = summary.status_counts.get(status, 0) + 1
+    return summary
+
+
+# The whole-file pattern the checks used before the cell-split counting
+LEGACY_PARTIAL_PATTERN = re.compile(r'\|\s*\w+.*?\|\s*partial\s*\|', re.IGNORECASE)
+BENCHMARK_STATUSES = ('todo', 'partial', 'done', 'disconnected', 'Partial')
+
+
+def synthetic_table(rows: int, extra_columns: int = 6, seed: int = 0) -> str:
+    """A wide Coverage table with rows rows and a random status per row"""
+    rng = random.Random(seed)
+    header = ['Component', 'Type', 'Source Path', 'Status', 'Last Scanned', 'Doc File', 'Backlinks',
+              'Category'] + [f'Note {i}' for i in range(extra_columns)]
+    lines = ['# Coverage', '', '| ' + ' | '.join(header) + ' |', '|' + '---|' * len(header)]
+    for i in range(rows):
+        cells = [f'component-{i}', 'service', f'/src/team-{i % 97}/component-{i}',
+                 rng.choice(BENCHMARK_STATUSES), '2025-01-01', f'Components/component-{i}.md',
+                 f'[[Components/component-{i - 1}]] [[Index]]', 'Semi-Essential']
+        cells += [f'notes on component {i} column {j}' for j in range(extra_columns)]
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    return '\n'.join(lines) + '\n'
+
+
+def benchmark(rows: int, extra_columns: int = 6, legacy: bool = True) -> None:
+    """Time status counting on a synthetic table and check the counts are exact"""
+    content = synthetic_table(rows, extra_columns)
+    expected: Dict[str, int] = {}
+    for line in content.splitlines()[4:]:
+        status = line.split('|')[4].strip().lower()
+        expected[status] = expected.get(status, 0) + 1
+    print(f"📏 {rows} rows x {8 + extra_columns} columns, {len(content) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    summary = summarize_tables(parse_markdown(content))
+    elapsed = time.perf_counter() - start
+    assert summary.status_counts == expected and summary.rows == rows and summary.valid
+    print(f"  parse + summarize_tables:        {elapsed:.3f}s  {summary.status_counts}")
+
+    start = time.perf_counter()
+    counts = status_counts(iter_coverage_rows(content.splitlines()))
+    elapsed = time.perf_counter() - start
+    assert counts == expected
+    print(f"  iter_coverage_rows + counts:     {elapsed:.3f}s")
+
+    if legacy:
+        start = time.perf_counter()
+        matches = len(LEGACY_PARTIAL_PATTERN.findall(content))
+        elapsed = time.perf_counter() - start
+        print(f"  legacy regex (partial only):     {elapsed:.3f}s  {matches} hits vs {expected.get('partial', 0)} exact")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate Coverage tables and count component statuses')
+    parser.add_argument('files', nargs='*', help='Coverage.md files to summarize')
+    parser.add_argument('--benchmark', type=int, metavar='ROWS',
+                        help='time status counting on a synthetic table with ROWS rows')
+    parser.add_argument('--columns', type=int, default=6, help='extra columns in the benchmark table')
+    parser.add_argument('--no-legacy', action='store_true', help='skip timing the old regex in the benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.columns, legacy=not args.no_legacy)
+    failed = False
+    for path in args.files:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            summary = summarize_tables(parse_markdown(f.read(), path))
+        mark = '✅' if summary.valid else '❌'
+        print(f"{mark} {path}: {summary.tables} tables, {summary.rows} rows, statuses {summary.status_counts}")
+        if summary.malformed_rows:
+            print(f"  ⚠️  {len(summary.malformed_rows)} rows with a different cell count than the header "
+                  f"(first at line {summary.malformed_rows[0]})")
+        failed = failed or not summary.valid
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
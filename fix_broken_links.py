@@ -2,19 +2,195 @@
 """
 Link Repair Script for Warp Documentation Protocol
 Fixes common broken link patterns identified in QA validation
+
+• --dry-run       - print the repairs as a unified diff (or --format json)
+                    without touching any file; exits 1 if repairs are pending
+• content ledger  - files known to be clean (by mtime/size, then SHA-1) are
+                    skipped; kept in .scripts/cache/linkfix_ledger.json
+• --jobs N        - rewrite files on a worker pool; writes stay in the main
+                    process, one file at a time
+• backups         - originals go to the deduplicated backup store; undo a
+                    whole run with: python backup_store.py rollback
 """
 
 import os
 import re
-import shutil
+import sys
+import json
+import difflib
+import hashlib
+import argparse
+import contextlib
 from pathlib import Path
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from backup_store import DEFAULT_BACKUP_DIR, DEFAULT_KEEP_RUNS, BackupRun, BackupStore
+from check_executor import CheckExecutor, add_executor_arguments, executor_from_args
+from graph_incremental import file_fingerprint
+from markdown_writeback import write_if_changed
+
+LEDGER_VERSION = 1
+DEFAULT_LEDGER_PATH = Path(__file__).resolve().parent / ".scripts" / "cache" / "linkfix_ledger.json"
+
+# Repair rules in priority order: (name, Warp files only, pattern after the opening [[,
+# replacement for the whole link). Replacements are format templates over the
+# pattern's named groups.
+REPAIR_RULES = [
+    # [[Coverage]] -> [[../Twitch Docs/Coverage]]
+    ('fix_coverage_links', True, r'Coverage\]\]', '[[../Twitch Docs/Coverage]]'),
+    # [[Components/xyz]] -> [[../Twitch Docs/Components/xyz]]
+    ('fix_component_links', True, r'Components/(?P<component>[^][]+)\]\]',
+     '[[../Twitch Docs/Components/{component}]]'),
+    # Self-referential and .md task backlinks in Tasks.md and Changelog.md
+    ('fix_task_backlinks', True, r'\.\./\.\./Warp/(?P<warp_note>Tasks|Changelog)\]\]', '[[{warp_note}]]'),
+    ('fix_task_backlinks', True, r'(?P<md_note>Tasks|Changelog)\.md\]\]', '[[{md_note}]]'),
+    ('fix_task_backlinks', True, r'Coverage\.md\]\]', '[[../Twitch Docs/Coverage]]'),
+    # [[Index]] -> [[../Twitch Docs/Index]], leaving [[Index]] followed by whitespace alone
+    ('fix_index_links', True, r'Index\]\](?!\s)', '[[../Twitch Docs/Index]]'),
+    # [[...]] placeholders are removed
+    ('fix_ellipsis_links', False, r'\.\.\.+\]\]', ''),
+    # [[Components/]] -> [[../Twitch Docs/Components]]
+    ('fix_empty_component_links', False, r'Components/\]\]', '[[../Twitch Docs/Components]]'),
+]
+
+
+class LinkScanner(NamedTuple):
+    """The repair rules compiled into one alternation after [[; group r<i> is rule i"""
+    pattern: re.Pattern
+    rules: Dict[str, Tuple[str, str]]  # group name -> (rule name, replacement)
+
+
+def compile_rules(rules, warp: bool) -> LinkScanner:
+    """One regex trying every applicable rule at each [[, first rule winning"""
+    alternatives = []
+    groups = {}
+    for index, (name, warp_only, pattern, replacement) in enumerate(rules):
+        if warp_only and not warp:
+            continue
+        alternatives.append(f'(?P<r{index}>{pattern})')
+        groups[f'r{index}'] = (name, replacement)
+    return LinkScanner(re.compile(r'\[\[(?:' + '|'.join(alternatives) + ')'), groups)
+
+
+SCANNERS = {warp: compile_rules(REPAIR_RULES, warp) for warp in (True, False)}
+# Ledger entries only count as clean for the rules that checked them
+RULES_DIGEST = hashlib.sha1(repr(REPAIR_RULES).encode('utf-8')).hexdigest()
+
+
+def rewrite_links(content: str, warp: bool) -> Tuple[str, Dict[str, int]]:
+    """Apply the repair rules in one scan; returns the content and changes per rule"""
+    scanner = SCANNERS[warp]
+    changes: Dict[str, int] = {}
+    
+    def replace(match):
+        name, template = scanner.rules[match.lastgroup]
+        new_link = template.format_map(match.groupdict()) if '{' in template else template
+        changes[name] = changes.get(name, 0) + 1
+        return new_link
+    
+    return scanner.pattern.sub(replace, content), changes
+
+
+@dataclass
+class FileRepair:
+    """A file's content before and after the repair rules"""
+    path: str
+    fingerprint: Optional[Dict] = None  # of the file as it was read
+    original: str = ""
+    content: str = ""
+    changes: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return self.error is None and self.content != self.original
+
+
+def _rewrite_file(task: Tuple[str, bool]) -> FileRepair:
+    """Read and rewrite one file (worker-pool task; never writes)"""
+    path, warp = task
+    try:
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        original = data.decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return FileRepair(path=path, error=str(e))
+    fingerprint = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                   'sha1': hashlib.sha1(data).hexdigest()}
+    content, changes = rewrite_links(original, warp)
+    return FileRepair(path=path, fingerprint=fingerprint, original=original, content=content, changes=changes)
+
+
+class RepairLedger:
+    """Fingerprints of files the current rules left unchanged, persisted between runs"""
+    
+    def __init__(self, path: Optional[Path] = DEFAULT_LEDGER_PATH):
+        self.path = Path(path) if path else None
+        self.files: Dict[str, Dict] = {}
+        self.dirty = False
+        
+    def load(self) -> "RepairLedger":
+        """Load the ledger, starting empty on corruption or a rule/version change"""
+        if not self.path:
+            return self
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get('version') == LEDGER_VERSION and data.get('rules') == RULES_DIGEST:
+            self.files = data.get('files', {})
+        else:
+            self.dirty = True
+        return self
+    
+    def is_clean(self, path: Path) -> bool:
+        """Whether path still has the content it had when it was found clean"""
+        previous = self.files.get(str(path))
+        if previous is None:
+            return False
+        fingerprint = file_fingerprint(path, previous)
+        if fingerprint is None or fingerprint['sha1'] != previous['sha1']:
+            return False
+        if fingerprint is not previous:
+            # Touched but identical: remember the new stat so the hash is skipped next time
+            self.mark_clean(path, fingerprint)
+        return True
+    
+    def mark_clean(self, path: Path, fingerprint: Dict) -> None:
+        self.files[str(path)] = fingerprint
+        self.dirty = True
+    
+    def forget(self, path: Path) -> None:
+        if self.files.pop(str(path), None) is not None:
+            self.dirty = True
+    
+    def save(self) -> None:
+        """Write the ledger atomically if it changed, dropping files that are gone"""
+        if not self.path or not self.dirty:
+            return
+        files = {path: entry for path, entry in self.files.items() if os.path.exists(path)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.path, json.dumps({'version': LEDGER_VERSION, 'rules': RULES_DIGEST,
+                                                'files': files}, separators=(',', ':')))
+        self.dirty = False
+
 
 class LinkRepairer:
-    def __init__(self, base_path: str = "/home/cinder/Documents/repos"):
+    def __init__(self, base_path: str = "/home/cinder/Documents/repos", dry_run: bool = False,
+                 ledger: Optional[RepairLedger] = None, executor: Optional[CheckExecutor] = None,
+                 backups: Optional[BackupRun] = None):
         self.base_path = Path(base_path)
         self.repairs_made = []
         self.files_modified = []
+        self.dry_run = dry_run
+        self.ledger = ledger or RepairLedger(None)
+        self.executor = executor or CheckExecutor()
+        self.pending: List[FileRepair] = []  # repairs a dry run would have written
+        self.skipped_clean = 0
+        self.backups = backups
         
     def log_repair(self, file_path: Path, old_link: str, new_link: str):
         """Log a link repair"""
@@ -23,132 +199,117 @@ class LinkRepairer:
         print(f"🔧 FIXED: {repair}")
         
     def backup_file(self, file_path: Path):
-        """Create a backup of the file before modification"""
-        backup_path = file_path.with_suffix(f"{file_path.suffix}.backup-linkfix")
-        shutil.copy2(file_path, backup_path)
-        print(f"💾 BACKUP: {backup_path}")
-        
-    def fix_coverage_links(self, content: str, source_file: Path) -> str:
-        """Fix [[Coverage]] links to point to correct location"""
-        # Pattern: [[Coverage]] -> [[../Twitch Docs/Coverage]]
-        if "Warp" in str(source_file):
-            content = re.sub(r'\[\[Coverage\]\]', r'[[../Twitch Docs/Coverage]]', content)
-        return content
-    
-    def fix_component_links(self, content: str, source_file: Path) -> str:
-        """Fix [[Components/xyz]] links to point to correct location"""
-        # Pattern: [[Components/xyz]] -> [[../Twitch Docs/Components/xyz]]
-        def replace_component_link(match):
-            component_name = match.group(1)
-            if "Warp" in str(source_file):
-                return f"[[../Twitch Docs/Components/{component_name}]]"
-            return match.group(0)
-        
-        content = re.sub(r'\[\[Components/([^]]+)\]\]', replace_component_link, content)
-        return content
-    
-    def fix_task_backlinks(self, content: str, source_file: Path) -> str:
-        """Fix task backlinks to proper relative paths"""
-        # Common patterns in Tasks.md and Changelog.md
-        if "Warp" in str(source_file):
-            # Fix self-referential links
-            content = re.sub(r'\[\[\.\.\/\.\.\/Warp\/Tasks\]\]', r'[[Tasks]]', content)
-            content = re.sub(r'\[\[\.\.\/\.\.\/Warp\/Changelog\]\]', r'[[Changelog]]', content)
-            # Fix simple self-references
-            content = re.sub(r'\[\[Tasks\.md\]\]', r'[[Tasks]]', content)
-            content = re.sub(r'\[\[Changelog\.md\]\]', r'[[Changelog]]', content)
-            content = re.sub(r'\[\[Coverage\.md\]\]', r'[[../Twitch Docs/Coverage]]', content)
-        
-        return content
-    
-    def fix_index_links(self, content: str, source_file: Path) -> str:
-        """Fix Index links that are missing proper paths"""
-        # [[Index]] -> [[../Twitch Docs/Index]] when in Warp directory
-        if "Warp" in str(source_file):
-            # Be careful not to replace [[../Twitch Docs/Index]] that are already correct
-            content = re.sub(r'\[\[Index\]\](?!\s)', r'[[../Twitch Docs/Index]]', content)
-        
-        return content
-    
-    def fix_ellipsis_links(self, content: str, source_file: Path) -> str:
-        """Fix malformed ellipsis links like [[...]]"""
-        # Remove or replace [[...]] links as they're typically placeholders
-        content = re.sub(r'\[\[\.\.\.+\]\]', '', content)
-        return content
-    
-    def fix_architecture_docs_links(self, content: str, source_file: Path) -> str:
-        """Fix links to missing architecture documents"""
-        # Handle cases where docs/architecture paths are referenced
-        return content
-    
-    def fix_empty_component_links(self, content: str, source_file: Path) -> str:
-        """Fix empty component references like [[Components/]]"""
-        content = re.sub(r'\[\[Components/\]\]', '[[../Twitch Docs/Components]]', content)
-        return content
+        """Back up the file to the content-addressed store before modification"""
+        if self.backups is None:
+            self.backups = BackupStore().start_run('fix_broken_links')
+        digest = self.backups.backup(file_path)
+        print(f"💾 BACKUP: {file_path.name} -> {digest[:12]} (run {self.backups.run_id})")
+        
+    def rewrite(self, content: str, source_file: Path) -> Tuple[str, Dict[str, int]]:
+        """Apply the repair rules in one scan; returns the content and changes per rule"""
+        return rewrite_links(content, "Warp" in str(source_file))
     
-    def repair_file(self, file_path: Path) -> bool:
-        """Repair broken links in a single file"""
-        if not file_path.exists() or not file_path.name.endswith('.md'):
+    def apply_repair(self, repair: FileRepair) -> bool:
+        """Record or write one file's repair (always in the calling process); True if repaired"""
+        file_path = Path(repair.path)
+        if repair.error is not None:
+            print(f"❌ ERROR: Failed to repair {file_path}: {repair.error}")
             return False
         
+        for name, count in repair.changes.items():
+            print(f"📝 {name}: {count} changes in {file_path.name}")
+        
+        if not repair.changed:
+            self.ledger.mark_clean(file_path, repair.fingerprint)
+            return False
+        
+        self.ledger.forget(file_path)
+        if self.dry_run:
+            self.pending.append(repair)
+            return True
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            # Never overwrite edits made after the file was read
+            stat = os.stat(file_path)
+            if (stat.st_mtime_ns, stat.st_size) != (repair.fingerprint['mtime_ns'], repair.fingerprint['size']):
+                print(f"⚠️  SKIPPED: {file_path} changed while it was being repaired")
+                return False
             
-            content = original_content
+            # Create backup
+            self.backup_file(file_path)
             
-            # Apply all repair functions
-            repair_functions = [
-                self.fix_coverage_links,
-                self.fix_component_links,
-                self.fix_task_backlinks,
-                self.fix_index_links,
-                self.fix_ellipsis_links,
-                self.fix_empty_component_links,
-                self.fix_architecture_docs_links
-            ]
-            
-            for repair_func in repair_functions:
-                new_content = repair_func(content, file_path)
-                if new_content != content:
-                    # Count the changes made by this function
-                    changes = len(re.findall(r'\[\[[^]]+\]\]', content)) - len(re.findall(r'\[\[[^]]+\]\]', new_content))
-                    if changes != 0:
-                        print(f"📝 {repair_func.__name__}: {abs(changes)} changes in {file_path.name}")
-                    content = new_content
-            
-            # If changes were made, write the file
-            if content != original_content:
-                # Create backup
-                self.backup_file(file_path)
-                
-                # Write repaired content
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                self.files_modified.append(file_path)
-                return True
-                
+            # Write repaired content
+            write_if_changed(file_path, repair.content)
+            self.backups.written(file_path, repair.content.encode('utf-8'))
         except Exception as e:
             print(f"❌ ERROR: Failed to repair {file_path}: {e}")
             return False
         
-        return False
+        self.files_modified.append(file_path)
+        return True
+    
+    def repair_file(self, file_path: Path) -> bool:
+        """Repair broken links in a single file"""
+        if not file_path.exists() or not file_path.name.endswith('.md'):
+            return False
+        return self.apply_repair(_rewrite_file((str(file_path), "Warp" in str(file_path))))
     
     def repair_directory(self, directory: Path) -> int:
-        """Repair all markdown files in a directory"""
+        """Repair all markdown files in a directory
+        
+        Files the ledger knows to be clean are skipped; the rest are rewritten
+        on the executor and then written back one at a time.
+        """
         if not directory.exists():
             print(f"⚠️  Directory not found: {directory}")
             return 0
         
+        tasks = []
+        for md_file in sorted(directory.rglob("*.md")):
+            if not md_file.is_file():
+                continue
+            if self.ledger.is_clean(md_file):
+                self.skipped_clean += 1
+                continue
+            tasks.append((str(md_file), "Warp" in str(md_file)))
+        
         repaired_count = 0
-        for md_file in directory.rglob("*.md"):
-            if md_file.is_file():
-                if self.repair_file(md_file):
-                    repaired_count += 1
+        for repair in self.executor.map_cpu(_rewrite_file, tasks):
+            if self.apply_repair(repair):
+                repaired_count += 1
         
         return repaired_count
     
+    def patch_set(self, output_format: str = 'diff') -> str:
+        """Pending dry-run repairs as a unified diff or a JSON patch set"""
+        if output_format == 'json':
+            patches = []
+            for repair in self.pending:
+                old_lines = repair.original.splitlines(keepends=True)
+                new_lines = repair.content.splitlines(keepends=True)
+                edits = []
+                matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                    if tag != 'equal':
+                        edits.append({'line': i1 + 1, 'old': old_lines[i1:i2], 'new': new_lines[j1:j2]})
+                patches.append({'file': self.relative(repair.path), 'changes': repair.changes, 'edits': edits})
+            return json.dumps({'files': patches}, indent=2, ensure_ascii=False) + "\n"
+        
+        chunks = []
+        for repair in self.pending:
+            relative = self.relative(repair.path)
+            chunks.extend(difflib.unified_diff(repair.original.splitlines(keepends=True),
+                                               repair.content.splitlines(keepends=True),
+                                               fromfile=f"a/{relative}", tofile=f"b/{relative}"))
+        return ''.join(chunk if chunk.endswith('\n') else chunk + "\n\\ No newline at end of file\n"
+                       for chunk in chunks)
+    
+    def relative(self, path: str) -> str:
+        try:
+            return str(Path(path).relative_to(self.base_path))
+        except ValueError:
+            return str(path)
+    
     def run_comprehensive_repair(self) -> bool:
         """Run comprehensive link repair across all documentation"""
         print("🔧 Starting Comprehensive Link Repair")
@@ -173,7 +334,11 @@ class LinkRepairer:
         print(f"🎉 REPAIR SUMMARY")
         print("=" * 50)
         print(f"📊 Total files repaired: {total_repaired}")
-        print(f"📝 Files modified: {len(self.files_modified)}")
+        print(f"⏭️  Known clean, skipped: {self.skipped_clean}")
+        if self.dry_run:
+            print(f"📝 Files that would be modified: {len(self.pending)} (dry run)")
+        else:
+            print(f"📝 Files modified: {len(self.files_modified)}")
         
         if self.files_modified:
             print("\n📋 Modified files:")
@@ -183,18 +348,58 @@ class LinkRepairer:
         return total_repaired > 0
 
 def main():
-    print("🚀 Warp Documentation Link Repair Tool")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description='Repair common broken wikilink patterns in the vault')
+    parser.add_argument('--base-path', default="/home/cinder/Documents/repos",
+                        help='Directory holding Warp, Twitch Docs and Repos Docs')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print the repairs instead of writing them (exit status 1 if any are pending)')
+    parser.add_argument('--format', choices=('diff', 'json'), default='diff',
+                        help='Dry-run output: unified diff or JSON patch set (default: diff)')
+    parser.add_argument('--output', help='Write the dry-run output to this file instead of stdout')
+    parser.add_argument('--ledger', default=str(DEFAULT_LEDGER_PATH),
+                        help=f'Ledger of files known to be clean (default: {DEFAULT_LEDGER_PATH})')
+    parser.add_argument('--no-ledger', action='store_true', help='Check every file, ignoring the ledger')
+    parser.add_argument('--backup-dir', default=str(DEFAULT_BACKUP_DIR),
+                        help=f'Backup store for the original files (default: {DEFAULT_BACKUP_DIR})')
+    parser.add_argument('--keep-backups', type=int, default=DEFAULT_KEEP_RUNS,
+                        help=f'Backup runs to keep after this one (default: {DEFAULT_KEEP_RUNS})')
+    add_executor_arguments(parser)
+    args = parser.parse_args()
     
-    repairer = LinkRepairer()
-    success = repairer.run_comprehensive_repair()
+    ledger = RepairLedger(None if args.no_ledger else args.ledger).load()
+    # A dry run's patch goes to stdout, so progress goes to stderr
+    progress = sys.stderr if args.dry_run and not args.output else sys.stdout
     
-    if success:
-        print("\n✅ Link repair completed successfully!")
-        print("🔍 Run qa_checks.py again to validate repairs")
-    else:
-        print("\n⚠️  No repairs needed or repair failed")
+    with executor_from_args(args) as executor, contextlib.redirect_stdout(progress):
+        print("🚀 Warp Documentation Link Repair Tool")
+        print("=" * 50)
+        
+        store = BackupStore(args.backup_dir)
+        backups = store.start_run('fix_broken_links')
+        repairer = LinkRepairer(args.base_path, dry_run=args.dry_run, ledger=ledger, executor=executor,
+                                backups=backups)
+        success = repairer.run_comprehensive_repair()
+        ledger.save()
+        
+        if backups.files:
+            store.gc(keep=args.keep_backups)
+            print(f"\n↩️  Undo this run with: python backup_store.py --dir '{store.root}' rollback {backups.run_id}")
+        
+        if args.dry_run:
+            print("\n🔍 Dry run: no files were written")
+        elif success:
+            print("\n✅ Link repair completed successfully!")
+            print("🔍 Run qa_checks.py again to validate repairs")
+        else:
+            print("\n⚠️  No repairs needed or repair failed")
     
+    if args.dry_run:
+        patch = repairer.patch_set(args.format)
+        if args.output:
+            write_if_changed(args.output, patch)
+        else:
+            sys.stdout.write(patch)
+        return 1 if repairer.pending else 0
     return 0
 
 if __name__ == "__main__":
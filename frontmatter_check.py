@@ -1,40 +1,33 @@
 #!/usr/bin/env python3
 
 import os
-import re
-import yaml
 import sys
-from pathlib import Path
+
+from vault_parser import load_document
 
 def check_frontmatter(file_path):
     """Check if YAML frontmatter in a markdown file is valid"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        document = load_document(file_path)
         
         # Check if file has frontmatter
-        if not content.startswith('---'):
+        if not document.has_frontmatter:
             return True  # No frontmatter is okay
             
-        # Extract frontmatter
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        if document.frontmatter_raw is None:
             print(f"❌ ERROR: Invalid frontmatter format in {file_path}")
             return False
             
-        frontmatter = parts[1].strip()
-        if not frontmatter:
+        if not document.frontmatter_raw.strip():
             return True  # Empty frontmatter is okay
             
-        # Try to parse YAML
-        try:
-            yaml.safe_load(frontmatter)
-            print(f"✅ YAML frontmatter valid in {file_path}")
-            return True
-        except yaml.YAMLError as e:
-            print(f"❌ ERROR: Invalid YAML frontmatter in {file_path}: {e}")
+        if document.frontmatter_error:
+            print(f"❌ ERROR: Invalid YAML frontmatter in {file_path}: {document.frontmatter_error}")
             return False
             
+        print(f"✅ YAML frontmatter valid in {file_path}")
+        return True
+            
     except Exception as e:
         print(f"❌ ERROR: Could not read {file_path}: {e}")
         return False
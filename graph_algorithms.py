@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Graph Algorithms for Component Connectivity Analysis
+
+Exact core membership for GraphTraversal.compute_connectivity. A component is
+core when it lies on a path between two major domains:
+
+• simple   - on some simple path (biconnected components + block-cut tree),
+             O(V + E)
+• shortest - on some shortest path (one BFS distance layer per domain),
+             O(k·(V + E) + k²·V) for k domains
+
+Adjacency is any mapping node -> iterable of neighbours and is treated as
+undirected by the callers, except for strongly_connected_components, which
+follows edges in their stored direction.
+"""
+
+import heapq
+import time
+from collections import defaultdict, deque
+from typing import Collection, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+CORE_MODES = ('simple', 'shortest')
+
+
+def bfs_distances(adjacency: Mapping, source: Hashable) -> Dict[Hashable, int]:
+    """Unweighted hop distance from source to every reachable node"""
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        next_distance = distances[node] + 1
+        for neighbor in adjacency.get(node, ()):
+            if neighbor not in distances:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+    return distances
+
+
+def shortest_path(adjacency: Mapping, source: Hashable, targets: Collection[Hashable],
+                  blocked_nodes: Collection[Hashable] = (), blocked_edges: Collection[Tuple] = ()) -> Optional[List[Hashable]]:
+    """One fewest-hop path from source to the nearest of targets, or None
+
+    BFS with parent pointers; the path is only materialised once a target
+    is reached. Targets are absorbing: a path never passes through one.
+    """
+    if source in targets:
+        return [source]
+    parents = {source: None}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor in adjacency.get(node, ()):
+            if neighbor in parents or neighbor in blocked_nodes or (node, neighbor) in blocked_edges:
+                continue
+            parents[neighbor] = node
+            if neighbor in targets:
+                path = [neighbor]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            queue.append(neighbor)
+    return None
+
+
+def shortest_simple_paths(adjacency: Mapping, source: Hashable, targets: Collection[Hashable],
+                          blocked_nodes: Collection[Hashable] = (),
+                          deadline: Optional[float] = None) -> Iterator[List[Hashable]]:
+    """Lazily yield simple paths from source to any of targets, fewest hops first (Yen)
+
+    Each new path deviates from an accepted one at a spur node, so a path
+    costs O(L·(V + E)) for path length L. Generation simply stops once
+    time.monotonic() passes deadline.
+    """
+    blocked_nodes = set(blocked_nodes)
+    first = shortest_path(adjacency, source, targets, blocked_nodes)
+    if first is None:
+        return
+    yield first
+
+    accepted = [first]
+    seen = {tuple(first)}
+    candidates = []
+    counter = 0
+    while True:
+        previous = accepted[-1]
+        for i in range(len(previous) - 1):
+            if deadline is not None and time.monotonic() > deadline:
+                return
+            root = previous[:i + 1]
+            # Edges already used to leave this root may not be reused
+            used_edges = {(path[i], path[i + 1]) for path in accepted
+                          if len(path) > i + 1 and path[:i + 1] == root}
+            spur = shortest_path(adjacency, previous[i], targets,
+                                 blocked_nodes.union(root[:-1]), used_edges)
+            if spur is None:
+                continue
+            path = root[:-1] + spur
+            key = tuple(path)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (len(path), counter, path))
+                counter += 1
+        if not candidates:
+            return
+        path = heapq.heappop(candidates)[2]
+        accepted.append(path)
+        yield path
+
+
+def paths_through(adjacency: Mapping, node: Hashable, terminals: Collection[Hashable],
+                  deadline: Optional[float] = None) -> Iterator[List[Hashable]]:
+    """Lazily yield simple paths terminal -> ... -> node -> ... -> other terminal
+
+    Each shortest simple path from node to a terminal (in Yen order) is
+    paired with the shortest path to a different terminal that avoids it.
+    """
+    terminals = set(terminals)
+    seen = set()
+    for first in shortest_simple_paths(adjacency, node, terminals, deadline=deadline):
+        if first[-1] == node:
+            continue
+        others = terminals - {first[-1]}
+        second = shortest_path(adjacency, node, others, blocked_nodes=set(first[1:]))
+        if second is None:
+            continue
+        path = second[::-1] + first[1:]
+        key = tuple(path)
+        if key not in seen and key[::-1] not in seen:
+            seen.add(key)
+            yield path
+
+
+def biconnected_components(adjacency: Mapping) -> List[Set[Hashable]]:
+    """Vertex sets of the biconnected components (blocks), iterative Hopcroft-Tarjan
+
+    Bridges form two-vertex blocks; isolated nodes belong to no block.
+    """
+    discovery: Dict[Hashable, int] = {}
+    low: Dict[Hashable, int] = {}
+    blocks = []
+    counter = 0
+
+    for root in adjacency:
+        if root in discovery:
+            continue
+        discovery[root] = low[root] = counter
+        counter += 1
+        edge_stack = []
+        stack = [(root, None, iter(adjacency.get(root, ())))]
+
+        while stack:
+            node, parent, neighbors = stack[-1]
+            advanced = False
+            for neighbor in neighbors:
+                if neighbor == node:
+                    continue
+                if neighbor not in discovery:
+                    discovery[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    edge_stack.append((node, neighbor))
+                    stack.append((neighbor, node, iter(adjacency.get(neighbor, ()))))
+                    advanced = True
+                    break
+                if neighbor != parent and discovery[neighbor] < discovery[node]:
+                    edge_stack.append((node, neighbor))
+                    low[node] = min(low[node], discovery[neighbor])
+            if advanced:
+                continue
+
+            stack.pop()
+            if parent is None:
+                continue
+            low[parent] = min(low[parent], low[node])
+            if low[node] >= discovery[parent]:
+                # parent separates node's subtree: pop one block
+                block = set()
+                while edge_stack:
+                    u, v = edge_stack.pop()
+                    block.add(u)
+                    block.add(v)
+                    if (u, v) == (parent, node):
+                        break
+                blocks.append(block)
+
+    return blocks
+
+
+def simple_path_core(adjacency: Mapping, terminals: Iterable[Hashable]) -> Set[Hashable]:
+    """Nodes on at least one simple path between two distinct terminals
+
+    Every vertex of a block lies on a simple path between any two other
+    vertices of that block, so the answer is the union of the blocks (and
+    cut vertices) on the Steiner subtree spanning the terminals in the
+    block-cut tree.
+    """
+    terminals = {t for t in terminals if t in adjacency}
+    blocks = biconnected_components(adjacency)
+
+    membership = defaultdict(list)
+    for index, block in enumerate(blocks):
+        for node in block:
+            membership[node].append(index)
+    cut_vertices = {node for node, owners in membership.items() if len(owners) > 1}
+
+    # Block-cut tree: ('B', i) block nodes and ('C', v) cut-vertex nodes
+    tree = defaultdict(set)
+    for node in cut_vertices:
+        for index in membership[node]:
+            tree[('B', index)].add(('C', node))
+            tree[('C', node)].add(('B', index))
+    for index in range(len(blocks)):
+        tree.setdefault(('B', index), set())
+
+    weight = defaultdict(int)
+    for terminal in terminals:
+        if terminal in cut_vertices:
+            weight[('C', terminal)] += 1
+        elif terminal in membership:
+            weight[('B', membership[terminal][0])] += 1
+
+    # Drop tree components holding fewer than two terminals
+    alive = set()
+    seen = set()
+    for start in tree:
+        if start in seen:
+            continue
+        component = [start]
+        seen.add(start)
+        for tree_node in component:
+            for neighbor in tree[tree_node]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    component.append(neighbor)
+        if sum(weight[tree_node] for tree_node in component) >= 2:
+            alive.update(component)
+
+    # Prune terminal-free leaves until only the Steiner subtree remains
+    degree = {tree_node: len(tree[tree_node] & alive) for tree_node in alive}
+    leaves = deque(tree_node for tree_node in alive if degree[tree_node] <= 1 and not weight[tree_node])
+    while leaves:
+        tree_node = leaves.popleft()
+        if tree_node not in alive:
+            continue
+        alive.discard(tree_node)
+        for neighbor in tree[tree_node]:
+            if neighbor in alive:
+                degree[neighbor] -= 1
+                if degree[neighbor] <= 1 and not weight[neighbor]:
+                    leaves.append(neighbor)
+
+    core = set()
+    for kind, value in alive:
+        if kind == 'B':
+            core.update(blocks[value])
+        else:
+            core.add(value)
+    return core
+
+
+def shortest_path_core(adjacency: Mapping, terminals: Iterable[Hashable]) -> Set[Hashable]:
+    """Nodes on at least one shortest path between two distinct terminals"""
+    terminals = sorted((t for t in terminals if t in adjacency), key=str)
+    layers = {terminal: bfs_distances(adjacency, terminal) for terminal in terminals}
+
+    core = set()
+    for i, first in enumerate(terminals):
+        first_layer = layers[first]
+        for second in terminals[i + 1:]:
+            if second not in first_layer:
+                continue
+            length = first_layer[second]
+            second_layer = layers[second]
+            for node, distance in first_layer.items():
+                if distance <= length and second_layer.get(node, length + 1) + distance == length:
+                    core.add(node)
+    return core
+
+
+def strongly_connected_components(adjacency: Mapping) -> List[List[Hashable]]:
+    """Strongly connected components of a directed graph, iterative Tarjan, O(V + E)
+
+    Components come out in reverse topological order: every edge leaving a
+    component points at one listed before it.
+    """
+    index: Dict[Hashable, int] = {}
+    low: Dict[Hashable, int] = {}
+    on_stack: Set[Hashable] = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            advanced = False
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(adjacency.get(neighbor, ()))))
+                    advanced = True
+                    break
+                if neighbor in on_stack and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                # node is the root of a component: pop it off the stack
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def condensation(adjacency: Mapping) -> Tuple[List[List[Hashable]], Dict[Hashable, int], List[Set[int]]]:
+    """Condense a directed graph into the DAG of its strongly connected components
+
+    Returns (components, component_of, successors). Components are in
+    reverse topological order, so successors[c] only holds indexes below c.
+    """
+    components = strongly_connected_components(adjacency)
+    component_of = {}
+    for component, members in enumerate(components):
+        for node in members:
+            component_of[node] = component
+
+    successors: List[Set[int]] = [set() for _ in components]
+    for node in adjacency:
+        source = component_of[node]
+        for neighbor in adjacency.get(node, ()):
+            target = component_of[neighbor]
+            if target != source:
+                successors[source].add(target)
+    return components, component_of, successors
+
+
+def dag_layers(successors: List[Set[int]]) -> List[int]:
+    """Layer of every condensation node: the longest edge count down to a sink
+
+    Sinks are layer 0, so layers give a valid bottom-up processing order.
+    Relies on the reverse topological numbering produced by condensation.
+    """
+    layers = [0] * len(successors)
+    for component, targets in enumerate(successors):
+        if targets:
+            layers[component] = 1 + max(layers[target] for target in targets)
+    return layers
+
+
+def longest_chain(successors: List[Set[int]], sources: Optional[Iterable[int]] = None) -> List[int]:
+    """Condensation nodes along one longest path, from its source to its sink
+
+    The path starts at one of sources (default: any condensation node).
+    """
+    candidates = range(len(successors)) if sources is None else list(sources)
+    if not candidates:
+        return []
+    layers = dag_layers(successors)
+    component = max(candidates, key=lambda c: (layers[c], -c))
+    chain = [component]
+    while successors[component]:
+        component = max(successors[component], key=lambda c: (layers[c], -c))
+        chain.append(component)
+    return chain
+
+
+def core_components(adjacency: Mapping, terminals: Iterable[Hashable], mode: str = 'simple') -> Set[Hashable]:
+    """Core membership using the requested path semantics"""
+    if mode == 'simple':
+        return simple_path_core(adjacency, terminals)
+    if mode == 'shortest':
+        return shortest_path_core(adjacency, terminals)
+    raise ValueError(f"Unknown core mode '{mode}', expected one of {CORE_MODES}")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Structural Diff Between Connectivity Runs
+
+Compares the graph and classification of the previous graph_traversal.py
+run (kept as a binary snapshot with the classes and cycles annotated) with
+the current one. Components and edges are compared as hashed name keys, so
+the diff is a handful of set differences instead of a Coverage.md review.
+
+• added / removed components and edges ("a -- b" undirected, "a --> b" Mermaid)
+• components that moved between core, peripheral and disconnected
+• dependency cycles that appeared or were resolved
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+from graph_store import GraphStore
+
+CLASSES = ('core', 'peripheral', 'disconnected')
+
+
+def edge_keys(store: GraphStore) -> Set[str]:
+    """Name-keyed edge set: 'a -- b' (sorted) for undirected, 'a --> b' for Mermaid edges"""
+    names = store.names
+    keys = set()
+    for u, v in store.undirected_edges:
+        a, b = sorted((names[u], names[v]))
+        keys.add(f"{a} -- {b}")
+    for u, v in store.directed_edges:
+        keys.add(f"{names[u]} --> {names[v]}")
+    return keys
+
+
+def classify(core: Iterable[str], peripheral: Iterable[str], disconnected: Iterable[str]) -> Dict[str, str]:
+    """Component -> 'core' / 'peripheral' / 'disconnected'"""
+    classes = {}
+    for name, members in zip(CLASSES, (core, peripheral, disconnected)):
+        for component in members:
+            classes[component] = name
+    return classes
+
+
+@dataclass
+class GraphDiff:
+    """Differences between two connectivity runs"""
+    added_components: List[str] = field(default_factory=list)
+    removed_components: List[str] = field(default_factory=list)
+    added_edges: List[str] = field(default_factory=list)
+    removed_edges: List[str] = field(default_factory=list)
+    class_changes: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # component -> (old, new)
+    new_cycles: List[List[str]] = field(default_factory=list)
+    resolved_cycles: List[List[str]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added_components or self.removed_components or self.added_edges
+                    or self.removed_edges or self.class_changes or self.new_cycles or self.resolved_cycles)
+
+    def to_dict(self) -> Dict:
+        return {'components': {'added': self.added_components, 'removed': self.removed_components},
+                'edges': {'added': self.added_edges, 'removed': self.removed_edges},
+                'class_changes': {component: {'from': old, 'to': new}
+                                  for component, (old, new) in self.class_changes.items()},
+                'cycles': {'new': self.new_cycles, 'resolved': self.resolved_cycles}}
+
+    def markdown_lines(self, limit: int = 50) -> List[str]:
+        """Markdown summary, listing at most limit items per category"""
+        lines = [f"- Components: +{len(self.added_components)} / -{len(self.removed_components)}\n",
+                 f"- Edges: +{len(self.added_edges)} / -{len(self.removed_edges)}\n",
+                 f"- Class changes: {len(self.class_changes)}\n",
+                 f"- New dependency cycles: {len(self.new_cycles)} "
+                 f"(resolved: {len(self.resolved_cycles)})\n", "\n"]
+
+        def section(title, items):
+            if not items:
+                return
+            lines.append(f"### {title}\n\n")
+            for item in items[:limit]:
+                lines.append(f"- {item}\n")
+            if len(items) > limit:
+                lines.append(f"- ... and {len(items) - limit} more (see the JSON changelog)\n")
+            lines.append("\n")
+
+        section("Added Components", self.added_components)
+        section("Removed Components", self.removed_components)
+        section("Class Changes", [f"{component}: {old} → {new}"
+                                  for component, (old, new) in sorted(self.class_changes.items())])
+        section("New Dependency Cycles", [", ".join(cycle) for cycle in self.new_cycles])
+        section("Resolved Dependency Cycles", [", ".join(cycle) for cycle in self.resolved_cycles])
+        section("Added Edges", self.added_edges)
+        section("Removed Edges", self.removed_edges)
+        return lines
+
+
+def diff_runs(old_store: GraphStore, old_classes: Dict[str, str], old_cycles: Iterable[Iterable[str]],
+              new_store: GraphStore, new_classes: Dict[str, str],
+              new_cycles: Iterable[Iterable[str]]) -> GraphDiff:
+    """Diff two runs given each run's graph, component classes and dependency cycles"""
+    old_components, new_components = set(old_store.names), set(new_store.names)
+    old_edges, new_edges = edge_keys(old_store), edge_keys(new_store)
+    old_cycle_keys = {frozenset(cycle) for cycle in old_cycles}
+    new_cycle_keys = {frozenset(cycle) for cycle in new_cycles}
+
+    class_changes = {}
+    for component in sorted(old_components & new_components):
+        old_class, new_class = old_classes.get(component), new_classes.get(component)
+        if old_class and new_class and old_class != new_class:
+            class_changes[component] = (old_class, new_class)
+
+    return GraphDiff(added_components=sorted(new_components - old_components),
+                     removed_components=sorted(old_components - new_components),
+                     added_edges=sorted(new_edges - old_edges),
+                     removed_edges=sorted(old_edges - new_edges),
+                     class_changes=class_changes,
+                     new_cycles=sorted(sorted(cycle) for cycle in new_cycle_keys - old_cycle_keys),
+                     resolved_cycles=sorted(sorted(cycle) for cycle in old_cycle_keys - new_cycle_keys))
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Incremental Connectivity for GraphTraversal
+
+A disjoint-set (union-find) over component names, persisted between runs in
+.scripts/cache/connectivity_state.json together with the edges every
+Coverage.md / Index.md contributed and that file's fingerprint.
+
+• Unchanged source files are replayed from the state without parsing.
+• A changed file only re-applies its own edges: new edges are unions.
+• An edge no other file still provides triggers a rebuild of just the
+  connected component that held it, not of the whole graph.
+• The core/peripheral classification of each set holding a major domain
+  is stored too and reused while no node of that set changed; every
+  other set is disconnected without any traversal.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from graph_store import GraphContribution
+
+STATE_VERSION = 2
+DEFAULT_STATE_PATH = Path(__file__).resolve().parent / ".scripts" / "cache" / "connectivity_state.json"
+
+
+def file_fingerprint(path: Union[str, Path], previous: Optional[Dict] = None) -> Optional[Dict]:
+    """(mtime, size, sha1) of a file; the hash is reused while the stat is unchanged"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if previous and previous.get('mtime_ns') == stat.st_mtime_ns and previous.get('size') == stat.st_size:
+        return previous
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': digest}
+
+
+class DisjointSet:
+    """Union-find with union by size, path halving and member lists per root"""
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.members: Dict[str, List[str]] = {}
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.parent
+
+    def add(self, node: str) -> None:
+        if node not in self.parent:
+            self.parent[node] = node
+            self.members[node] = [node]
+
+    def find(self, node: str) -> str:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: str, b: str) -> str:
+        self.add(a)
+        self.add(b)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if len(self.members[root_a]) < len(self.members[root_b]):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.members[root_a].extend(self.members.pop(root_b))
+        return root_a
+
+    def connected(self, a: str, b: str) -> bool:
+        return a in self.parent and b in self.parent and self.find(a) == self.find(b)
+
+    def split(self, root: str) -> List[str]:
+        """Detach every member of root's set into a singleton and return them"""
+        nodes = self.members.pop(root)
+        for node in nodes:
+            self.parent[node] = node
+            self.members[node] = [node]
+        return nodes
+
+    def discard(self, node: str) -> None:
+        """Remove a singleton node"""
+        if node in self.parent and self.parent[node] == node and self.members.get(node) == [node]:
+            del self.parent[node]
+            del self.members[node]
+
+
+class IncrementalConnectivity:
+    """Persisted union-find plus per-file edge contributions"""
+
+    def __init__(self, state_path: Optional[Union[str, Path]] = DEFAULT_STATE_PATH):
+        self.state_path = Path(state_path) if state_path else None
+        self.files: Dict[str, Dict] = {}
+        self.sets = DisjointSet()
+        self.edge_refs: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.node_refs: Dict[str, int] = defaultdict(int)
+        self.adjacency: Dict[str, Set[str]] = defaultdict(set)
+        self.rebuilt_nodes = 0
+        self.changed: Set[str] = set()  # Nodes whose set gained or lost a node or edge since the classification
+        self.classification: Dict = {'options': None, 'sets': {}}
+        if self.state_path:
+            self.load()
+
+    @staticmethod
+    def _edge_key(a: str, b: str) -> Tuple[str, str]:
+        return (a, b) if a <= b else (b, a)
+
+    @staticmethod
+    def _contribution_edges(contribution: GraphContribution) -> Set[Tuple[str, str]]:
+        """Every edge of a contribution as an undirected key (Mermaid edges included)"""
+        edges = set()
+        for a, b in list(contribution.edges) + list(contribution.directed):
+            if a != b:
+                edges.add(IncrementalConnectivity._edge_key(a, b))
+        return edges
+
+    @staticmethod
+    def _contribution_nodes(contribution: GraphContribution) -> Set[str]:
+        nodes = set(contribution.nodes)
+        for a, b in list(contribution.edges) + list(contribution.directed):
+            nodes.add(a)
+            nodes.add(b)
+        return nodes
+
+    def load(self) -> None:
+        """Load persisted state; anything unreadable or from another version starts fresh"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != STATE_VERSION:
+            return
+
+        self.files = data.get('files', {})
+        self.classification = data.get('classification') or self.classification
+        for entry in self.files.values():
+            contribution = GraphContribution.from_dict(entry['contribution'])
+            for node in self._contribution_nodes(contribution):
+                self.node_refs[node] += 1
+            for a, b in self._contribution_edges(contribution):
+                self.edge_refs[(a, b)] += 1
+                self.adjacency[a].add(b)
+                self.adjacency[b].add(a)
+
+        # Restore the union-find from the persisted node -> root map
+        roots = data.get('roots', {})
+        if set(roots) != set(self.node_refs):
+            self._rebuild_all()
+            self.classification = {'options': None, 'sets': {}}
+            return
+        for node, root in roots.items():
+            self.sets.parent[node] = root
+            self.sets.members.setdefault(root, []).append(node)
+
+    def _rebuild_all(self) -> None:
+        """Recompute the union-find from the recorded edges"""
+        self.sets = DisjointSet()
+        for node in self.node_refs:
+            self.sets.add(node)
+        for a, b in self.edge_refs:
+            self.sets.union(a, b)
+
+    def save(self) -> None:
+        """Persist contributions, fingerprints and the union-find atomically"""
+        if not self.state_path:
+            return
+        roots = {node: self.sets.find(node) for node in self.sets.parent}
+        # Classifications of sets that changed after they were computed are stale
+        dirty = self.dirty_roots()
+        classification = {'options': self.classification['options'],
+                          'sets': {root: entry for root, entry in self.classification['sets'].items()
+                                   if roots.get(root) == root and root not in dirty}}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'files': self.files, 'roots': roots,
+                       'classification': classification}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.state_path)
+
+    def cached_contribution(self, path: str) -> Optional[GraphContribution]:
+        """The recorded contribution of path if the file is unchanged since it was parsed"""
+        entry = self.files.get(path)
+        if not entry or not entry.get('fingerprint'):
+            return None
+        fingerprint = file_fingerprint(path, entry['fingerprint'])
+        if fingerprint is None or fingerprint.get('sha1') != entry['fingerprint'].get('sha1'):
+            return None
+        entry['fingerprint'] = fingerprint
+        return GraphContribution.from_dict(entry['contribution'])
+
+    def apply_file(self, path: str, contribution: GraphContribution, fingerprint: Optional[Dict] = None) -> None:
+        """Replace path's contribution, updating the union-find locally"""
+        previous = self.files.get(path)
+        old = GraphContribution.from_dict(previous['contribution']) if previous else GraphContribution()
+        old_edges, new_edges = self._contribution_edges(old), self._contribution_edges(contribution)
+        old_nodes, new_nodes = self._contribution_nodes(old), self._contribution_nodes(contribution)
+
+        self.files[path] = {'fingerprint': fingerprint, 'contribution': contribution.to_dict()}
+        if old_edges == new_edges and old_nodes == new_nodes:
+            return
+
+        for node in new_nodes - old_nodes:
+            self.node_refs[node] += 1
+            self.sets.add(node)
+            self.changed.add(node)
+
+        dirty_roots = set()
+        for a, b in old_edges - new_edges:
+            key = (a, b)
+            self.edge_refs[key] -= 1
+            if self.edge_refs[key] <= 0:
+                del self.edge_refs[key]
+                self.adjacency[a].discard(b)
+                self.adjacency[b].discard(a)
+                self.changed.update(key)
+                dirty_roots.add(self.sets.find(a))
+
+        for a, b in new_edges - old_edges:
+            key = (a, b)
+            self.edge_refs[key] += 1
+            if self.edge_refs[key] == 1:
+                self.adjacency[a].add(b)
+                self.adjacency[b].add(a)
+                self.changed.update(key)
+                if not any(self.sets.find(a) == root or self.sets.find(b) == root for root in dirty_roots):
+                    self.sets.union(a, b)
+
+        for node in old_nodes - new_nodes:
+            self.node_refs[node] -= 1
+            if self.node_refs[node] <= 0:
+                del self.node_refs[node]
+                self.changed.add(node)
+                dirty_roots.add(self.sets.find(node))
+
+        self._rebuild(dirty_roots)
+
+    def remove_file(self, path: str) -> None:
+        """Drop the contribution of a source file that no longer exists"""
+        if path in self.files:
+            self.apply_file(path, GraphContribution())
+            del self.files[path]
+
+    def retain_files(self, paths: Iterable[str]) -> None:
+        """Remove contributions of every recorded file not in paths"""
+        keep = set(paths)
+        for path in [path for path in self.files if path not in keep]:
+            self.remove_file(path)
+
+    def _rebuild(self, roots: Set[str]) -> None:
+        """Recompute only the sets that lost an edge or node, by BFS over live edges"""
+        roots = {self.sets.find(root) for root in roots if root in self.sets}
+        nodes = []
+        for root in roots:
+            nodes.extend(self.sets.split(root))
+        self.rebuilt_nodes += len(nodes)
+        self.changed.update(nodes)
+
+        for node in nodes:
+            if node not in self.node_refs and not self.adjacency.get(node):
+                self.adjacency.pop(node, None)
+                self.sets.discard(node)
+
+        for node in nodes:
+            if node not in self.sets:
+                continue
+            for neighbor in self.adjacency.get(node, ()):
+                self.sets.union(node, neighbor)
+
+    def connected(self, a: str, b: str) -> bool:
+        """Whether two components are in the same connected component"""
+        return self.sets.connected(a, b)
+
+    def detached_components(self, anchors: Iterable[str]) -> Set[str]:
+        """Components with no path at all to any of the anchors (e.g. major domains)"""
+        anchor_roots = {self.sets.find(anchor) for anchor in anchors if anchor in self.sets}
+        return {node for node in self.sets.parent if self.sets.find(node) not in anchor_roots}
+
+    def dirty_roots(self) -> Set[str]:
+        """Roots of the sets that changed since the classification was recorded"""
+        return {self.sets.find(node) for node in self.changed if node in self.sets}
+
+    def anchor_sets(self, anchors: Iterable[str]) -> Dict[str, List[str]]:
+        """Root -> members of every set holding at least one anchor"""
+        roots = {self.sets.find(anchor) for anchor in anchors if anchor in self.sets}
+        return {root: self.sets.members[root] for root in roots}
+
+    def cached_classification(self, options: Dict) -> Dict[str, Dict]:
+        """Root -> {'core': [...], 'peripheral': [...]} of unchanged sets classified with options"""
+        if self.classification['options'] != options:
+            return {}
+        dirty = self.dirty_roots()
+        return {root: entry for root, entry in self.classification['sets'].items()
+                if root in self.sets and self.sets.find(root) == root and root not in dirty}
+
+    def record_classification(self, options: Dict, sets: Dict[str, Dict]) -> None:
+        """Remember the classification of the current sets, which are now clean"""
+        self.classification = {'options': options, 'sets': sets}
+        self.changed.clear()
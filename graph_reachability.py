@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Reachability Index for the Component Graph
+
+Answers "what does X transitively depend on?" (descendants) and "what is
+affected if X changes?" (ancestors) without a graph search per question.
+
+The directed graph is condensed into its strongly connected components,
+which form a DAG. Each component then gets its full descendant and ancestor
+sets as Python int bitsets, filled in one pass over the DAG in topological
+order. A query is two array lookups plus decoding the set bits.
+"""
+
+from array import array
+from typing import Iterable, List, Set
+
+from graph_algorithms import condensation
+from graph_store import CSRGraph, GraphStore
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Positions of the set bits of mask"""
+    text = bin(mask)[:1:-1]  # least significant bit first, without '0b'
+    position = text.find('1')
+    while position >= 0:
+        yield position
+        position = text.find('1', position + 1)
+
+
+class ReachabilityIndex:
+    """SCC condensation plus bitset transitive closure over a directed CSR graph"""
+
+    def __init__(self, graph: CSRGraph):
+        self.graph = graph
+        # Tarjan emits components in reverse topological order, so every
+        # successor of component c has a smaller index than c
+        self.components, component_of, self.successors = condensation(graph)
+        self.component_of = array('i', [0] * len(graph))
+        for node, component in component_of.items():
+            self.component_of[node] = component
+        successors = self.successors
+        count = len(self.components)
+
+        self.descendant_bits: List[int] = [0] * count
+        for component in range(count):
+            mask = 0
+            for target in successors[component]:
+                mask |= self.descendant_bits[target] | (1 << target)
+            self.descendant_bits[component] = mask
+
+        self.ancestor_bits: List[int] = [0] * count
+        for component in range(count - 1, -1, -1):
+            bit = 1 << component
+            for target in successors[component]:
+                self.ancestor_bits[target] |= self.ancestor_bits[component] | bit
+
+    @classmethod
+    def from_store(cls, store: GraphStore, include_undirected: bool = False) -> "ReachabilityIndex":
+        """Index over the directed Mermaid edges; include_undirected adds backlink
+        and domain edges in both directions, but never the synthetic domain mesh"""
+        view = 'forward' if include_undirected else 'out'
+        return cls(store.freeze(view, include_synthetic=False))
+
+    def _expand(self, mask: int) -> Set[int]:
+        nodes = set()
+        for component in _bits(mask):
+            nodes.update(self.components[component])
+        return nodes
+
+    def descendants(self, node: int) -> Set[int]:
+        """Nodes reachable from node, excluding node itself"""
+        component = self.component_of[node]
+        nodes = self._expand(self.descendant_bits[component])
+        nodes.update(self.components[component])
+        nodes.discard(node)
+        return nodes
+
+    def ancestors(self, node: int) -> Set[int]:
+        """Nodes that can reach node, excluding node itself"""
+        component = self.component_of[node]
+        nodes = self._expand(self.ancestor_bits[component])
+        nodes.update(self.components[component])
+        nodes.discard(node)
+        return nodes
+
+    def reaches(self, source: int, target: int) -> bool:
+        """Whether a directed path leads from source to target"""
+        source_component = self.component_of[source]
+        target_component = self.component_of[target]
+        return (source_component == target_component
+                or bool(self.descendant_bits[source_component] >> target_component & 1))
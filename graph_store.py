@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Compact Component Graph Store
+
+Interns component names to integer IDs, deduplicates edges as they are
+added and freezes into CSR (compressed sparse row) adjacency backed by
+array('i'): one offsets array plus one neighbours array per view.
+
+Edges are tracked by kind:
+• undirected - Coverage.md backlinks and domain membership
+• directed   - Mermaid "A --> B" edges from Index.md
+• synthetic  - the assumed all-pairs mesh between MAJOR_DOMAINS
+
+A store can be written to a compact binary snapshot (interned names, edge
+arrays, domain tags and the fingerprints of the files it was built from)
+so tools can load the graph without importing any Markdown parsing.
+"""
+
+import os
+import sys
+import json
+import struct
+from array import array
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+SNAPSHOT_MAGIC = b'WGRAPH'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<6sHI')  # magic, version, metadata length
+
+
+@dataclass
+class GraphContribution:
+    """Nodes and edges contributed by one source file (or the synthetic mesh)"""
+    nodes: List[str] = field(default_factory=list)
+    edges: List[Tuple[str, str]] = field(default_factory=list)
+    directed: List[Tuple[str, str]] = field(default_factory=list)
+    synthetic: bool = False
+    docs: Dict[str, str] = field(default_factory=dict)  # component -> Doc File cell
+
+    def to_dict(self) -> Dict:
+        return {'nodes': self.nodes, 'edges': [list(e) for e in self.edges],
+                'directed': [list(e) for e in self.directed], 'synthetic': self.synthetic,
+                'docs': self.docs}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GraphContribution":
+        return cls(nodes=list(data.get('nodes', [])),
+                   edges=[tuple(e) for e in data.get('edges', [])],
+                   directed=[tuple(e) for e in data.get('directed', [])],
+                   synthetic=bool(data.get('synthetic', False)),
+                   docs=dict(data.get('docs', {})))
+
+
+class CSRGraph:
+    """Frozen adjacency: neighbours of node i are neighbors[offsets[i]:offsets[i + 1]]
+
+    Also behaves like a read-only mapping of node ID -> neighbour IDs so the
+    functions in graph_algorithms accept it directly.
+    """
+
+    def __init__(self, offsets: array, neighbors: array):
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @classmethod
+    def from_edges(cls, node_count: int, edges: Iterable[Tuple[int, int]]) -> "CSRGraph":
+        """Build CSR arrays from (source, target) pairs; neighbour lists come out sorted"""
+        edges = sorted(edges)
+        offsets = array('i', [0] * (node_count + 1))
+        for source, _ in edges:
+            offsets[source + 1] += 1
+        for i in range(node_count):
+            offsets[i + 1] += offsets[i]
+        neighbors = array('i', (target for _, target in edges))
+        return cls(offsets, neighbors)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
+
+    def __contains__(self, node) -> bool:
+        return isinstance(node, int) and 0 <= node < len(self)
+
+    def __getitem__(self, node: int) -> array:
+        return self.neighbors[self.offsets[node]:self.offsets[node + 1]]
+
+    def get(self, node: int, default=()):
+        """Neighbours of node, or default for an unknown ID"""
+        return self[node] if node in self else default
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    @property
+    def edge_count(self) -> int:
+        """Number of stored (directed) adjacency entries"""
+        return len(self.neighbors)
+
+
+class GraphStore:
+    """Interned, deduplicated component graph with separate edge kinds"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.undirected_edges: Set[Tuple[int, int]] = set()  # stored as (low, high)
+        self.directed_edges: Set[Tuple[int, int]] = set()
+        self.synthetic_edges: Set[Tuple[int, int]] = set()  # subset of undirected_edges
+        self._frozen: Dict[Tuple[str, bool], CSRGraph] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def intern(self, name: str) -> int:
+        """Return the integer ID of a component, assigning one on first sight"""
+        node = self.ids.get(name)
+        if node is None:
+            node = len(self.names)
+            self.ids[name] = node
+            self.names.append(name)
+            self._frozen.clear()
+        return node
+
+    def add_edge(self, a: str, b: str, synthetic: bool = False) -> None:
+        """Add an undirected edge (duplicates and self-loops are ignored)"""
+        u, v = self.intern(a), self.intern(b)
+        if u == v:
+            return
+        edge = (u, v) if u < v else (v, u)
+        is_new = edge not in self.undirected_edges
+        if is_new:
+            self.undirected_edges.add(edge)
+            self._frozen.clear()
+        if not synthetic:
+            if edge in self.synthetic_edges:
+                self.synthetic_edges.discard(edge)  # now backed by real evidence
+                self._frozen.clear()
+        elif is_new:
+            self.synthetic_edges.add(edge)
+
+    def add_directed_edge(self, source: str, target: str) -> None:
+        """Add a directed dependency edge (duplicates and self-loops are ignored)"""
+        u, v = self.intern(source), self.intern(target)
+        if u != v and (u, v) not in self.directed_edges:
+            self.directed_edges.add((u, v))
+            self._frozen.clear()
+
+    def apply(self, contribution: GraphContribution) -> None:
+        """Add every node and edge of a source file's contribution"""
+        for name in contribution.nodes:
+            self.intern(name)
+        for a, b in contribution.edges:
+            self.add_edge(a, b, synthetic=contribution.synthetic)
+        for source, target in contribution.directed:
+            self.add_directed_edge(source, target)
+
+    @property
+    def edge_count(self) -> int:
+        """Distinct undirected plus directed edges"""
+        return len(self.undirected_edges) + len(self.directed_edges)
+
+    def freeze(self, view: str = 'undirected', include_synthetic: bool = True) -> CSRGraph:
+        """Freeze one adjacency view into CSR arrays (memoised until the graph changes)
+
+        Views: 'undirected' (every edge in both directions, Mermaid edges
+        included), 'forward' (undirected edges both ways, Mermaid edges in
+        their own direction), 'out' (directed edges only) and 'in' (reversed
+        directed edges).
+        """
+        key = (view, include_synthetic)
+        frozen = self._frozen.get(key)
+        if frozen is not None:
+            return frozen
+
+        if view in ('undirected', 'forward'):
+            edges = set()
+            for u, v in self.undirected_edges:
+                if include_synthetic or (u, v) not in self.synthetic_edges:
+                    edges.add((u, v))
+                    edges.add((v, u))
+            for u, v in self.directed_edges:
+                edges.add((u, v))
+                if view == 'undirected':
+                    edges.add((v, u))
+        elif view == 'out':
+            edges = self.directed_edges
+        elif view == 'in':
+            edges = {(v, u) for u, v in self.directed_edges}
+        else:
+            raise ValueError(f"Unknown graph view '{view}'")
+
+        frozen = CSRGraph.from_edges(len(self.names), edges)
+        self._frozen[key] = frozen
+        return frozen
+
+    def to_ids(self, names: Iterable[str]) -> Set[int]:
+        """IDs of the given names that exist in the store"""
+        return {self.ids[name] for name in names if name in self.ids}
+
+    def to_names(self, nodes: Iterable[int]) -> Set[str]:
+        """Names of the given IDs"""
+        return {self.names[node] for node in nodes}
+
+    def adjacency_lists(self) -> Dict[str, List[str]]:
+        """Name-keyed adjacency of undirected edges (both ways) plus directed out-edges"""
+        adjacency: Dict[str, List[str]] = {name: [] for name in self.names}
+        for u, v in sorted(self.undirected_edges):
+            adjacency[self.names[u]].append(self.names[v])
+            adjacency[self.names[v]].append(self.names[u])
+        for u, v in sorted(self.directed_edges):
+            adjacency[self.names[u]].append(self.names[v])
+        return adjacency
+
+    def lookup(self, name: str) -> Optional[int]:
+        """ID of a component name, None if unknown"""
+        return self.ids.get(name)
+
+
+@dataclass
+class GraphSnapshot:
+    """A loaded snapshot: the graph plus what it was built from"""
+    store: GraphStore
+    domains: Set[str] = field(default_factory=set)
+    sources: Dict[str, Dict] = field(default_factory=dict)  # path -> fingerprint
+    annotations: Dict = field(default_factory=dict)  # JSON-safe results stored with the graph
+
+
+def _pack_edges(edges: Iterable[Tuple[int, int]]) -> array:
+    """Flatten sorted (u, v) pairs into one little-endian int array"""
+    flat = array('i')
+    for u, v in sorted(edges):
+        flat.append(u)
+        flat.append(v)
+    if sys.byteorder != 'little':
+        flat.byteswap()
+    return flat
+
+
+def _unpack_edges(data: bytes) -> Set[Tuple[int, int]]:
+    flat = array('i')
+    flat.frombytes(data)
+    if len(flat) % 2:
+        raise ValueError("edge array has an odd number of IDs")
+    if sys.byteorder != 'little':
+        flat.byteswap()
+    return set(zip(flat[0::2], flat[1::2]))
+
+
+def save_snapshot(store: GraphStore, path: Union[str, Path], domains: Iterable[str] = (),
+                  sources: Optional[Dict[str, Dict]] = None, annotations: Optional[Dict] = None) -> None:
+    """Write store to a binary snapshot atomically
+
+    Layout: header, JSON metadata (section sizes, fingerprints, annotations), then the
+    NUL-separated names and the undirected, synthetic, directed and domain
+    int arrays.
+    """
+    names = '\0'.join(store.names).encode('utf-8')
+    domain_ids = array('i', sorted(store.to_ids(domains)))
+    if sys.byteorder != 'little':
+        domain_ids.byteswap()
+    sections = [names,
+                _pack_edges(store.undirected_edges).tobytes(),
+                _pack_edges(store.synthetic_edges).tobytes(),
+                _pack_edges(store.directed_edges).tobytes(),
+                domain_ids.tobytes()]
+    metadata = json.dumps({'nodes': len(store.names),
+                           'sections': [len(section) for section in sections],
+                           'sources': sources or {},
+                           'annotations': annotations or {}},
+                          ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(metadata)))
+        f.write(metadata)
+        for section in sections:
+            f.write(section)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: Union[str, Path]) -> Optional[GraphSnapshot]:
+    """Read a snapshot written by save_snapshot; None if missing, stale format or corrupt"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _SNAPSHOT_HEADER.size:
+        return None
+    magic, version, metadata_length = _SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+
+    offset = _SNAPSHOT_HEADER.size
+    try:
+        metadata = json.loads(data[offset:offset + metadata_length].decode('utf-8'))
+        offset += metadata_length
+        sections = []
+        for size in metadata['sections']:
+            sections.append(data[offset:offset + size])
+            offset += size
+        if offset != len(data) or len(sections) != 5:
+            return None
+        names_blob, undirected, synthetic, directed, domain_blob = sections
+
+        store = GraphStore()
+        store.names = names_blob.decode('utf-8').split('\0') if metadata['nodes'] else []
+        if len(store.names) != metadata['nodes']:
+            return None
+        store.ids = {name: node for node, name in enumerate(store.names)}
+        store.undirected_edges = _unpack_edges(undirected)
+        store.synthetic_edges = _unpack_edges(synthetic)
+        store.directed_edges = _unpack_edges(directed)
+        domain_ids = array('i')
+        domain_ids.frombytes(domain_blob)
+        if sys.byteorder != 'little':
+            domain_ids.byteswap()
+        node_ids = set(domain_ids)
+        for edges in (store.undirected_edges, store.synthetic_edges, store.directed_edges):
+            for edge in edges:
+                node_ids.update(edge)
+        if node_ids and (min(node_ids) < 0 or max(node_ids) >= len(store.names)):
+            return None
+        domains = store.to_names(domain_ids)
+    except (UnicodeDecodeError, ValueError, KeyError, TypeError):
+        return None
+    return GraphSnapshot(store=store, domains=domains,
+                         sources=metadata.get('sources', {}),
+                         annotations=metadata.get('annotations', {}))
@@ -3,14 +3,35 @@
 import json
 import os
 import re
-import csv
-from collections import defaultdict, deque
+import sys
+import time
+import argparse
+import contextlib
+from collections import defaultdict
+
+from check_executor import CheckExecutor, add_executor_arguments, executor_from_args
+from coverage_table import iter_coverage_rows, read_coverage_rows
+from graph_algorithms import (CORE_MODES, bfs_distances, condensation, core_components, dag_layers,
+                              longest_chain, paths_through, shortest_path, shortest_simple_paths)
+from graph_centrality import betweenness_centrality
+from graph_diff import classify, diff_runs
+from graph_incremental import DEFAULT_STATE_PATH, IncrementalConnectivity, file_fingerprint
+from graph_reachability import ReachabilityIndex
+from graph_store import GraphContribution, GraphStore, load_snapshot, save_snapshot
+from markdown_writeback import find_marked_section, replace_marked_section, set_table_cell, write_if_changed
 
 # Define paths
 ROOT_DIR = '/home/cinder/Documents/repos'
 TWITCH_DOCS_DIR = os.path.join(ROOT_DIR, 'Twitch Docs')
 REPOS_DOCS_DIR = os.path.join(ROOT_DIR, 'Repos Docs')
 WARP_DIR = os.path.join(ROOT_DIR, 'Warp')
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scripts', 'cache', 'graph_snapshot.bin')
+HISTORY_PATH = os.path.join(os.path.dirname(SNAPSHOT_PATH), 'graph_snapshot.last-run.bin')
+
+# Managed removal-task section in Warp/Tasks.md
+REMOVAL_TASKS_HEADING = "## Disconnected Components for Removal"
+REMOVAL_TASK_PREFIX = "Review and remove disconnected component:"
+REMOVAL_TASK_PATTERN = re.compile(r'^\s*- \[([ xX])\] ' + re.escape(REMOVAL_TASK_PREFIX) + r' (.+?) – see \[\[[^\]]*Coverage\]\]\s*$')
 
 # Major domains as defined in Twitch Docs/Coverage.md
 MAJOR_DOMAINS = [
@@ -24,13 +45,46 @@ MAJOR_DOMAINS = [
 ]
 
 class GraphTraversal:
-    def __init__(self):
-        self.graph = defaultdict(list)
-        self.components = set()
+    def __init__(self, core_mode='simple', ignore_domain_mesh=False, state_path=None, snapshot_path=None,
+                 explain_paths=1, explain_limit=100, path_budget=0.05,
+                 centrality_samples=None, centrality_top=20, executor=None, history_path=None,
+                 reachability_undirected=False):
+        self.store = GraphStore()  # Interned names, deduplicated edges, CSR views
+        self.snapshot_path = snapshot_path  # Binary graph reused while sources are unchanged
+        self.connectivity = IncrementalConnectivity(state_path)  # Union-find persisted between runs
         self.major_domains = set(MAJOR_DOMAINS)
+        self.core_mode = core_mode  # 'simple' or 'shortest' paths between domains
+        self.ignore_domain_mesh = ignore_domain_mesh
+        self.explain_paths = explain_paths  # "Why is X core?" paths per component in the report
+        self.explain_limit = explain_limit  # Core components explained in the report
+        self.path_budget = path_budget  # Seconds per explanation query
+        self.centrality_samples = centrality_samples  # None = exact on small graphs, sampled on large
+        self.centrality_top = centrality_top  # Components listed in the report and Coverage.md
+        self.executor = executor or CheckExecutor()
+        self.centrality = {}  # Component -> normalised betweenness
+        self.centrality_result = None
+        self.history_path = history_path  # Snapshot of the previous run, diffed against this one
+        self.graph_diff = None
         self.core_components = set()  # On path between major domains
         self.peripheral_components = set()  # One hop from core
         self.disconnected_components = set()  # No path to core
+        self.detached_components = set()  # No path to any major domain at all
+        self.dependency_cycles = []  # Mermaid components that depend on each other in a cycle
+        self.dependency_layers = []  # Layer k depends on layers below it only
+        self.longest_dependency_chain = []  # Strongly connected groups along the longest chain
+        self.reparsed_files = []
+        self.reachability_undirected = reachability_undirected  # Also follow backlinks in reachability queries
+        self._reachability = None
+    
+    @property
+    def components(self):
+        """Names of every component in the graph"""
+        return set(self.store.names)
+    
+    @property
+    def graph(self):
+        """Name-keyed adjacency lists (undirected edges both ways, Mermaid edges one way)"""
+        return self.store.adjacency_lists()
         
     def build_graph_from_files(self):
         """Build the dependency graph from available files"""
@@ -41,85 +95,134 @@ class GraphTraversal:
         dependencies_csv_path = os.path.join(TWITCH_DOCS_DIR, 'docs/architecture/dependencies.csv')
         
         # Add manually known connections from Changelog.md (for core domains)
-        for domain in MAJOR_DOMAINS:
-            self.components.add(domain)
-        
-        # Connect all major domains to each other (they're known to interact per documentation)
+        # and connect all major domains to each other (they're known to
+        # interact per documentation)
+        mesh = GraphContribution(nodes=list(MAJOR_DOMAINS), synthetic=True)
         for i, domain1 in enumerate(MAJOR_DOMAINS):
             for domain2 in MAJOR_DOMAINS[i+1:]:
-                self.graph[domain1].append(domain2)
-                self.graph[domain2].append(domain1)
+                mesh.edges.append((domain1, domain2))
+        self.store.apply(mesh)
+        if self.ignore_domain_mesh:
+            mesh = GraphContribution(nodes=list(MAJOR_DOMAINS), synthetic=True)
+        self.connectivity.apply_file('<domain-mesh>', mesh)
+        
+        sources = self.source_files()
+        fingerprints = self.load_snapshot(sources)
+        if fingerprints is None:
+            fingerprints = {}
+            for file_path, parser in sources:
+                fingerprints[file_path] = self.load_source(file_path, parser)
+            if self.snapshot_path:
+                save_snapshot(self.store, self.snapshot_path, MAJOR_DOMAINS, fingerprints)
+        
+        # Forget files that were deleted since the last run
+        self.connectivity.retain_files(['<domain-mesh>'] + [file_path for file_path, _ in sources])
+        
+        print(f"Graph built with {len(self.store)} components and {self.store.edge_count} connections")
+        print(f"Re-parsed {len(self.reparsed_files)} of {len(sources)} source files")
+    
+    def source_files(self):
+        """(path, parser) for every Markdown file the graph is built from"""
+        sources = []
         
         # Add subcomponents from Coverage.md
         coverage_path = os.path.join(TWITCH_DOCS_DIR, 'Coverage.md')
         if os.path.exists(coverage_path):
-            self.parse_coverage_file(coverage_path)
+            sources.append((coverage_path, self.parse_coverage_file))
         
         # Use Repository Coverage files
         for repo_dir in os.listdir(REPOS_DOCS_DIR):
             repo_coverage = os.path.join(REPOS_DOCS_DIR, repo_dir, 'Coverage.md')
             if os.path.exists(repo_coverage):
-                self.parse_coverage_file(repo_coverage)
+                sources.append((repo_coverage, self.parse_coverage_file))
                 
         # Parse Repos Docs/Index.md for repo connections
         index_path = os.path.join(REPOS_DOCS_DIR, 'Index.md')
         if os.path.exists(index_path):
-            self.parse_index_file(index_path)
+            sources.append((index_path, self.parse_index_file))
+        return sources
+    
+    def load_snapshot(self, sources):
+        """Load the graph from the snapshot if it was built from exactly these files
+        
+        Returns the current source fingerprints, or None when the graph has
+        to be rebuilt.
+        """
+        if not self.snapshot_path:
+            return None
+        snapshot = load_snapshot(self.snapshot_path)
+        if snapshot is None or set(snapshot.sources) != {file_path for file_path, _ in sources}:
+            return None
+        
+        fingerprints = {}
+        for file_path, _ in sources:
+            previous = snapshot.sources[file_path]
+            fingerprint = file_fingerprint(file_path, previous)
+            recorded = self.connectivity.files.get(file_path, {}).get('fingerprint') or {}
+            if fingerprint is None or fingerprint['sha1'] != previous.get('sha1') or recorded.get('sha1') != fingerprint['sha1']:
+                return None
+            fingerprints[file_path] = fingerprint
         
-        print(f"Graph built with {len(self.components)} components and {sum(len(neighbors) for neighbors in self.graph.values())} connections")
+        self.store = snapshot.store
+        print(f"Loaded graph snapshot {self.snapshot_path}")
+        return fingerprints
+    
+    def load_source(self, file_path, parser):
+        """Apply a source file's edges, replaying them from the state if it is unchanged
+        
+        Returns the fingerprint of the file as it was read.
+        """
+        contribution = self.connectivity.cached_contribution(file_path)
+        if contribution is None:
+            fingerprint = file_fingerprint(file_path)
+            contribution = parser(file_path)
+            self.connectivity.apply_file(file_path, contribution, fingerprint)
+            self.reparsed_files.append(file_path)
+        else:
+            self.store.apply(contribution)
+        return self.connectivity.files[file_path]['fingerprint']
     
     def parse_coverage_file(self, file_path):
         """Parse a Coverage.md file to extract components and their connections"""
         print(f"Parsing {file_path}...")
-        with open(file_path, 'r') as f:
-            content = f.read()
-            
-        # Extract component table rows
-        table_pattern = r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|\s*([^|]*)\s*\|'
-        matches = re.findall(table_pattern, content)
+        contribution = GraphContribution()
         
-        for match in matches:
-            # Skip header rows
-            if "Component" in match[0] or "---" in match[0]:
-                continue
-                
-            component = match[0].strip()
-            component_type = match[1].strip()
-            source_path = match[2].strip()
-            status = match[3].strip()
+        for row in read_coverage_rows(file_path):
+            component = row.component
             
             # Skip noise components (dates, headers, file paths)
             if not self.is_valid_component(component):
                 continue
                 
-            self.components.add(component)
+            contribution.nodes.append(component)
+            if row.doc_file and row.doc_file != '-':
+                contribution.docs[component] = row.doc_file
             
-            # Extract backlinks to find connections
-            if len(match) >= 7 and match[6]:
-                backlinks = re.findall(r'\[\[([^\]]+)\]\]', match[6])
-                for backlink in backlinks:
-                    # Skip non-component backlinks
-                    if backlink in ['Index', 'Tasks', 'Coverage']:
-                        continue
+            # Backlinks give the connections
+            for backlink in row.backlinks:
+                # Skip non-component backlinks
+                if backlink in ['Index', 'Tasks', 'Coverage']:
+                    continue
+                
+                # Clean up component names from backlinks
+                if backlink.startswith('Components/'):
+                    backlink = backlink[len('Components/'):]
                     
-                    # Clean up component names from backlinks
-                    if backlink.startswith('Components/'):
-                        backlink = backlink[len('Components/'):]
-                        
-                    if self.is_valid_component(backlink):
-                        self.components.add(backlink)
-                        self.graph[component].append(backlink)
-                        self.graph[backlink].append(component)
+                if self.is_valid_component(backlink):
+                    contribution.edges.append((component, backlink))
             
             # Connect components to their domains based on path
             for domain in MAJOR_DOMAINS:
-                if domain in source_path or (component_type == 'domain' and component == domain):
-                    self.graph[component].append(domain)
-                    self.graph[domain].append(component)
+                if domain in row.source_path or (row.type == 'domain' and component == domain):
+                    contribution.edges.append((component, domain))
+        
+        self.store.apply(contribution)
+        return contribution
     
     def parse_index_file(self, file_path):
         """Parse the Index.md file to extract repository connections"""
         print(f"Parsing {file_path}...")
+        contribution = GraphContribution()
         with open(file_path, 'r') as f:
             content = f.read()
             
@@ -136,10 +239,11 @@ class GraphTraversal:
                 source = self.clean_component_name(source)
                 target = self.clean_component_name(target)
                 
-                self.components.add(source)
-                self.components.add(target)
-                self.graph[source].append(target)
-                # Don't add reverse edge as this is a directed graph
+                # Kept directed: tracked separately from undirected edges
+                contribution.directed.append((source, target))
+        
+        self.store.apply(contribution)
+        return contribution
     
     def clean_component_name(self, name):
         """Clean up component names from mermaid diagrams"""
@@ -179,113 +283,375 @@ class GraphTraversal:
         # Valid component
         return True
     
+    def undirected_graph(self):
+        """Frozen undirected CSR view, optionally without the synthetic domain mesh"""
+        return self.store.freeze('undirected', include_synthetic=not self.ignore_domain_mesh)
+    
     def compute_connectivity(self):
-        """Compute connectivity and categorize components"""
+        """Compute connectivity and categorize components
+        
+        Only sets of the persisted union-find that hold a major domain can
+        contain core or peripheral components, and of those only the sets
+        that changed since the last run are classified again.
+        """
         print("Computing connectivity...")
+        adjacency = self.undirected_graph()
+        options = self.run_options()
+        cached = self.connectivity.cached_classification(options)
         
-        # 1. Find paths between all major domains to identify core components
-        for i, domain1 in enumerate(self.major_domains):
-            for domain2 in list(self.major_domains)[i+1:]:
-                paths = self.find_all_paths(domain1, domain2)
-                for path in paths:
-                    for component in path:
-                        self.core_components.add(component)
-        
-        # 2. Find peripheral components (one hop from core)
-        for core_component in self.core_components:
-            for neighbor in self.graph[core_component]:
-                if neighbor not in self.core_components:
-                    self.peripheral_components.add(neighbor)
-        
-        # 3. Find disconnected components
-        for component in self.components:
-            if component not in self.core_components and component not in self.peripheral_components:
-                self.disconnected_components.add(component)
+        classified = {}
+        changed_sets = {}
+        for root, members in self.connectivity.anchor_sets(self.major_domains).items():
+            if root in cached:
+                classified[root] = cached[root]
+            else:
+                changed_sets[root] = members
         
+        if changed_sets:
+            nodes = self.store.to_ids(name for members in changed_sets.values() for name in members)
+            subgraph = {node: adjacency[node] for node in nodes}
+            domains = self.store.to_ids(self.major_domains) & nodes
+            
+            # 1. Core components lie on a simple (or shortest) path between two major domains
+            core = core_components(subgraph, domains, self.core_mode)
+            
+            # 2. Find peripheral components (one hop from core)
+            peripheral = set()
+            for node in core:
+                for neighbor in subgraph[node]:
+                    if neighbor not in core:
+                        peripheral.add(neighbor)
+            
+            for root in changed_sets:
+                classified[root] = {'core': [], 'peripheral': []}
+            for kind, group in (('core', core), ('peripheral', peripheral)):
+                for name in sorted(self.store.to_names(group)):
+                    classified[self.connectivity.sets.find(name)][kind].append(name)
+        self.connectivity.record_classification(options, classified)
+        
+        # 3. Everything else, including every set without a major domain, is disconnected
+        self.core_components = {name for entry in classified.values() for name in entry['core']}
+        self.peripheral_components = {name for entry in classified.values() for name in entry['peripheral']}
+        self.disconnected_components = self.components - self.core_components - self.peripheral_components
+        self.detached_components = self.connectivity.detached_components(self.major_domains)
+        
+        print(f"Classified {len(changed_sets)} changed of {len(classified)} domain-holding sets")
         print(f"Core components: {len(self.core_components)}")
         print(f"Peripheral components: {len(self.peripheral_components)}")
         print(f"Disconnected components: {len(self.disconnected_components)}")
+        print(f"  of which detached (no path to any major domain): {len(self.detached_components)}")
+    
+    def compute_centrality(self):
+        """Rank components by betweenness centrality on the undirected graph"""
+        print("Computing betweenness centrality...")
+        result = betweenness_centrality(self.undirected_graph(), samples=self.centrality_samples,
+                                        executor=self.executor)
+        self.centrality_result = result
+        self.centrality = {self.store.names[node]: score for node, score in enumerate(result.scores)}
+        if result.exact:
+            print(f"Exact betweenness from {result.sources} sources")
+        else:
+            print(f"Sampled betweenness from {result.sources} pivots "
+                  f"(error ≤ {result.error_bound:.4f} at {result.confidence:.0%} confidence)")
     
-    def find_all_paths(self, start, end, max_paths=10):
-        """Find paths between two components using BFS, limiting to max_paths"""
-        visited = set()
-        queue = deque([(start, [start])])
-        paths = []
+    def top_central_components(self):
+        """(component, score) for the most central components, highest first"""
+        ranking = sorted(self.centrality.items(), key=lambda item: (-item[1], item[0]))
+        return ranking[:self.centrality_top]
+    
+    def centrality_method(self):
+        """One-line description of how the centrality scores were computed"""
+        result = self.centrality_result
+        if result.exact:
+            return f"Exact betweenness (Brandes, {result.sources} sources), normalised to [0, 1]."
+        return (f"Sampled betweenness ({result.sources} pivots), normalised to [0, 1]; every score is "
+                f"within ±{result.error_bound:.4f} with {result.confidence:.0%} confidence.")
+    
+    def run_options(self):
+        """Options that change the classification, recorded with each run"""
+        return {'core_mode': self.core_mode, 'ignore_domain_mesh': self.ignore_domain_mesh}
+    
+    def compare_with_previous_run(self):
+        """Diff this run against the recorded previous run and write the JSON changelog"""
+        if not self.history_path:
+            return
+        previous = load_snapshot(self.history_path)
+        if previous is None:
+            print("No previous run recorded, skipping graph diff")
+            return
         
-        while queue and len(paths) < max_paths:
-            node, path = queue.popleft()
-            
-            if node == end:
-                paths.append(path)
-                continue
-                
-            if node in visited:
+        annotations = previous.annotations
+        self.graph_diff = diff_runs(
+            previous.store, annotations.get('classes', {}), annotations.get('cycles', []),
+            self.store, self.component_classes(), self.dependency_cycles)
+        
+        changelog = {'previous_options': annotations.get('options', {}), 'options': self.run_options()}
+        changelog.update(self.graph_diff.to_dict())
+        changelog_path = os.path.join(WARP_DIR, 'connectivity_changelog.json')
+        write_if_changed(changelog_path, json.dumps(changelog, ensure_ascii=False, separators=(',', ':')) + '\n')
+        print(f"Graph diff: {len(self.graph_diff.added_components)} components added, "
+              f"{len(self.graph_diff.removed_components)} removed, "
+              f"{len(self.graph_diff.class_changes)} class changes ({changelog_path})")
+    
+    def record_run(self):
+        """Keep this run's graph, classes and cycles for the next run's diff"""
+        if self.history_path:
+            save_snapshot(self.store, self.history_path, MAJOR_DOMAINS,
+                          annotations={'classes': self.component_classes(),
+                                       'cycles': self.dependency_cycles,
+                                       'options': self.run_options()})
+    
+    def component_classes(self):
+        """Component -> 'core' / 'peripheral' / 'disconnected'"""
+        return classify(self.core_components, self.peripheral_components, self.disconnected_components)
+    
+    def analyze_dependencies(self):
+        """Condense the directed Mermaid edges into a DAG of strongly connected components"""
+        print("Analyzing dependency structure...")
+        graph = self.store.freeze('out')
+        components, _, successors = condensation(graph)
+        names = self.store.names
+        
+        # Only components that take part in a Mermaid edge have a dependency structure
+        involved = {node for edge in self.store.directed_edges for node in edge}
+        groups = [sorted(names[node] for node in members) for members in components]
+        
+        self.dependency_cycles = sorted(group for group in groups if len(group) > 1)
+        
+        layers = dag_layers(successors)
+        involved_components = [component for component, members in enumerate(components)
+                               if members[0] in involved]
+        by_layer = defaultdict(list)
+        for component in involved_components:
+            by_layer[layers[component]].extend(groups[component])
+        self.dependency_layers = [sorted(by_layer[layer]) for layer in sorted(by_layer)]
+        
+        chain = longest_chain(successors, involved_components)
+        self.longest_dependency_chain = [groups[component] for component in chain]
+        
+        print(f"Dependency cycles: {len(self.dependency_cycles)}")
+        print(f"Dependency layers: {len(self.dependency_layers)}")
+    
+    def reachability(self):
+        """Reachability index over the current graph (built once, on first query)
+        
+        Only Mermaid dependency edges are followed unless reachability_undirected
+        is set; the assumed domain mesh is never followed.
+        """
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex.from_store(
+                self.store, include_undirected=self.reachability_undirected)
+        return self._reachability
+    
+    def _node_id(self, component):
+        node = self.store.lookup(component)
+        if node is None:
+            raise KeyError(f"Unknown component '{component}'")
+        return node
+    
+    def descendants(self, component):
+        """Components the given one transitively depends on"""
+        return self.store.to_names(self.reachability().descendants(self._node_id(component)))
+    
+    def ancestors(self, component):
+        """Components that transitively depend on the given one"""
+        return self.store.to_names(self.reachability().ancestors(self._node_id(component)))
+    
+    def component_docs(self):
+        """Component -> docs describing it (the Coverage/Index files listing it and its Doc File)"""
+        docs = defaultdict(set)
+        for file_path, entry in self.connectivity.files.items():
+            if file_path.startswith('<'):
                 continue
-                
-            visited.add(node)
-            
-            for neighbor in self.graph[node]:
-                if neighbor not in path:  # Avoid cycles
-                    queue.append((neighbor, path + [neighbor]))
+            contribution = GraphContribution.from_dict(entry['contribution'])
+            relative_path = os.path.relpath(file_path, ROOT_DIR)
+            for component in contribution.nodes:
+                docs[component].add(relative_path)
+            for source, target in contribution.edges + contribution.directed:
+                docs[source].add(relative_path)
+                docs[target].add(relative_path)
+            for component, doc_file in contribution.docs.items():
+                doc_file = doc_file.strip('[]').split('|', 1)[0]
+                docs[component].add(os.path.relpath(
+                    os.path.join(os.path.dirname(file_path), doc_file), ROOT_DIR))
+        return docs
+    
+    def affected_docs(self, component):
+        """Docs to revisit when the given component changes: its own and its ancestors'"""
+        docs = self.component_docs()
+        affected = set(docs.get(component, ()))
+        for ancestor in self.ancestors(component):
+            affected.update(docs.get(ancestor, ()))
+        return affected
+    
+    def iter_paths(self, start, end, max_paths=None, time_budget=None):
+        """Lazily yield simple paths from start to end, fewest hops first
+        
+        Stops after max_paths paths or time_budget seconds, whichever comes first.
+        """
+        source, target = self._node_id(start), self._node_id(end)
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        graph = self.store.freeze('forward', include_synthetic=not self.ignore_domain_mesh)
+        paths = shortest_simple_paths(graph, source, {target}, deadline=deadline)
+        for count, path in enumerate(paths):
+            if max_paths is not None and count >= max_paths:
+                return
+            yield [self.store.names[node] for node in path]
+    
+    def find_all_paths(self, start, end, max_paths=10, time_budget=None):
+        """Find up to max_paths shortest simple paths between two components"""
+        return list(self.iter_paths(start, end, max_paths, time_budget))
+    
+    def explain_core(self, component, max_paths=1, time_budget=0.05):
+        """Paths between two major domains that pass through a core component
+        
+        'simple' mode lists simple paths; 'shortest' mode lists shortest
+        paths between the two domains.
+        """
+        if component in self.major_domains:
+            return []
+        adjacency = self.undirected_graph()
+        node = self._node_id(component)
+        domains = self.store.to_ids(self.major_domains)
+        
+        if self.core_mode == 'shortest':
+            paths = self._shortest_paths_through(adjacency, node, domains)
+        else:
+            deadline = time.monotonic() + time_budget if time_budget is not None else None
+            paths = paths_through(adjacency, node, domains, deadline=deadline)
         
-        return paths
+        explanations = []
+        for path in paths:
+            if len(explanations) >= max_paths:
+                break
+            explanations.append([self.store.names[step] for step in path])
+        return explanations
+    
+    def _shortest_paths_through(self, adjacency, node, domains):
+        """Shortest domain-to-domain paths through node, one per qualifying domain pair"""
+        from_node = bfs_distances(adjacency, node)
+        reachable = sorted((domain for domain in domains if domain in from_node), key=lambda d: self.store.names[d])
+        layers = {domain: bfs_distances(adjacency, domain) for domain in reachable}
+        for i, first in enumerate(reachable):
+            for second in reachable[i + 1:]:
+                if from_node[first] + from_node[second] == layers[first].get(second):
+                    to_first = shortest_path(adjacency, node, {first})
+                    to_second = shortest_path(adjacency, node, {second})
+                    yield to_first[::-1] + to_second[1:]
     
     def update_coverage_file(self, file_path):
-        """Update Coverage.md with disconnected status"""
+        """Update Coverage.md with disconnected status (row-level edits, written only on change)"""
         print(f"Updating {file_path}...")
         
-        with open(file_path, 'r') as f:
-            content = f.readlines()
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read().splitlines(keepends=True)
         
-        updated_content = []
-        for line in content:
-            updated_line = line
-            
-            # Check if this is a component row in the table
-            if '|' in line:
-                cells = [cell.strip() for cell in line.split('|')]
-                if len(cells) >= 7 and cells[1] and cells[1] != "Component" and "---" not in cells[1]:
-                    component_name = cells[1]
-                    status_index = 4  # Status is in the 4th column (index 4 in split result)
-                    
-                    if component_name in self.disconnected_components:
-                        # Replace status with "disconnected"
-                        cells[status_index] = "disconnected"
-                        updated_line = "|" + "|".join(cells[1:]) + "|\n"
-            
-            updated_content.append(updated_line)
+        # Rows come from the shared parser, so the Status column is found by its header
+        updated_content = list(content)
+        for row in iter_coverage_rows(content):
+            status_column = row.column('status')
+            if row.component in self.disconnected_components and status_column is not None:
+                index = row.line - 1
+                updated_content[index] = set_table_cell(updated_content[index], status_column, "disconnected")
         
-        with open(file_path, 'w') as f:
-            f.writelines(updated_content)
-            
+        if self.centrality:
+            updated_content = replace_marked_section(updated_content, 'centrality', self.centrality_section())
+        
+        if not write_if_changed(file_path, ''.join(updated_content)):
+            print(f"{file_path} unchanged")
+    
+    def centrality_section(self):
+        """Coverage.md lines listing the most central components
+        
+        A list rather than a table, so the component table parsers never see it.
+        """
+        lines = ["## Component Centrality\n", "\n", f"{self.centrality_method()}\n", "\n"]
+        for component, score in self.top_central_components():
+            lines.append(f"- {component}: {score:.4f}\n")
+        return lines
+    
     def update_tasks_file(self):
-        """Update Tasks.md with removal tasks for disconnected components"""
+        """Update Tasks.md with removal tasks for disconnected components
+        
+        The tasks live in a marker-managed section that is replaced in place,
+        so repeated runs do not stack up copies. Ticked tasks stay ticked.
+        """
         print(f"Updating Tasks.md...")
         
         tasks_path = os.path.join(WARP_DIR, 'Tasks.md')
         
-        with open(tasks_path, 'r') as f:
-            content = f.readlines()
+        with open(tasks_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read().splitlines(keepends=True)
         
-        # Find where to insert new tasks
+        content, done = self.strip_removal_task_sections(content)
+        
+        # New tasks go at the end of the New Tasks section, after its own items
         insert_index = 0
         for i, line in enumerate(content):
             if "## New Tasks" in line:
                 insert_index = i + 1
+                while insert_index < len(content) and not re.match(r'#{1,2} ', content[insert_index]):
+                    insert_index += 1
                 break
         
         # Create task entries for disconnected components
-        new_tasks = ["## Disconnected Components for Removal\n\n"]
+        new_tasks = [f"{REMOVAL_TASKS_HEADING}\n", "\n"]
         for component in sorted(self.disconnected_components):
-            new_tasks.append(f"- [ ] Review and remove disconnected component: {component} – see [[Coverage]]\n")
+            mark = 'x' if component in done else ' '
+            new_tasks.append(f"- [{mark}] {REMOVAL_TASK_PREFIX} {component} – see [[Coverage]]\n")
         
         new_tasks.append("\n")
         
-        # Insert new tasks
-        updated_content = content[:insert_index] + new_tasks + content[insert_index:]
+        updated_content = replace_marked_section(content, 'disconnected-removal', new_tasks, insert_index)
+        
+        if not write_if_changed(tasks_path, ''.join(updated_content)):
+            print(f"{tasks_path} unchanged")
+    
+    @staticmethod
+    def strip_removal_task_sections(lines):
+        """Drop unmarked removal-task sections left by earlier versions of this script
+        
+        Legacy task lines are removed wherever their heading appears; the
+        heading goes too only when nothing but blank lines is left under it.
+        Returns the remaining lines and the components whose removal task was
+        ticked in the managed section or any legacy copy.
+        """
+        done = set()
+        managed = find_marked_section(lines, 'disconnected-removal')
+        if managed is not None:
+            for line in lines[managed[0]:managed[1]]:
+                match = REMOVAL_TASK_PATTERN.match(line)
+                if match and match.group(1).lower() == 'x':
+                    done.add(match.group(2))
         
-        with open(tasks_path, 'w') as f:
-            f.writelines(updated_content)
+        kept = []
+        i = 0
+        while i < len(lines):
+            inside_managed = managed is not None and managed[0] <= i <= managed[1]
+            if inside_managed or lines[i].strip() != REMOVAL_TASKS_HEADING:
+                kept.append(lines[i])
+                i += 1
+                continue
+            # The section runs to the next heading or managed marker
+            j = i + 1
+            while j < len(lines) and not lines[j].lstrip().startswith('#') and not (managed and j == managed[0]):
+                j += 1
+            section = lines[i + 1:j]
+            remaining = []
+            for line in section:
+                match = REMOVAL_TASK_PATTERN.match(line)
+                if match:
+                    if match.group(1).lower() == 'x':
+                        done.add(match.group(2))
+                else:
+                    remaining.append(line)
+            if len(remaining) == len(section):
+                kept.extend(lines[i:j])  # Hand-written section that reuses the heading
+            elif any(line.strip() for line in remaining):
+                kept.append(lines[i])
+                kept.extend(remaining)
+            i = j
+        return kept, done
     
     def generate_report(self):
         """Generate a connectivity report"""
@@ -318,11 +684,73 @@ class GraphTraversal:
                     f.write(f"- {component}\n")
             f.write("\n")
             
+            if self.explain_paths:
+                f.write("## Why Components Are Core\n\n")
+                f.write(f"Paths between major domains through each core component ({self.core_mode} paths).\n\n")
+                explained = sorted(self.core_components - self.major_domains)
+                for component in explained[:self.explain_limit]:
+                    paths = self.explain_core(component, self.explain_paths, self.path_budget)
+                    if not paths:
+                        f.write(f"- {component}: no path found within {self.path_budget}s\n")
+                    for path in paths:
+                        f.write(f"- {component}: {' -> '.join(path)}\n")
+                if len(explained) > self.explain_limit:
+                    f.write(f"- ... and {len(explained) - self.explain_limit} more (raise --explain-limit)\n")
+                f.write("\n")
+            
             f.write("## Peripheral Components\n\n")
             for component in sorted(self.peripheral_components):
                 f.write(f"- {component}\n")
             f.write("\n")
             
+            if self.centrality:
+                f.write("## Component Centrality\n\n")
+                f.write(f"{self.centrality_method()}\n\n")
+                f.write("| Rank | Component | Betweenness | Class |\n")
+                f.write("|---|---|---|---|\n")
+                for rank, (component, score) in enumerate(self.top_central_components(), 1):
+                    if component in self.core_components:
+                        category = 'core'
+                    elif component in self.peripheral_components:
+                        category = 'peripheral'
+                    else:
+                        category = 'disconnected'
+                    f.write(f"| {rank} | {component} | {score:.4f} | {category} |\n")
+                f.write("\n")
+            
+            f.write("## Dependency Structure\n\n")
+            f.write("Strongly connected components of the directed Mermaid edges in Index.md.\n\n")
+            f.write(f"- Dependency Cycles: {len(self.dependency_cycles)}\n")
+            f.write(f"- Topological Layers: {len(self.dependency_layers)}\n")
+            f.write(f"- Longest Dependency Chain: {len(self.longest_dependency_chain)} levels\n\n")
+            
+            f.write("### Dependency Cycles\n\n")
+            if self.dependency_cycles:
+                for number, cycle in enumerate(self.dependency_cycles, 1):
+                    f.write(f"{number}. {', '.join(cycle)} ({len(cycle)} components)\n")
+            else:
+                f.write("None - the Mermaid dependency graph is acyclic.\n")
+            f.write("\n")
+            
+            f.write("### Topological Layers\n\n")
+            f.write("Layer 0 depends on nothing outside its own cycle; every other layer depends only on lower layers.\n\n")
+            for layer, members in enumerate(self.dependency_layers):
+                f.write(f"- Layer {layer}: {', '.join(members)}\n")
+            f.write("\n")
+            
+            f.write("### Longest Dependency Chain\n\n")
+            if self.longest_dependency_chain:
+                f.write(" --> ".join(group[0] if len(group) == 1 else "{" + ", ".join(group) + "}"
+                                     for group in self.longest_dependency_chain) + "\n")
+            f.write("\n")
+            
+            if self.graph_diff is not None:
+                f.write("## Changes Since Last Run\n\n")
+                if self.graph_diff.is_empty():
+                    f.write("No structural changes.\n\n")
+                else:
+                    f.writelines(self.graph_diff.markdown_lines())
+            
             f.write("## Connectivity Visualization\n\n")
             f.write("```\n")
             f.write("MAJOR DOMAINS <--> CORE COMPONENTS <--> PERIPHERAL COMPONENTS\n")
@@ -338,6 +766,9 @@ class GraphTraversal:
         """Run the complete analysis workflow"""
         self.build_graph_from_files()
         self.compute_connectivity()
+        self.compute_centrality()
+        self.analyze_dependencies()
+        self.compare_with_previous_run()
         
         # Update Coverage.md
         coverage_path = os.path.join(TWITCH_DOCS_DIR, 'Coverage.md')
@@ -349,8 +780,91 @@ class GraphTraversal:
         # Generate report
         self.generate_report()
         
+        # Persist union-find state and this run's graph for the next run
+        self.connectivity.save()
+        self.record_run()
+        
         print("Analysis complete!")
 
+def main():
+    parser = argparse.ArgumentParser(description="Component connectivity analysis")
+    parser.add_argument('--core-mode', choices=CORE_MODES, default='simple',
+                        help='Core = on some simple path (default) or some shortest path between major domains')
+    parser.add_argument('--ignore-domain-mesh', action='store_true',
+                        help='Ignore the assumed all-pairs edges between major domains')
+    parser.add_argument('--state', default=str(DEFAULT_STATE_PATH),
+                        help='Connectivity state file reused between runs (default: %(default)s)')
+    parser.add_argument('--snapshot', default=SNAPSHOT_PATH,
+                        help='Binary graph snapshot reused while sources are unchanged (default: %(default)s)')
+    parser.add_argument('--explain-paths', type=int, default=1,
+                        help='"Why is X core?" paths per core component in the report (0 = none, default: 1)')
+    parser.add_argument('--explain-limit', type=int, default=100,
+                        help='Maximum core components explained in the report (default: 100)')
+    parser.add_argument('--path-budget', type=float, default=0.05,
+                        help='Time budget in seconds per path query (default: 0.05)')
+    parser.add_argument('--centrality-samples', type=int, default=None,
+                        help='Pivot sources for sampled betweenness (0 = exact; default: exact up to 2000 components)')
+    parser.add_argument('--centrality-top', type=int, default=20,
+                        help='Most central components listed in the report and Coverage.md (default: 20)')
+    add_executor_arguments(parser)
+    parser.add_argument('--history', default=HISTORY_PATH,
+                        help='Snapshot of the previous run to diff against (default: %(default)s)')
+    parser.add_argument('--no-state', action='store_true',
+                        help='Parse every source file; do not read or write connectivity state, snapshots or history')
+    subcommands = parser.add_subparsers(dest='command')
+    subcommands.add_parser('analyze', help='Classify components and update Coverage.md, Tasks.md and the report (default)')
+    query_parser = subcommands.add_parser('query', help='Reachability queries without updating any file')
+    query_parser.add_argument('kind', choices=('ancestors', 'descendants', 'impact'),
+                              help='ancestors = what depends on it, descendants = what it depends on, '
+                                   'impact = ancestors plus the docs to revisit')
+    query_parser.add_argument('components', nargs='+', help='Component names')
+    query_parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    query_parser.add_argument('--include-undirected', action='store_true',
+                              help='Also follow backlink and domain edges (both ways), not only Mermaid dependencies')
+    args = parser.parse_args()
+    
+    analyzer = GraphTraversal(core_mode=args.core_mode, ignore_domain_mesh=args.ignore_domain_mesh,
+                              state_path=None if args.no_state else args.state,
+                              snapshot_path=None if args.no_state else args.snapshot,
+                              explain_paths=args.explain_paths, explain_limit=args.explain_limit,
+                              path_budget=args.path_budget, centrality_samples=args.centrality_samples,
+                              centrality_top=args.centrality_top, executor=executor_from_args(args),
+                              history_path=None if args.no_state else args.history,
+                              reachability_undirected=getattr(args, 'include_undirected', False))
+    with analyzer.executor:
+        if args.command == 'query':
+            return run_query(analyzer, args)
+        analyzer.run_analysis()
+
+def run_query(analyzer, args):
+    """Answer reachability queries for the query subcommand"""
+    # Keep stdout clean for --json consumers
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer.build_graph_from_files()
+        analyzer.connectivity.save()
+    
+    results = {}
+    for component in args.components:
+        try:
+            if args.kind == 'descendants':
+                results[component] = {'descendants': sorted(analyzer.descendants(component))}
+            else:
+                results[component] = {'ancestors': sorted(analyzer.ancestors(component))}
+                if args.kind == 'impact':
+                    results[component]['docs'] = sorted(analyzer.affected_docs(component))
+        except KeyError as e:
+            print(f"❌ {e.args[0]}", file=sys.stderr)
+            return 1
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for component, result in results.items():
+        for key, values in result.items():
+            print(f"{component} {key} ({len(values)}):")
+            for value in values:
+                print(f"  - {value}")
+    return 0
+
 if __name__ == "__main__":
-    analyzer = GraphTraversal()
-    analyzer.run_analysis()
+    sys.exit(main())
@@ -8,15 +8,20 @@ Step 7: Run documentation integrity checks
 3. Confirm Dataview queries pick up new `partial` statuses.
 """
 
-import os
-import re
 import glob
-import yaml
+import argparse
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import Dict, Optional
+
+from vault_parser import DEFAULT_CACHE_PATH, DocumentStore
+from check_executor import CheckExecutor, add_executor_arguments, executor_from_args
+from coverage_table import summarize_tables
 
 class WarpIntegrityChecker:
-    def __init__(self):
+    def __init__(self, documents: Optional[DocumentStore] = None,
+                 executor: Optional[CheckExecutor] = None):
+        self.documents = documents or DocumentStore()
+        self.executor = executor or CheckExecutor()
         self.warp_root = Path("/home/cinder/Documents/repos/Warp")
         self.twitch_docs = Path("/home/cinder/Documents/repos/Twitch Docs")
         self.repos_docs = Path("/home/cinder/Documents/repos/Repos Docs")
@@ -41,19 +46,15 @@ class WarpIntegrityChecker:
     def check_yaml_frontmatter(self, file_path: Path) -> Dict:
         """Check if file has proper YAML frontmatter with required fields"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = self.documents.get(file_path)
             
-            if not content.startswith('---\n'):
+            if not document.has_frontmatter:
                 return {'error': 'No YAML frontmatter found'}
             
-            # Extract YAML frontmatter
-            yaml_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
-            if not yaml_match:
-                return {'error': 'Invalid YAML frontmatter format'}
+            if document.frontmatter_error:
+                return {'error': document.frontmatter_error}
             
-            yaml_content = yaml_match.group(1)
-            metadata = yaml.safe_load(yaml_content)
+            metadata = document.frontmatter or {}
             
             required_fields = ['status', 'source_path', 'last_scanned']
             missing_fields = [field for field in required_fields if field not in metadata]
@@ -76,8 +77,7 @@ class WarpIntegrityChecker:
     def check_required_sections(self, file_path: Path, file_type: str) -> Dict:
         """Check if file contains all required sections"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = self.documents.get(file_path)
             
             required = self.required_sections.get(file_type, [])
             found_sections = []
@@ -85,8 +85,7 @@ class WarpIntegrityChecker:
             
             for section in required:
                 # Look for section headers (## Section Name)
-                pattern = rf'^\s*##\s+{re.escape(section)}\s*$'
-                if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
+                if document.has_heading(section):
                     found_sections.append(section)
                 else:
                     missing_sections.append(section)
@@ -103,15 +102,14 @@ class WarpIntegrityChecker:
     def check_backlinks(self, file_path: Path, file_type: str) -> Dict:
         """Check if file contains required backlinks"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = self.documents.get(file_path)
             
             required = self.required_backlinks.get(file_type, [])
             found_backlinks = []
             missing_backlinks = []
             
             # Find all [[...]] style links
-            all_links = re.findall(r'\[\[([^\]]+)\]\]', content)
+            all_links = document.wikilinks
             
             for required_link in required:
                 # Strip the [[ ]] for comparison
@@ -138,12 +136,8 @@ class WarpIntegrityChecker:
     def check_dataview_queries(self, file_path: Path) -> Dict:
         """Check for Dataview query blocks that should pick up partial statuses"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Look for dataview code blocks
-            dataview_pattern = r'```dataview\n(.*?)\n```'
-            dataview_blocks = re.findall(dataview_pattern, content, re.DOTALL)
+            dataview_blocks = self.documents.get(file_path).dataview_blocks
             
             partial_queries = []
             for block in dataview_blocks:
@@ -163,24 +157,17 @@ class WarpIntegrityChecker:
     def check_coverage_table_structure(self, file_path: Path) -> Dict:
         """Check if Coverage.md has proper table structure for Obsidian rendering"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Look for markdown tables with proper headers
-            table_pattern = r'\|\s*Component\s*\|.*?\|\s*Status\s*\|'
-            tables = re.findall(table_pattern, content, re.IGNORECASE)
-            
-            # Count rows with 'partial' status
-            partial_rows = len(re.findall(r'\|\s*\w+.*?\|\s*partial\s*\|', content, re.IGNORECASE))
-            
-            # Check for proper table formatting
-            pipe_lines = [line for line in content.split('\n') if '|' in line and 'Component' in line]
+            # One pass over the split cells: structure plus exact per-status counts
+            summary = summarize_tables(self.documents.get(file_path))
+            partial_rows = summary.count('partial')
             
             return {
-                'has_tables': len(tables) > 0,
+                'has_tables': summary.tables > 0,
                 'partial_count': partial_rows,
-                'table_headers': pipe_lines[:3] if pipe_lines else [],
-                'valid': len(tables) > 0 and partial_rows > 0
+                'status_counts': summary.status_counts,
+                'malformed_rows': summary.malformed_rows,
+                'table_headers': summary.headers[:3],
+                'valid': summary.valid and partial_rows > 0
             }
             
         except Exception as e:
@@ -212,6 +199,7 @@ class WarpIntegrityChecker:
         
         # Twitch Docs Components
         twitch_components = glob.glob(str(self.twitch_docs / "Components" / "*.md"))
+        self.documents.prefetch(twitch_components, self.executor)
         
         for comp_file in twitch_components:
             file_path = Path(comp_file)
@@ -256,6 +244,7 @@ class WarpIntegrityChecker:
         coverage_files = []
         coverage_files.extend(glob.glob(str(self.twitch_docs / "Coverage.md")))
         coverage_files.extend(glob.glob(str(self.repos_docs / "*/Coverage.md")))
+        self.documents.prefetch(coverage_files, self.executor)
         
         for cov_file in coverage_files:
             file_path = Path(cov_file)
@@ -285,6 +274,8 @@ class WarpIntegrityChecker:
                     print(f"    📋 Dataview tracks partial status")
                 if table_result.get('partial_count', 0) > 0:
                     print(f"    📊 Found {table_result['partial_count']} partial entries")
+                if table_result.get('malformed_rows'):
+                    print(f"    ⚠️  {len(table_result['malformed_rows'])} rows with a different cell count than the header")
             else:
                 self.results['failed'].append(file_result)
                 print(f"    ❌ FAILED")
@@ -339,19 +330,19 @@ class WarpIntegrityChecker:
         coverage_file = self.twitch_docs / "Coverage.md"
         
         if coverage_file.exists():
-            with open(coverage_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Count partial statuses in the main coverage file
-            partial_count = len(re.findall(r'\|\s*\w+.*?\|\s*partial\s*\|', content, re.IGNORECASE))
+            # Count statuses in the main coverage file
+            status_counts = summarize_tables(self.documents.get(coverage_file)).status_counts
+            partial_count = status_counts.get('partial', 0)
             
             print(f"  Found {partial_count} components with 'partial' status in main Coverage.md")
+            print(f"  Status counts: {status_counts}")
             
             if partial_count > 0:
                 self.results['passed'].append({
                     'file': str(coverage_file),
                     'type': 'dataview_integration',
-                    'partial_count': partial_count
+                    'partial_count': partial_count,
+                    'status_counts': status_counts
                 })
                 print(f"  ✅ Dataview queries should pick up {partial_count} partial entries")
             else:
@@ -406,8 +397,15 @@ class WarpIntegrityChecker:
 
 def main():
     """Main entry point"""
-    checker = WarpIntegrityChecker()
-    success = checker.run_integrity_checks()
+    parser = argparse.ArgumentParser(description="Warp Documentation integrity checks")
+    add_executor_arguments(parser)
+    args = parser.parse_args()
+    
+    documents = DocumentStore(cache_path=DEFAULT_CACHE_PATH)
+    with executor_from_args(args) as executor:
+        checker = WarpIntegrityChecker(documents=documents, executor=executor)
+        success = checker.run_integrity_checks()
+    documents.save()
     
     return 0 if success else 1
 
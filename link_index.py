@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Link Indexes for Warp Documentation Protocol
+
+LinkResolver builds stem -> paths and relative-path -> path maps from a
+single walk of the documentation roots and resolves wikilinks and relative
+links in memory, using Obsidian-style shortest-path disambiguation when a
+bare name matches several files.
+
+BacklinkIndex is a reverse index from link target to the set of files that
+refer to it. It is filled once while links are extracted, so orphan
+detection and "who links here" queries are dictionary lookups instead of
+comparing every file against every collected link.
+"""
+
+import os
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+
+def normalize_link(link: str) -> str:
+    """Strip alias, fragment, leading ./ and a trailing .md from a link target"""
+    target = link.split('|', 1)[0].split('#', 1)[0].strip()
+    while target.startswith('./'):
+        target = target[2:]
+    if target.endswith('.md'):
+        target = target[:-3]
+    return target.rstrip('/')
+
+
+def link_stem(link: str) -> str:
+    """Return the file stem a link points at ([[../Docs/Coverage]] -> Coverage)"""
+    return normalize_link(link).rsplit('/', 1)[-1]
+
+
+class LinkResolver:
+    """In-memory link resolution over a one-time walk of the documentation roots"""
+
+    def __init__(self, base_path: Union[str, Path], roots: Optional[Iterable[Union[str, Path]]] = None):
+        self.base_path = Path(base_path)
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = set()
+        self.by_stem: Dict[str, List[str]] = defaultdict(list)
+        self.by_name: Dict[str, List[str]] = defaultdict(list)
+        self.root_names: Set[str] = set()
+        self.ambiguous_links: Dict[str, Set[str]] = defaultdict(set)
+
+        for root in roots if roots is not None else [self.base_path]:
+            self._index_root(Path(root))
+
+    def _index_root(self, root: Path) -> None:
+        """Walk one documentation root, recording every file and directory"""
+        if not root.is_dir():
+            return
+
+        root_rel = self.relative(root)
+        self.root_names.add(root_rel.split('/', 1)[0])
+        self.dirs.add(root_rel)
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Skip .git, .obsidian and other hidden directories
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            rel_dir = self.relative(dirpath)
+            for dirname in dirnames:
+                self.dirs.add(f"{rel_dir}/{dirname}" if rel_dir != '.' else dirname)
+            for filename in filenames:
+                rel_path = f"{rel_dir}/{filename}" if rel_dir != '.' else filename
+                self.files.add(rel_path)
+                self.by_name[filename].append(rel_path)
+                if filename.endswith('.md'):
+                    self.by_stem[filename[:-3]].append(rel_path)
+
+    def relative(self, path: Union[str, Path]) -> str:
+        """Path relative to base_path in POSIX form (string arithmetic, no syscalls)"""
+        return Path(os.path.relpath(str(path), str(self.base_path))).as_posix()
+
+    def ambiguous_stems(self) -> Dict[str, List[str]]:
+        """Note names shared by more than one file, with every candidate path"""
+        return {stem: sorted(paths) for stem, paths in self.by_stem.items() if len(paths) > 1}
+
+    def _lookup(self, rel_path: str) -> Optional[str]:
+        """Match a vault-relative path as a file, a directory or a note without .md"""
+        rel_path = os.path.normpath(rel_path).replace(os.sep, '/')
+        if rel_path in self.files or rel_path in self.dirs:
+            return rel_path
+        if not rel_path.endswith('.md') and f"{rel_path}.md" in self.files:
+            return f"{rel_path}.md"
+
+        # Outside the indexed roots we fall back to the filesystem
+        if rel_path.startswith('..') or rel_path.split('/', 1)[0] not in self.root_names:
+            target = self.base_path / rel_path
+            if target.exists():
+                return rel_path
+            if not rel_path.endswith('.md') and target.with_suffix('.md').exists():
+                return f"{rel_path}.md"
+        return None
+
+    def _pick(self, link: str, candidates: List[str], source_dir: str) -> str:
+        """Obsidian-style disambiguation: same folder first, then the shortest path"""
+        if len(candidates) == 1:
+            return candidates[0]
+        for candidate in candidates:
+            if candidate.rsplit('/', 1)[0] == source_dir:
+                return candidate
+        self.ambiguous_links[link].update(candidates)
+        return min(candidates, key=lambda path: (path.count('/'), path))
+
+    def resolve(self, link: str, source_file: Union[str, Path]) -> Optional[Path]:
+        """Resolve a link found in source_file to an absolute path, or None if broken"""
+        target = link.split('|', 1)[0].split('#', 1)[0].strip()
+        source_rel = self.relative(source_file)
+        if not target:
+            return Path(source_file)  # [[#Heading]] points into the same note
+
+        source_dir = source_rel.rsplit('/', 1)[0] if '/' in source_rel else '.'
+        resolved = None
+
+        if target.startswith(('../', './')):
+            resolved = self._lookup(f"{source_dir}/{target}")
+        elif '/' in target:
+            # Vault-absolute first, then relative to the source note, then a
+            # path suffix match ([[Components/api]] -> .../Components/api.md)
+            resolved = self._lookup(target.lstrip('/')) or self._lookup(f"{source_dir}/{target}")
+            if resolved is None:
+                suffix = '/' + (target if target.endswith('.md') else f"{target}.md")
+                name = suffix.rsplit('/', 1)[1]
+                candidates = [path for path in self.by_name.get(name, []) if ('/' + path).endswith(suffix)]
+                if candidates:
+                    resolved = self._pick(target, candidates, source_dir)
+        else:
+            resolved = self._lookup(f"{source_dir}/{target}")
+            if resolved is None:
+                candidates = self.by_name.get(target) or self.by_stem.get(target)
+                if candidates:
+                    resolved = self._pick(target, candidates, source_dir)
+            if resolved is None:
+                # Bare repository names link to that repository's Coverage.md
+                resolved = self._lookup(f"Repos Docs/{target}/Coverage.md")
+
+        return self.base_path / resolved if resolved is not None else None
+
+    def exists(self, link: str, source_file: Union[str, Path]) -> bool:
+        """Check whether a link resolves to an existing file or directory"""
+        return self.resolve(link, source_file) is not None
+
+
+class BacklinkIndex:
+    """Reverse index: link target -> files that link to it
+
+    With a LinkResolver the index is keyed by the resolved target path, so
+    two notes that share a name are told apart. Without one it falls back
+    to the target's file stem.
+    """
+
+    def __init__(self, resolver: Optional[LinkResolver] = None):
+        self.resolver = resolver
+        self.referrers: Dict[str, Set[str]] = defaultdict(set)
+        self.sources: Set[str] = set()
+
+    def _key(self, target: Union[str, Path]) -> str:
+        """Index key of an existing file"""
+        return str(target) if self.resolver else Path(target).stem
+
+    def add_links(self, source: Union[str, Path], links: Iterable[str]) -> List[str]:
+        """Record every link found in source
+
+        With a resolver, returns the links that resolve to nothing, so
+        callers checking for broken links need not resolve them again.
+        """
+        source = str(source)
+        self.sources.add(source)
+        broken = []
+        for link in links:
+            if self.resolver:
+                resolved = self.resolver.resolve(link, source)
+                key = str(resolved) if resolved is not None else None
+                if key is None:
+                    broken.append(link)
+            else:
+                key = link_stem(link)
+            if key:
+                self.referrers[key].add(source)
+        return broken
+
+    def backlinks_to(self, target: Union[str, Path]) -> Set[str]:
+        """Files (other than target itself) that link to target"""
+        target = str(target)
+        return {source for source in self.referrers.get(self._key(target), ())
+                if source != target}
+
+    def is_referenced(self, target: Union[str, Path]) -> bool:
+        """Check whether any other file links to target"""
+        return bool(self.backlinks_to(target))
+
+    def orphans(self, files: Iterable[Union[str, Path]]) -> List[str]:
+        """Files in the given list that nothing else links to"""
+        return [str(path) for path in files if not self.is_referenced(path)]
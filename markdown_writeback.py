@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Idempotent Markdown Writeback for Warp Documentation Protocol
+
+Helpers for scripts that update vault notes in place:
+
+• set_table_cell        - edit one cell of a table row, leaving the rest of
+                          the line byte-for-byte intact
+• replace_marked_section - replace the lines between <!-- name:start --> and
+                          <!-- name:end --> markers, inserting them once
+• write_if_changed      - skip the write when nothing changed, otherwise
+                          write a temp file and rename it over the note
+
+Running a script twice therefore leaves notes (and their mtimes, which the
+parse caches key on) untouched the second time.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+
+def _cell_spans(line: str) -> List[tuple]:
+    """(start, end) offsets of each cell's text between the pipes of a table row"""
+    body_end = len(line.rstrip('\r\n'))
+    pipes = [i for i in range(body_end) if line[i] == '|']
+    return [(pipes[i] + 1, pipes[i + 1]) for i in range(len(pipes) - 1)]
+
+
+def set_table_cell(line: str, column: int, value: str) -> str:
+    """Return line with cell number column (0-based) set to value
+
+    The cell keeps its original padding style; the line is returned
+    unchanged when the cell already holds value or does not exist.
+    """
+    spans = _cell_spans(line)
+    if column >= len(spans):
+        return line
+    start, end = spans[column]
+    cell = line[start:end]
+    if cell.strip() == value:
+        return line
+    left = ' ' if cell.startswith(' ') else ''
+    right = ' ' if cell.endswith(' ') and cell.strip() else left
+    return line[:start] + left + value + right + line[end:]
+
+
+def marker_lines(name: str) -> tuple:
+    """Start and end marker lines of a managed section"""
+    return f"<!-- {name}:start -->\n", f"<!-- {name}:end -->\n"
+
+
+def find_marked_section(lines: Sequence[str], name: str) -> Optional[tuple]:
+    """(start, end) line indexes of a managed section's markers, or None"""
+    start_marker, end_marker = (marker.strip() for marker in marker_lines(name))
+    start = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if start is None and stripped == start_marker:
+            start = index
+        elif start is not None and stripped == end_marker:
+            return start, index
+    return None
+
+
+def replace_marked_section(lines: List[str], name: str, body: List[str],
+                           insert_at: Optional[int] = None) -> List[str]:
+    """Replace a managed section's body, adding the section if it is missing
+
+    A missing section goes at line insert_at, set off from its neighbours by
+    blank lines, or after a blank line at the end of the file when insert_at
+    is None.
+    """
+    start_marker, end_marker = marker_lines(name)
+    section = [start_marker] + list(body) + [end_marker]
+    found = find_marked_section(lines, name)
+    if found is not None:
+        start, end = found
+        return lines[:start] + section + lines[end + 1:]
+    if insert_at is not None:
+        before, after = lines[:insert_at], lines[insert_at:]
+        if before and not before[-1].endswith('\n'):
+            before[-1] += '\n'
+        if before and before[-1].strip():
+            section = ['\n'] + section
+        if after and after[0].strip():
+            section = section + ['\n']
+        return before + section + after
+    if lines and not lines[-1].endswith('\n'):
+        lines = lines[:-1] + [lines[-1] + '\n']
+    return lines + ['\n'] + section
+
+
+def write_if_changed(path: Union[str, Path], content: str, encoding: str = 'utf-8') -> bool:
+    """Atomically replace path with content unless it already matches; True if written"""
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(content)
+        if path.exists():
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
@@ -9,20 +9,30 @@ Performs automated checks:
 • No orphan files without backlinks
 """
 
-import os
 import re
-import json
+import argparse
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional
+
+from vault_parser import DEFAULT_CACHE_PATH, DocumentStore, extract_links
+from link_index import BacklinkIndex, LinkResolver
+from check_executor import CheckExecutor, add_executor_arguments, executor_from_args
+from coverage_table import coverage_rows
+
+COVERAGE_STATUSES = ('todo', 'partial', 'done', 'disconnected')
 
 class WarpQualityChecker:
-    def __init__(self, base_path: str = "/home/cinder/Documents/repos"):
+    def __init__(self, base_path: str = "/home/cinder/Documents/repos",
+                 documents: Optional[DocumentStore] = None,
+                 executor: Optional[CheckExecutor] = None):
         self.base_path = Path(base_path)
+        self.documents = documents or DocumentStore()
+        self.executor = executor or CheckExecutor()
         self.errors = []
         self.warnings = []
-        self.link_cache = {}
         self.file_counts = {}
+        self.resolver: Optional[LinkResolver] = None
+        self.backlinks: Optional[BacklinkIndex] = None
         
     def log_error(self, message: str):
         """Log an error message"""
@@ -38,18 +48,19 @@ class WarpQualityChecker:
         """Log a success message"""
         print(f"✅ {message}")
 
-    def find_markdown_files(self) -> List[Path]:
-        """Find all Markdown files in the documentation structure"""
-        markdown_files = []
-        
-        # Search in key directories
-        search_dirs = [
+    def search_dirs(self) -> List[Path]:
+        """Key directories of the documentation structure"""
+        return [
             self.base_path / "Warp",
             self.base_path / "Twitch Docs", 
             self.base_path / "Repos Docs"
         ]
+
+    def find_markdown_files(self) -> List[Path]:
+        """Find all Markdown files in the documentation structure"""
+        markdown_files = []
         
-        for search_dir in search_dirs:
+        for search_dir in self.search_dirs():
             if search_dir.exists():
                 for md_file in search_dir.rglob("*.md"):
                     if md_file.is_file():
@@ -59,86 +70,36 @@ class WarpQualityChecker:
 
     def extract_markdown_links(self, content: str) -> List[str]:
         """Extract Obsidian-style [[...]] and standard [...](...) markdown links"""
-        obsidian_links = re.findall(r'\[\[([^\]]+)\]\]', content)
-        standard_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
-        
-        links = []
-        # Add Obsidian links
-        links.extend(obsidian_links)
-        
-        # Add standard links (file paths only, not URLs)
-        for text, url in standard_links:
-            if not url.startswith(('http', 'mailto:', '#')):
-                links.append(url)
-        
-        return links
+        return extract_links(content)
+
+    def get_resolver(self) -> LinkResolver:
+        """Build the in-memory link resolver from one walk of the documentation roots"""
+        if self.resolver is None:
+            self.resolver = LinkResolver(self.base_path, self.search_dirs())
+        return self.resolver
 
     def resolve_link(self, link: str, source_file: Path) -> bool:
         """Check if a link resolves to an existing file"""
-        # Cache links to avoid repeated file system checks
-        cache_key = f"{source_file}:{link}"
-        if cache_key in self.link_cache:
-            return self.link_cache[cache_key]
-        
-        # Clean up link - remove fragments
-        clean_link = link.split('#')[0]
-        
-        # Handle relative paths
-        if clean_link.startswith('../'):
-            target_path = (source_file.parent / clean_link).resolve()
-        elif clean_link.startswith('./'):
-            target_path = (source_file.parent / clean_link[2:]).resolve()
-        elif '/' in clean_link:
-            # Absolute path within documentation structure
-            target_path = self.base_path / clean_link.lstrip('/')
-        else:
-            # Relative to current directory or search in common locations
-            target_path = source_file.parent / f"{clean_link}.md"
-            
-            # If not found, search in common doc locations
-            if not target_path.exists():
-                search_locations = [
-                    source_file.parent / "Components" / f"{clean_link}.md",
-                    self.base_path / "Twitch Docs" / "Components" / f"{clean_link}.md",
-                    self.base_path / "Repos Docs" / clean_link / "Coverage.md",
-                    self.base_path / "Warp" / f"{clean_link}.md"
-                ]
-                
-                for search_path in search_locations:
-                    if search_path.exists():
-                        target_path = search_path
-                        break
-        
-        # Check if target exists
-        exists = target_path.exists()
-        
-        # Also try with .md extension if no extension provided
-        if not exists and not clean_link.endswith('.md'):
-            md_path = target_path.with_suffix('.md')
-            exists = md_path.exists()
-        
-        self.link_cache[cache_key] = exists
-        return exists
+        return self.get_resolver().exists(link, source_file)
 
     def check_markdown_links(self) -> bool:
         """Check that all Markdown links resolve to existing files"""
         print("\n🔍 Checking Markdown links...")
         
         markdown_files = self.find_markdown_files()
+        self.documents.prefetch(markdown_files, self.executor)
         all_links_valid = True
         broken_links = []
+        self.backlinks = BacklinkIndex(self.get_resolver())
         
         for md_file in markdown_files:
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                links = self.extract_markdown_links(content)
+                links = self.documents.get(md_file).markdown_links()
                 
-                for link in links:
-                    if not self.resolve_link(link, md_file):
-                        broken_links.append((md_file, link))
-                        all_links_valid = False
+                # Resolved once: the backlink index reports the links that point nowhere
+                for link in self.backlinks.add_links(md_file, links):
+                    broken_links.append((md_file, link))
+                    all_links_valid = False
                         
             except Exception as e:
                 self.log_error(f"Error reading {md_file}: {e}")
@@ -149,6 +110,11 @@ class WarpQualityChecker:
                 self.log_error(f"Broken link '{link}' in {file_path}")
         else:
             self.log_success("All Markdown links resolve correctly")
+        
+        # Report bare links whose name matches several notes
+        for link, candidates in sorted(self.resolver.ambiguous_links.items()):
+            print(f"ℹ️  Ambiguous link '{link}' matches {len(candidates)} files; "
+                  f"resolved by shortest path")
             
         return all_links_valid
 
@@ -158,8 +124,7 @@ class WarpQualityChecker:
             return {}
         
         try:
-            with open(coverage_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = self.documents.get(coverage_file)
             
             counts = {
                 'total': 0,
@@ -169,30 +134,19 @@ class WarpQualityChecker:
                 'disconnected': 0
             }
             
-            # Look for table rows with status indicators
-            # Match various table formats used in Coverage files
-            table_rows = re.findall(r'\|[^|]*\|[^|]*\|[^|]*\|(todo|partial|done|disconnected)', content, re.IGNORECASE)
-            
-            for status in table_rows:
-                status_lower = status.lower()
-                if status_lower in counts:
+            # Component rows with a status indicator in the Status column
+            for row in coverage_rows(document):
+                status_lower = row.status_key
+                if status_lower in COVERAGE_STATUSES:
                     counts[status_lower] += 1
                     counts['total'] += 1
             
             # Also check for checkbox lists
-            checkbox_patterns = [
-                r'- \[[x ]\][^|]*\|(todo|partial|done|disconnected)',
-                r'- \[[x ]\].*– ([^|]*) – see',
-            ]
-            
-            for pattern in checkbox_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        status_lower = 'todo'  # Assume these are todos
-                    else:
-                        status_lower = match.lower()
-                    
+            for checked, text in document.tasks:
+                match = (re.match(r'[^|]*\|(todo|partial|done|disconnected)', text, re.IGNORECASE) or
+                         re.search(r'– ([^|]*) – see', text))
+                if match:
+                    status_lower = match.group(1).lower()
                     if status_lower in counts:
                         counts[status_lower] += 1
                         counts['total'] += 1
@@ -281,28 +235,32 @@ class WarpQualityChecker:
         
         return counts_match
 
+    def build_backlink_index(self, markdown_files: List[Path]) -> BacklinkIndex:
+        """Build the reverse link index (target -> referring files) in one pass"""
+        backlinks = BacklinkIndex(self.get_resolver())
+        self.documents.prefetch(markdown_files, self.executor)
+        for md_file in markdown_files:
+            try:
+                backlinks.add_links(md_file, self.documents.get(md_file).markdown_links())
+            except Exception as e:
+                self.log_warning(f"Error reading {md_file} for link extraction: {e}")
+        return backlinks
+
+    def backlinks_to(self, target: Path) -> List[Path]:
+        """Answer "who links here" for a documentation file"""
+        if self.backlinks is None:
+            self.backlinks = self.build_backlink_index(self.find_markdown_files())
+        return sorted(Path(source) for source in self.backlinks.backlinks_to(target))
+
     def find_orphan_files(self) -> List[Path]:
         """Find files that don't have backlinks from other documentation"""
         print("\n🔍 Checking for orphan files...")
         
         markdown_files = self.find_markdown_files()
-        all_links = set()
         
-        # Collect all links from all files
-        for md_file in markdown_files:
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                links = self.extract_markdown_links(content)
-                for link in links:
-                    # Normalize link paths
-                    clean_link = link.split('#')[0]
-                    if clean_link:
-                        all_links.add(clean_link)
-                        
-            except Exception as e:
-                self.log_warning(f"Error reading {md_file} for link extraction: {e}")
+        # Reuse the backlink index built during link checking when available
+        if self.backlinks is None:
+            self.backlinks = self.build_backlink_index(markdown_files)
         
         # Find files that aren't linked to
         orphan_files = []
@@ -311,22 +269,8 @@ class WarpQualityChecker:
             # Skip certain system files
             if md_file.name in ['Readme.md', 'README.md', 'Index.md', 'Changelog.md', 'Tasks.md', 'AGENTS.md']:
                 continue
-                
-            file_referenced = False
-            file_stem = md_file.stem
-            relative_path = str(md_file.relative_to(self.base_path))
-            
-            # Check if this file is referenced by any link
-            for link in all_links:
-                if (link == file_stem or 
-                    link == relative_path or
-                    link.endswith(f"/{file_stem}") or
-                    link.endswith(f"/{md_file.name}") or
-                    file_stem in link):
-                    file_referenced = True
-                    break
             
-            if not file_referenced:
+            if not self.backlinks.is_referenced(md_file):
                 orphan_files.append(md_file)
         
         if orphan_files:
@@ -378,8 +322,15 @@ class WarpQualityChecker:
         return all_checks_passed
 
 def main():
-    checker = WarpQualityChecker()
-    success = checker.run_all_checks()
+    parser = argparse.ArgumentParser(description="Warp Documentation Protocol quality assurance checks")
+    add_executor_arguments(parser)
+    args = parser.parse_args()
+    
+    documents = DocumentStore(cache_path=DEFAULT_CACHE_PATH)
+    with executor_from_args(args) as executor:
+        checker = WarpQualityChecker(documents=documents, executor=executor)
+        success = checker.run_all_checks()
+    documents.save()
     return 0 if success else 1
 
 if __name__ == "__main__":
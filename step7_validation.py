@@ -9,9 +9,12 @@ This script focuses on the specific validation requirements:
 """
 
 import os
-import re
-import glob
-from pathlib import Path
+
+from vault_parser import DocumentStore
+from coverage_table import summarize_tables
+
+# Shared per-run document store so every check reads each file once
+DOCUMENTS = DocumentStore()
 
 def check_obsidian_tables():
     """Check if Coverage.md tables have proper structure for Obsidian rendering"""
@@ -24,20 +27,21 @@ def check_obsidian_tables():
         print("  ❌ Main Coverage.md file not found")
         return False
     
-    with open(coverage_file, 'r') as f:
-        content = f.read()
+    document = DOCUMENTS.get(coverage_file)
     
-    # Check for proper table structure
-    table_headers = re.findall(r'\|\s*Component\s*\|.*?\|\s*Status\s*\|', content, re.IGNORECASE)
-    table_separators = re.findall(r'\|\s*-+\s*\|', content)
-    partial_entries = re.findall(r'\|\s*\w+.*?\|\s*partial\s*\|', content, re.IGNORECASE)
+    # Check for proper table structure, counting statuses from the split cells
+    summary = summarize_tables(document)
+    partial_entries = summary.count('partial')
     
-    print(f"  ✅ Found {len(table_headers)} table headers")
-    print(f"  ✅ Found {len(table_separators)} table separators")
-    print(f"  ✅ Found {len(partial_entries)} partial status entries")
+    print(f"  ✅ Found {summary.tables} table headers")
+    print(f"  ✅ Found {summary.separators} table separators")
+    print(f"  ✅ Found {partial_entries} partial status entries")
+    print(f"  📊 Status counts: {summary.status_counts}")
+    if summary.malformed_rows:
+        print(f"  ⚠️  {len(summary.malformed_rows)} rows with a different cell count than the header")
     
     # Validate table structure
-    if len(table_headers) > 0 and len(partial_entries) > 0:
+    if summary.valid and partial_entries > 0:
         print("  ✅ Coverage.md tables are properly formatted for Obsidian rendering")
         return True
     else:
@@ -58,11 +62,8 @@ def check_dataview_queries():
                 if file.endswith('.md'):
                     file_path = os.path.join(root, file)
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
                         # Look for dataview blocks
-                        dataview_blocks = re.findall(r'```dataview\n(.*?)\n```', content, re.DOTALL)
+                        dataview_blocks = DOCUMENTS.get(file_path).dataview_blocks
                         
                         if dataview_blocks:
                             dataview_files.append({
@@ -91,9 +92,7 @@ def check_dataview_queries():
     partial_count = 0
     
     if os.path.exists(coverage_file):
-        with open(coverage_file, 'r') as f:
-            content = f.read()
-        partial_count = len(re.findall(r'\|\s*\w+.*?\|\s*partial\s*\|', content, re.IGNORECASE))
+        partial_count = summarize_tables(DOCUMENTS.get(coverage_file)).count('partial')
     
     print(f"  ✅ {partial_count} components with 'partial' status available for Dataview queries")
     
@@ -146,19 +145,18 @@ def check_required_sections_and_backlinks():
     
     for file_path in files_to_check[:10]:  # Check first 10 files as sample
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = DOCUMENTS.get(file_path)
             
             file_name = os.path.basename(file_path)
             
             # Check for required sections
-            has_purpose = bool(re.search(r'^##\s+Purpose', content, re.MULTILINE | re.IGNORECASE))
-            has_depends = bool(re.search(r'^##\s+Depends On', content, re.MULTILINE | re.IGNORECASE))
-            has_used_by = bool(re.search(r'^##\s+Used By', content, re.MULTILINE | re.IGNORECASE))
+            has_purpose = document.has_heading('Purpose', prefix=True)
+            has_depends = document.has_heading('Depends On', prefix=True)
+            has_used_by = document.has_heading('Used By', prefix=True)
             
             # Check for backlinks
-            has_coverage_link = bool(re.search(r'\[\[.*Coverage.*\]\]', content, re.IGNORECASE))
-            has_index_link = bool(re.search(r'\[\[.*Index.*\]\]', content, re.IGNORECASE))
+            has_coverage_link = any('coverage' in link.lower() for link in document.wikilinks)
+            has_index_link = any('index' in link.lower() for link in document.wikilinks)
             
             sections_ok = has_purpose and has_depends and has_used_by
             backlinks_ok = has_coverage_link
@@ -186,41 +184,44 @@ def check_required_sections_and_backlinks():
     
     return passed_files > failed_files
 
+# Counts over parsed documents that replaced the case-insensitive grep
+# patterns. Links match exactly [[Coverage]] / [[Index]] in any case, as the
+# grep did. The rest count parsed structure rather than text: partial
+# statuses are Status cells of Coverage tables (not any "| partial |" in the
+# file), the YAML status is the frontmatter field (not "status: partial"
+# anywhere), and dataview blocks are fenced ```dataview blocks only
+# (not ```dataviewjs).
+SPECIFIC_PATTERNS = [
+    ("Coverage backlinks", lambda doc: sum(1 for link in doc.wikilinks if link.lower() == 'coverage')),
+    ("Index backlinks", lambda doc: sum(1 for link in doc.wikilinks if link.lower() == 'index')),
+    ("Partial status entries", lambda doc: summarize_tables(doc).count('partial')),
+    ("YAML partial status", lambda doc: int(str((doc.frontmatter or {}).get('status', '')).lower() == 'partial')),
+    ("Dataview code blocks", lambda doc: len(doc.dataview_blocks)),
+]
+
 def validate_specific_patterns():
-    """Validate specific patterns mentioned in the task"""
+    """Validate specific patterns mentioned in the task (see SPECIFIC_PATTERNS)"""
     print("\n🎯 Running specific validation patterns...")
     
     # Check for grep-able patterns
     coverage_file = "/home/cinder/Documents/repos/Twitch Docs/Coverage.md"
     
-    patterns_to_check = [
-        (r'\[\[Coverage\]\]', "Coverage backlinks"),
-        (r'\[\[Index\]\]', "Index backlinks"),
-        (r'\|\s*partial\s*\|', "Partial status entries"),
-        (r'status:\s*partial', "YAML partial status"),
-        (r'```dataview', "Dataview code blocks")
-    ]
-    
-    for pattern, description in patterns_to_check:
-        matches = 0
-        
-        # Check in main Coverage file
-        if os.path.exists(coverage_file):
-            with open(coverage_file, 'r') as f:
-                content = f.read()
-            matches += len(re.findall(pattern, content, re.IGNORECASE))
-        
-        # Check in component files
-        components_dir = "/home/cinder/Documents/repos/Twitch Docs/Components"
-        if os.path.exists(components_dir):
-            for file_name in os.listdir(components_dir):
-                if file_name.endswith('.md'):
-                    try:
-                        with open(os.path.join(components_dir, file_name), 'r') as f:
-                            content = f.read()
-                        matches += len(re.findall(pattern, content, re.IGNORECASE))
-                    except Exception:
-                        continue
+    # Parse the main Coverage file and component files once for all patterns
+    documents = []
+    if os.path.exists(coverage_file):
+        documents.append(DOCUMENTS.get(coverage_file))
+    
+    components_dir = "/home/cinder/Documents/repos/Twitch Docs/Components"
+    if os.path.exists(components_dir):
+        for file_name in os.listdir(components_dir):
+            if file_name.endswith('.md'):
+                try:
+                    documents.append(DOCUMENTS.get(os.path.join(components_dir, file_name)))
+                except Exception:
+                    continue
+    
+    for description, count_matches in SPECIFIC_PATTERNS:
+        matches = sum(count_matches(document) for document in documents)
         
         print(f"  ✅ Found {matches} instances of {description}")
     
@@ -0,0 +1,39 @@
+"""Coverage table parsing: header detection and the positional fallback"""
+
+from coverage_table import coverage_rows, iter_coverage_rows
+from vault_parser import parse_markdown
+
+CONTENT = """# Coverage
+
+| Metric | Count |
+|---|---|
+| Total | 5 |
+| todo | 3 |
+
+| a | service | /src/a | todo | 2025-01-01 | a.md | [[b]] |
+| b | service | /src/b | done | 2025-01-01 | b.md | [[a]] |
+
+| short | row |
+
+| Component | Type | Status |
+|---|---|---|
+| c | lib | partial |
+"""
+
+
+def both_parsers(content):
+    streamed = [(row.component, row.status, row.line) for row in iter_coverage_rows(content.splitlines())]
+    parsed = [(row.component, row.status, row.line) for row in coverage_rows(parse_markdown(content))]
+    assert streamed == parsed
+    return streamed
+
+
+def test_other_tables_are_not_read_as_components():
+    components = [component for component, _, _ in both_parsers(CONTENT)]
+
+    assert 'Metric' not in components and 'Total' not in components and 'todo' not in components
+    assert 'short' not in components
+
+
+def test_headerless_and_headed_tables():
+    assert both_parsers(CONTENT) == [('a', 'todo', 8), ('b', 'done', 9), ('c', 'partial', 15)]
@@ -0,0 +1,33 @@
+"""Dependency structure over the condensation DAG"""
+
+from graph_algorithms import condensation, longest_chain
+from graph_traversal import GraphTraversal
+
+
+def test_longest_chain_starts_among_sources():
+    # 'isolated' has no Mermaid edge and condenses to the lowest component id
+    graph = {'isolated': [], 'a': ['b'], 'b': ['a']}
+    components, component_of, successors = condensation(graph)
+    assert component_of['isolated'] == 0
+
+    cycle = component_of['a']
+    assert longest_chain(successors) == [0]
+    assert longest_chain(successors, [cycle]) == [cycle]
+    assert sorted(components[cycle]) == ['a', 'b']
+
+
+def test_longest_chain_without_sources():
+    assert longest_chain([], []) == []
+    assert longest_chain([set()], []) == []
+
+
+def test_dependency_chain_skips_components_without_mermaid_edges():
+    traversal = GraphTraversal()
+    traversal.store.intern('isolated')
+    traversal.store.add_directed_edge('a', 'b')
+    traversal.store.add_directed_edge('b', 'a')
+
+    traversal.analyze_dependencies()
+
+    assert traversal.dependency_cycles == [['a', 'b']]
+    assert traversal.longest_dependency_chain == [['a', 'b']]
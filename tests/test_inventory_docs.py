@@ -0,0 +1,70 @@
+"""Incremental inventory runs must match a full rescan"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.scripts'))
+
+import inventory_docs  # noqa: E402
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+def inventory(monkeypatch, base, output_dir, *options):
+    monkeypatch.setattr(sys, 'argv', ['inventory_docs.py', '--base-path', str(base),
+                                      '--output-dir', str(output_dir), '-q', *options])
+    inventory_docs.main()
+    with open(output_dir / inventory_docs.MERGED_NAME, encoding='utf-8') as f:
+        return sorted(doc['relative_path'] for doc in json.load(f)['documentation_files'])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / 'base' / 'repo'
+    (repo / 'gen' / 'docs').mkdir(parents=True)
+    (repo / '.gitignore').write_text('gen/\n')
+    (repo / 'README.md').write_text('# Repo\n')
+    (repo / 'gen' / 'docs' / 'a.md').write_text('a\n')
+    git(repo, 'init', '-q')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-qm', 'initial')
+    return repo
+
+
+def test_nested_doc_under_ignored_directory(repo, tmp_path, monkeypatch):
+    base, output_dir = repo.parent, tmp_path / 'out'
+    assert inventory(monkeypatch, base, output_dir) == ['README.md', 'gen/docs/a.md']
+
+    (repo / 'gen' / 'docs' / 'sub').mkdir()
+    (repo / 'gen' / 'docs' / 'sub' / 'b.md').write_text('b\n')
+
+    expected = ['README.md', 'gen/docs/a.md', 'gen/docs/sub/b.md']
+    assert inventory(monkeypatch, base, output_dir) == expected
+    assert inventory(monkeypatch, base, tmp_path / 'full', '--full') == expected
+
+
+def test_edit_deep_under_ignored_directory_changes_state(repo):
+    (repo / 'gen' / 'docs' / 'sub').mkdir()
+    doc = repo / 'gen' / 'docs' / 'sub' / 'b.md'
+    doc.write_text('b\n')
+    before = inventory_docs.repository_state(str(repo))
+
+    doc.write_text('b, edited\n')
+    os.utime(doc, ns=(doc.stat().st_atime_ns, doc.stat().st_mtime_ns + 10 ** 9))
+
+    assert inventory_docs.repository_state(str(repo)) != before
+
+
+def test_worker_errors_are_raised(repo):
+    def failing_filter(repo_path):
+        raise PermissionError(repo_path)
+
+    with pytest.raises(PermissionError):
+        list(inventory_docs.scan_for_docs(str(repo.parent), verbose=False, repo_filter=failing_filter))
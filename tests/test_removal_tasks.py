@@ -0,0 +1,101 @@
+"""Removal-task writeback against a minimal Tasks.md with legacy and hand-written sections"""
+
+import os
+import shutil
+
+import graph_traversal
+from graph_traversal import REMOVAL_TASK_PREFIX, REMOVAL_TASKS_HEADING, GraphTraversal
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'Tasks.md')
+HAND_WRITTEN_TASK = "- [ ] Document live (service) – see [[../Twitch Docs/Coverage]]\n"
+NEW_TASKS = [
+    "## New Tasks (2025-01-14 Inventory Refresh)\n",
+    "- [ ] Document the refreshed repository inventory\n",
+    "- [ ] Link new repositories from [[Index]]\n",
+    "\n",
+]
+
+
+def read_lines(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read().splitlines(keepends=True)
+
+
+def test_strip_removes_every_legacy_task():
+    lines = read_lines(FIXTURE)
+    assert sum(REMOVAL_TASK_PREFIX in line for line in lines) == 4
+
+    kept, done = GraphTraversal.strip_removal_task_sections(lines)
+
+    assert not any(REMOVAL_TASK_PREFIX in line for line in kept)
+    assert done == set()
+    # Only the tasks and the legacy heading over them go; every other line stays
+    expected = [line for line in lines if line.strip() and REMOVAL_TASK_PREFIX not in line]
+    expected.remove(REMOVAL_TASKS_HEADING + '\n')  # first occurrence
+    assert [line for line in kept if line.strip()] == expected
+
+
+def test_strip_keeps_heading_over_hand_written_tasks():
+    kept, _ = GraphTraversal.strip_removal_task_sections(read_lines(FIXTURE))
+
+    index = kept.index(HAND_WRITTEN_TASK)
+    assert kept[index - 2].strip() == REMOVAL_TASKS_HEADING
+    assert sum(line.strip() == REMOVAL_TASKS_HEADING for line in kept) == 1
+
+
+def test_strip_keeps_ticked_legacy_tasks():
+    lines = read_lines(FIXTURE)
+    ticked = next(i for i, line in enumerate(lines) if REMOVAL_TASK_PREFIX + ' BXT ' in line)
+    lines[ticked] = lines[ticked].replace('- [ ]', '- [x]')
+
+    _, done = GraphTraversal.strip_removal_task_sections(lines)
+
+    assert done == {'BXT'}
+
+
+def test_update_tasks_file_is_idempotent(tmp_path, monkeypatch):
+    shutil.copy(FIXTURE, tmp_path / 'Tasks.md')
+    monkeypatch.setattr(graph_traversal, 'WARP_DIR', str(tmp_path))
+    traversal = GraphTraversal()
+    traversal.disconnected_components = {'BXT', 'utils'}
+
+    traversal.update_tasks_file()
+    first = (tmp_path / 'Tasks.md').read_text(encoding='utf-8')
+    traversal.update_tasks_file()
+    second = (tmp_path / 'Tasks.md').read_text(encoding='utf-8')
+
+    assert first == second
+    assert first.count(REMOVAL_TASK_PREFIX) == 2
+    assert first.count('<!-- disconnected-removal:start -->') == 1
+    assert HAND_WRITTEN_TASK in first
+
+
+def test_managed_section_goes_after_new_tasks_items(tmp_path, monkeypatch):
+    shutil.copy(FIXTURE, tmp_path / 'Tasks.md')
+    monkeypatch.setattr(graph_traversal, 'WARP_DIR', str(tmp_path))
+    traversal = GraphTraversal()
+    traversal.disconnected_components = {'BXT'}
+
+    traversal.update_tasks_file()
+    lines = read_lines(tmp_path / 'Tasks.md')
+
+    start = lines.index(NEW_TASKS[0])
+    assert lines[start:start + len(NEW_TASKS)] == NEW_TASKS
+    assert lines[start + len(NEW_TASKS)] == "<!-- disconnected-removal:start -->\n"
+    end = lines.index("<!-- disconnected-removal:end -->\n")
+    assert lines[end + 1:end + 3] == ["\n", REMOVAL_TASKS_HEADING + "\n"]
+
+
+def test_strip_keeps_heading_over_mixed_content():
+    lines = [
+        f"{REMOVAL_TASKS_HEADING}\n",
+        "\n",
+        f"- [ ] {REMOVAL_TASK_PREFIX} BXT – see [[Coverage]]\n",
+        HAND_WRITTEN_TASK,
+        "\n",
+        "## Next\n",
+    ]
+
+    kept, _ = GraphTraversal.strip_removal_task_sections(lines)
+
+    assert kept == [lines[0], lines[1], HAND_WRITTEN_TASK, "\n", "## Next\n"]
@@ -0,0 +1,52 @@
+"""The parsed-document counts behind validate_specific_patterns"""
+
+from step7_validation import SPECIFIC_PATTERNS
+from vault_parser import parse_markdown
+
+CONTENT = """---
+status: partial
+---
+# Component
+
+See [[Coverage]], [[coverage]], [[Coverage|the table]] and [[INDEX]].
+
+The old grep also matched status: partial written in the body.
+
+| Component | Status | Notes |
+|---|---|---|
+| a | partial | |
+| b | Partial | |
+| c | done | partial |
+
+| Metric | Value |
+|---|---|
+| Mode | partial |
+
+```dataview
+TABLE status FROM "Components" WHERE status = "partial"
+```
+
+```dataviewjs
+dv.list([])
+```
+"""
+
+
+def counts(content):
+    document = parse_markdown(content)
+    return {description: count(document) for description, count in SPECIFIC_PATTERNS}
+
+
+def test_counts_follow_document_structure():
+    assert counts(CONTENT) == {
+        "Coverage backlinks": 2,  # case-insensitive like the grep; aliased links never matched
+        "Index backlinks": 1,
+        "Partial status entries": 2,  # Status column only, not Notes or other tables
+        "YAML partial status": 1,  # frontmatter only, not the body sentence
+        "Dataview code blocks": 1,  # dataviewjs is not a Dataview query block
+    }
+
+
+def test_yaml_status_must_be_in_frontmatter():
+    assert counts("# Note\n\nstatus: partial\n")["YAML partial status"] == 0
+    assert counts("---\nstatus: partially done\n---\n")["YAML partial status"] == 0
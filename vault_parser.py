@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Shared Markdown Document Model for Warp Documentation Protocol
+
+Reads each vault file once and produces a parsed document that every checker
+(qa_checks, integrity_check, backlink_audit, step7_validation,
+frontmatter_check) consumes instead of re-opening and re-regexing the file:
+
+• YAML frontmatter (parsed dict plus format/YAML errors)
+• Heading outline
+• Obsidian [[...]] wikilinks and standard [...](...) links
+• Markdown tables (header + rows of cells)
+• Dataview code blocks
+• Checkbox task items
+
+Parsed documents can be persisted in .scripts/cache/parse_cache.json so a
+warm run only re-parses files whose size, mtime and content hash changed.
+"""
+
+import os
+import re
+import json
+import hashlib
+import datetime
+import yaml
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Bump whenever parsing rules or the VaultDocument layout change so stale
+# cache entries are discarded instead of being served to the checkers
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / ".scripts" / "cache" / "parse_cache.json"
+
+WIKILINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+STANDARD_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+FRONTMATTER_PATTERN = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*$', re.DOTALL | re.MULTILINE)
+HEADING_PATTERN = re.compile(r'^\s*(#{1,6})\s+(.*?)\s*$')
+TASK_PATTERN = re.compile(r'^\s*[-*]\s+\[([ xX])\]\s?(.*)$')
+SEPARATOR_CELL_PATTERN = re.compile(r'^:?-+:?$')
+
+
+@dataclass
+class MarkdownTable:
+    """A pipe table: header cells, body rows and the 1-based line it starts on"""
+    header: List[str]
+    rows: List[List[str]]
+    line: int
+    header_line: str = ""
+    has_separator: bool = False
+
+    def column_index(self, name: str) -> Optional[int]:
+        """Return the index of a header column (case-insensitive), if present"""
+        wanted = name.strip().lower()
+        for i, cell in enumerate(self.header):
+            if cell.strip().lower() == wanted:
+                return i
+        return None
+
+
+@dataclass
+class VaultDocument:
+    """Parsed form of one Markdown file in the vault"""
+    path: str
+    has_frontmatter: bool = False
+    frontmatter_raw: Optional[str] = None
+    frontmatter: Optional[Dict] = None
+    frontmatter_error: Optional[str] = None
+    headings: List[Tuple[int, str]] = field(default_factory=list)
+    wikilinks: List[str] = field(default_factory=list)
+    standard_links: List[Tuple[str, str]] = field(default_factory=list)
+    tables: List[MarkdownTable] = field(default_factory=list)
+    dataview_blocks: List[str] = field(default_factory=list)
+    tasks: List[Tuple[bool, str]] = field(default_factory=list)
+
+    @property
+    def link_targets(self) -> List[str]:
+        """Wikilink targets without display aliases ([[target|alias]] -> target)"""
+        return [link.split('|', 1)[0] for link in self.wikilinks]
+
+    def markdown_links(self) -> List[str]:
+        """Wikilinks plus local standard-link URLs (URLs, mailto and anchors skipped)"""
+        links = list(self.wikilinks)
+        for text, url in self.standard_links:
+            if not url.startswith(('http', 'mailto:', '#')):
+                links.append(url)
+        return links
+
+    def has_heading(self, title: str, level: int = 2, prefix: bool = False) -> bool:
+        """Check for a heading with the given title (case-insensitive)"""
+        wanted = title.lower()
+        for heading_level, text in self.headings:
+            if heading_level != level:
+                continue
+            text = text.lower()
+            if text == wanted or (prefix and text.startswith(wanted)):
+                return True
+        return False
+
+
+def extract_links(content: str) -> List[str]:
+    """Extract Obsidian-style [[...]] and local standard [...](...) link targets"""
+    links = WIKILINK_PATTERN.findall(content)
+    for text, url in STANDARD_LINK_PATTERN.findall(content):
+        if not url.startswith(('http', 'mailto:', '#')):
+            links.append(url)
+    return links
+
+
+def split_table_row(line: str) -> List[str]:
+    """Split a pipe-table line into stripped cells, honouring escaped \\| pipes"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    cells = re.split(r'(?<!\\)\|', line)
+    return [cell.strip() for cell in cells]
+
+
+def is_separator_row(cells: List[str]) -> bool:
+    """Check whether table cells form a header separator row (| --- | :-: |)"""
+    filled = [cell for cell in cells if cell]
+    return bool(filled) and all(SEPARATOR_CELL_PATTERN.match(cell) for cell in filled)
+
+
+def extend_table(table: Optional[MarkdownTable], line: str, lineno: int) -> MarkdownTable:
+    """Add one stripped '|' line to the table being read; None starts a new table"""
+    cells = split_table_row(line)
+    if table is None:
+        return MarkdownTable(header=cells, rows=[], line=lineno, header_line=line)
+    if not table.rows and not table.has_separator and is_separator_row(cells):
+        table.has_separator = True
+    else:
+        table.rows.append(cells)
+    return table
+
+
+def iter_tables(lines: Iterable[str]) -> Iterator[MarkdownTable]:
+    """Stream the pipe tables of Markdown lines, one finished table at a time
+
+    Same fence and table rules as parse_markdown, without holding the file.
+    """
+    fence = None
+    table = None
+    for lineno, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if stripped.startswith('|'):
+            table = extend_table(table, stripped, lineno)
+            continue
+        if table is not None:
+            yield table
+            table = None
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            fence = stripped[:3]
+    if table is not None:
+        yield table
+
+
+def _json_safe(value):
+    """Normalise YAML values (dates, nested containers) to JSON-compatible types"""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _parse_frontmatter(content: str, document: VaultDocument) -> None:
+    """Fill the frontmatter fields of a document"""
+    if not content.startswith('---'):
+        return
+
+    document.has_frontmatter = True
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        document.frontmatter_error = 'Invalid YAML frontmatter format'
+        return
+
+    document.frontmatter_raw = match.group(1)
+    if not document.frontmatter_raw.strip():
+        return
+
+    try:
+        metadata = yaml.safe_load(document.frontmatter_raw)
+    except yaml.YAMLError as e:
+        document.frontmatter_error = f'Invalid YAML: {e}'
+        return
+
+    if isinstance(metadata, dict):
+        document.frontmatter = _json_safe(metadata)
+
+
+def _parse_body(content: str, document: VaultDocument) -> None:
+    """Single line pass collecting headings, tables, dataview blocks and tasks"""
+    fence = None
+    dataview_lines = None
+    table = None
+
+    for lineno, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+
+        if fence is not None:
+            if stripped.startswith(fence):
+                if dataview_lines is not None:
+                    document.dataview_blocks.append('\n'.join(dataview_lines))
+                fence = None
+                dataview_lines = None
+            elif dataview_lines is not None:
+                dataview_lines.append(line)
+            continue
+
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            table = None
+            fence = stripped[:3]
+            if stripped[3:].strip().lower() == 'dataview':
+                dataview_lines = []
+            continue
+
+        if stripped.startswith('|'):
+            if table is None:
+                table = extend_table(None, stripped, lineno)
+                document.tables.append(table)
+            else:
+                extend_table(table, stripped, lineno)
+            continue
+        table = None
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            document.headings.append((len(heading.group(1)), heading.group(2).rstrip('#').strip()))
+            continue
+
+        task = TASK_PATTERN.match(line)
+        if task:
+            document.tasks.append((task.group(1).lower() == 'x', task.group(2)))
+
+
+def parse_markdown(content: str, path: Union[str, Path] = "") -> VaultDocument:
+    """Parse Markdown content into a VaultDocument"""
+    document = VaultDocument(path=str(path))
+    _parse_frontmatter(content, document)
+    document.wikilinks = WIKILINK_PATTERN.findall(content)
+    document.standard_links = STANDARD_LINK_PATTERN.findall(content)
+    _parse_body(content, document)
+    return document
+
+
+def decode_markdown(data: bytes) -> str:
+    """Decode file bytes the way text-mode open() would (UTF-8, universal newlines)"""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def load_document(path: Union[str, Path]) -> VaultDocument:
+    """Read a Markdown file once and parse it"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return parse_markdown(decode_markdown(data), path)
+
+
+def document_to_dict(document: VaultDocument) -> Dict:
+    """Serialise a VaultDocument to JSON-compatible data"""
+    return asdict(document)
+
+
+def document_from_dict(data: Dict) -> VaultDocument:
+    """Rebuild a VaultDocument from document_to_dict() output"""
+    data = dict(data)
+    data['headings'] = [tuple(heading) for heading in data.get('headings', [])]
+    data['standard_links'] = [tuple(link) for link in data.get('standard_links', [])]
+    data['tasks'] = [tuple(task) for task in data.get('tasks', [])]
+    data['tables'] = [MarkdownTable(**table) for table in data.get('tables', [])]
+    return VaultDocument(**data)
+
+
+def _read_for_store(task: Tuple[str, Optional[Tuple[int, int]], bool]) -> Optional[Tuple]:
+    """Worker: stat a file and read it unless its cached (mtime, size) still matches
+
+    Returns (stat_key, data, sha1) with data None for an unchanged file, or
+    None when the file cannot be read.
+    """
+    path, cached_stat, want_hash = task
+    try:
+        stat = os.stat(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if cached_stat is not None and stat_key == tuple(cached_stat):
+            return stat_key, None, None
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    return stat_key, data, hashlib.sha1(data).hexdigest() if want_hash else None
+
+
+def _parse_for_store(task: Tuple[str, bytes]) -> Optional[VaultDocument]:
+    """Worker: parse raw file bytes, None if they are not valid UTF-8"""
+    path, data = task
+    try:
+        return parse_markdown(decode_markdown(data), path)
+    except UnicodeDecodeError:
+        return None
+
+
+class DocumentStore:
+    """Per-run memo of parsed documents so each file is read and parsed once
+
+    With a cache_path the parsed form of every file is also persisted between
+    runs. Entries are keyed by path and validated by (mtime, size); when the
+    stat changed but the SHA-1 of the content did not, the cached parse is
+    reused and only the stat is refreshed.
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        self.documents: Dict[str, VaultDocument] = {}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        if self.cache_path:
+            self.load_cache()
+
+    def load_cache(self) -> None:
+        """Load cache entries, discarding the cache on version mismatch or corruption"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            self.dirty = True
+            return
+
+        self.entries = data.get('entries', {})
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed during this run"""
+        if not self.cache_path or not self.dirty:
+            return
+
+        # Drop entries for files that no longer exist
+        entries = {path: entry for path, entry in self.entries.items()
+                   if path in self.documents or os.path.exists(path)}
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': entries}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    def _load_cached(self, key: str) -> VaultDocument:
+        """Return a document from the persistent cache, re-parsing only changed files"""
+        stat = os.stat(key)
+        entry = self.entries.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            return document_from_dict(entry['document'])
+
+        with open(key, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+
+        if entry and entry['sha1'] == digest:
+            self.hits += 1
+            document = document_from_dict(entry['document'])
+        else:
+            self.misses += 1
+            document = parse_markdown(decode_markdown(data), key)
+
+        self._remember(key, (stat.st_mtime_ns, stat.st_size), digest, document)
+        return document
+
+    def _remember(self, key: str, stat_key: Tuple[int, int], digest: str, document: VaultDocument) -> None:
+        """Record a freshly validated or parsed document in the persistent cache"""
+        self.entries[key] = {
+            'mtime_ns': stat_key[0],
+            'size': stat_key[1],
+            'sha1': digest,
+            'document': document_to_dict(document)
+        }
+        self.dirty = True
+
+    def prefetch(self, paths: Iterable[Union[str, Path]], executor) -> None:
+        """Load many documents at once on a CheckExecutor
+
+        Stat/read/hash runs on the executor's I/O pool and parsing of changed
+        files on its CPU pool. Files that fail to load are skipped here so the
+        following get() raises in the caller's usual error handling.
+        """
+        keys = [str(path) for path in paths]
+        keys = [key for key in dict.fromkeys(keys) if key not in self.documents]
+        if not keys:
+            return
+
+        tasks = []
+        for key in keys:
+            entry = self.entries.get(key) if self.cache_path else None
+            cached_stat = (entry['mtime_ns'], entry['size']) if entry else None
+            tasks.append((key, cached_stat, bool(self.cache_path)))
+        reads = executor.map_io(_read_for_store, tasks)
+
+        to_parse = []
+        for key, read in zip(keys, reads):
+            if read is None:
+                continue
+            stat_key, data, digest = read
+            entry = self.entries.get(key) if self.cache_path else None
+            if entry and (data is None or entry['sha1'] == digest):
+                self.hits += 1
+                self.documents[key] = document_from_dict(entry['document'])
+                if data is not None:
+                    self._remember(key, stat_key, digest, self.documents[key])
+            else:
+                to_parse.append((key, data, stat_key, digest))
+
+        parsed = executor.map_cpu(_parse_for_store, [(key, data) for key, data, _, _ in to_parse])
+        for (key, data, stat_key, digest), document in zip(to_parse, parsed):
+            if document is None:
+                continue
+            self.documents[key] = document
+            if self.cache_path:
+                self.misses += 1
+                self._remember(key, stat_key, digest, document)
+
+    def get(self, path: Union[str, Path]) -> VaultDocument:
+        """Return the parsed document for path, reading it on first access"""
+        key = str(path)
+        document = self.documents.get(key)
+        if document is None:
+            if self.cache_path:
+                document = self._load_cached(key)
+            else:
+                document = load_document(key)
+            self.documents[key] = document
+        return document